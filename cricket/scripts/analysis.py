@@ -2,6 +2,7 @@
 import pandas as pd
 import numpy as np
 from typing import Tuple
+from storage import is_parquet, read_table, resolve_path
 
 def load_data(path: str) -> pd.DataFrame:
     """
@@ -9,13 +10,14 @@ def load_data(path: str) -> pd.DataFrame:
     - low_memory=False reduces dtype guessing warnings.
     - keep default dtype inference; we will clean after loading.
     """
+    path = resolve_path(path)
     try:
-        df = pd.read_csv(path, low_memory=False)
+        df = read_table(path, low_memory=False)
     except UnicodeDecodeError:
         # Try alternative encoding if file isn't utf-8
         df = pd.read_csv(path, encoding='latin1', low_memory=False)
     except Exception as e:
-        raise RuntimeError(f"Failed to read CSV: {e}")
+        raise RuntimeError(f"Failed to read {'Parquet' if is_parquet(path) else 'CSV'}: {e}")
 
     print("✅ Loaded file:", path)
     print("Shape (rows, cols):", df.shape)
@@ -0,0 +1,111 @@
+# scripts/approximate.py
+"""
+Approximate (sampled) aggregates for exploratory dashboard use.
+
+A stratified sample of the player-match rows (by season and team) is drawn
+once and cached. Run and wicket totals are then estimated from the sample
+with stratum weights N_h / n_h and a 95% confidence interval from the usual
+stratified-sampling variance. Match counts and wins come from the small
+exact match-level table, so only the heavy row-level sums are approximated.
+The exact versions of the same views are dashboard_data.team_stats / venue_stats.
+"""
+import numpy as np
+import pandas as pd
+
+DEFAULT_FRACTION = 0.10
+MIN_PER_STRATUM = 5
+STRATA = ['season', 'team']
+Z_95 = 1.96
+
+
+def stratified_sample(df: pd.DataFrame, fraction: float = DEFAULT_FRACTION, strata: list = None,
+                      min_per_stratum: int = MIN_PER_STRATUM, seed: int = 0) -> pd.DataFrame:
+    """
+    Simple random sample without replacement inside every stratum:
+    n_h = clip(ceil(fraction * N_h), min_per_stratum, N_h).
+    Adds _stratum, _N (stratum size) and _n (stratum sample size) columns.
+    """
+    strata = strata or STRATA
+    shuffled = df.sample(frac=1.0, random_state=seed)
+    g = shuffled.groupby(strata, sort=False)
+    N = g[strata[0]].transform('size').to_numpy()
+    n = np.minimum(np.maximum(np.ceil(fraction * N), min_per_stratum), N)
+    keep = g.cumcount().to_numpy() < n
+    sample = shuffled[keep].copy()
+    sample['_stratum'] = g.ngroup().to_numpy()[keep]
+    sample['_N'] = N[keep]
+    sample['_n'] = n[keep]
+    return sample
+
+
+def estimate_totals(sample: pd.DataFrame, by: list, values: list) -> pd.DataFrame:
+    """
+    Estimated totals of `values` per group `by`, with standard errors (<value>_se).
+    Groups may cut across strata: each stratum contributes the sampled rows that fall
+    in the group, the rest of its sampled rows count as zeros.
+    """
+    strata = sample.groupby('_stratum')[['_N', '_n']].first()
+    squares = [f'{v}__sq' for v in values]
+    cells = sample.assign(**{f'{v}__sq': sample[v] ** 2 for v in values}).groupby(
+        ['_stratum'] + by)[values + squares].sum()
+
+    s = strata.reindex(cells.index.get_level_values('_stratum'))
+    N, n = s['_N'].to_numpy()[:, None], s['_n'].to_numpy()[:, None]
+    y, y2 = cells[values].to_numpy(dtype=float), cells[squares].to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s2 = np.where(n > 1, (y2 - y ** 2 / n) / (n - 1), 0.0)
+    est = pd.DataFrame(N / n * y, index=cells.index, columns=values)
+    var = pd.DataFrame(N ** 2 * (1 - n / N) * np.clip(s2, 0, None) / n, index=cells.index, columns=values)
+
+    out = est.groupby(level=by).sum()
+    se = np.sqrt(var.groupby(level=by).sum())
+    for v in values:
+        out[f'{v}_se'] = se[v]
+    return out
+
+
+class ApproximateView:
+    """Sampled versions of the dashboard's team and venue season views (with 95% CI half-widths)."""
+
+    def __init__(self, df: pd.DataFrame, fraction: float = DEFAULT_FRACTION, seed: int = 0):
+        self.fraction = fraction
+        self.sample = stratified_sample(df, fraction, seed=seed)
+        # The pipeline's combined table has match_s_id but no match_id
+        self.match_key = 'match_id' if 'match_id' in df.columns else 'match_s_id'
+        cols = [c for c in ['season', 'team', 'venue', self.match_key, 'match_won_by'] if c in df.columns]
+        self.matches = df[cols].drop_duplicates()
+
+    def _season(self, frame: pd.DataFrame, season) -> pd.DataFrame:
+        return frame[frame['season'].astype(str) == str(season)]
+
+    def team_stats(self, season) -> pd.DataFrame:
+        est = estimate_totals(self._season(self.sample, season), ['team'], ['runs', 'wickets'])
+        m = self._season(self.matches, season)
+        team = m.groupby('team')[self.match_key].nunique().rename('matches').to_frame().join(est, how='inner')
+        team['runs_total'] = team['runs'].round(0)
+        team['wickets_total'] = team['wickets'].round(0)
+        team['avg_runs'] = (team['runs'] / team['matches']).round(1)
+        team['avg_wickets'] = (team['wickets'] / team['matches']).round(1)
+        team['avg_runs_ci'] = (Z_95 * team['runs_se'] / team['matches']).round(1)
+        team['avg_wickets_ci'] = (Z_95 * team['wickets_se'] / team['matches']).round(1)
+        if 'match_won_by' in m.columns:
+            wins = (m['match_won_by'] == m['team']).groupby(m['team']).sum()
+            team['win_pct'] = (team.index.map(wins) / team['matches'] * 100).round(1)
+        else:
+            team['win_pct'] = np.nan
+        return team.reset_index()[['team', 'runs_total', 'wickets_total', 'matches', 'avg_runs', 'avg_wickets',
+                                   'win_pct', 'avg_runs_ci', 'avg_wickets_ci']]
+
+    def venue_stats(self, season) -> pd.DataFrame:
+        est = estimate_totals(self._season(self.sample, season), ['venue'], ['runs', 'wickets'])
+        m = self._season(self.matches, season)
+        venue = m.groupby('venue')[self.match_key].nunique().rename('matches').to_frame().join(est, how='inner')
+        innings = venue['matches'] * 2
+        venue['total_runs'] = venue['runs'].round(0)
+        venue['total_wickets'] = venue['wickets'].round(0)
+        venue['avg_score'] = (venue['runs'] / innings).round(1)
+        venue['avg_wickets'] = (venue['wickets'] / innings).round(1)
+        venue['avg_score_ci'] = (Z_95 * venue['runs_se'] / innings).round(1)
+        venue['avg_wickets_ci'] = (Z_95 * venue['wickets_se'] / innings).round(1)
+        return venue.reset_index()[['venue', 'total_runs', 'total_wickets', 'matches', 'avg_score', 'avg_wickets',
+                                    'avg_score_ci', 'avg_wickets_ci']]
@@ -0,0 +1,140 @@
+# scripts/bowling_spells.py
+"""
+Over-level bowling facts and spells, built from the cleaned deliveries (clean_and_save).
+
+overs:  one row per (match, innings, over) with the bowler, legal balls, runs
+        conceded (byes / leg-byes not charged), dots, boundaries, extras, wickets
+        and a maiden flag.
+spells: consecutive overs by the same bowler within an innings (bowling from one
+        end means every other over, so a gap of more than SPELL_GAP overs starts a
+        new spell), with totals, economy and dot-ball %.
+Both tables are computed with grouped pandas operations and written next to the
+other summaries; the dashboard's spell view reads the spells table.
+"""
+import os
+import numpy as np
+import pandas as pd
+from fantasy_points import ILLEGAL_BALLS, BYE_EXTRAS, NON_BOWLER_WICKETS
+from storage import read_table, write_table
+
+# Overs between two overs of the same spell: 2 = every other over from one end
+SPELL_GAP = 2
+OVER_KEY = ['match_id', 'innings', 'over']
+DELIVERY_COLS = ['match_id', 'date', 'season', 'venue', 'innings', 'batting_team', 'bowling_team',
+                 'over', 'ball', 'bowler', 'runs_batter', 'runs_extras', 'runs_total',
+                 'extra_type', 'wicket_kind', 'player_out']
+MATCH_COLS = ['date', 'season', 'venue', 'batting_team', 'bowling_team']
+TOTALS = ['balls', 'runs_conceded', 'dots', 'fours', 'sixes', 'boundaries', 'wides', 'noballs', 'wickets', 'maidens']
+
+
+def _rates(frame: pd.DataFrame) -> pd.DataFrame:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        frame['economy'] = (frame['runs_conceded'] / (frame['balls'] / 6)).round(2)
+        frame['dot_pct'] = (frame['dots'] / frame['balls'] * 100).round(1)
+    frame[['economy', 'dot_pct']] = frame[['economy', 'dot_pct']].replace([np.inf, -np.inf], np.nan)
+    return frame
+
+
+def build_over_facts(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    One row per over bowled. An over with a mid-over bowler change is credited to
+    the bowler of its first ball (rare, and it keeps the over as the unit).
+    - dots: legal balls with no runs charged to the bowler
+    - maiden: six legal balls and no runs charged to the bowler
+    """
+    df = df.sort_values(OVER_KEY + ['ball'], kind='mergesort')
+    legal = ~df['extra_type'].isin(ILLEGAL_BALLS)
+    conceded = np.where(df['extra_type'].isin(BYE_EXTRAS), df['runs_total'] - df['runs_extras'], df['runs_total'])
+    d = df.assign(
+        legal_ball=legal.astype(int),
+        conceded=conceded,
+        dot=(legal & (conceded == 0)).astype(int),
+        four=(df['runs_batter'] == 4).astype(int),
+        six=(df['runs_batter'] == 6).astype(int),
+        wide=(df['extra_type'] == 'wides').astype(int),
+        noball=(df['extra_type'] == 'noballs').astype(int),
+        wicket=(df['player_out'].notna() & ~df['wicket_kind'].isin(NON_BOWLER_WICKETS)).astype(int),
+    )
+    g = d.groupby(OVER_KEY, sort=True)
+    overs = g[[c for c in ['bowler'] + MATCH_COLS if c in d.columns]].first().join(g.agg(
+        balls=('legal_ball', 'sum'),
+        runs_conceded=('conceded', 'sum'),
+        dots=('dot', 'sum'),
+        fours=('four', 'sum'),
+        sixes=('six', 'sum'),
+        wides=('wide', 'sum'),
+        noballs=('noball', 'sum'),
+        wickets=('wicket', 'sum'),
+    ))
+    overs['boundaries'] = overs['fours'] + overs['sixes']
+    overs['maidens'] = ((overs['balls'] >= 6) & (overs['runs_conceded'] == 0)).astype(int)
+    return overs.reset_index()
+
+
+def detect_spells(overs: pd.DataFrame, gap: int = SPELL_GAP) -> pd.DataFrame:
+    """Tag each over with spell_no: 1, 2, ... per (match, innings, bowler), new spell after a gap > `gap`."""
+    overs = overs.sort_values(['match_id', 'innings', 'bowler', 'over'], kind='mergesort')
+    step = overs.groupby(['match_id', 'innings', 'bowler'], sort=False)['over'].diff()
+    new_spell = step.isna() | (step > gap)
+    overs['spell_no'] = new_spell.astype(int).groupby(
+        [overs['match_id'], overs['innings'], overs['bowler']], sort=False).cumsum()
+    return overs.sort_values(OVER_KEY, kind='mergesort').reset_index(drop=True)
+
+
+def build_spells(overs: pd.DataFrame) -> pd.DataFrame:
+    """Spell totals from the over facts (detect_spells is applied if spell_no is missing)."""
+    if 'spell_no' not in overs.columns:
+        overs = detect_spells(overs)
+    keys = ['match_id', 'innings', 'bowler', 'spell_no']
+    g = overs.groupby(keys, sort=True)
+    spells = g[[c for c in MATCH_COLS if c in overs.columns]].first()
+    spells['first_over'] = g['over'].min() + 1  # overs are 0-based in the feed
+    spells['last_over'] = g['over'].max() + 1
+    spells['overs'] = g.size()
+    spells = spells.join(g[TOTALS].sum())
+    return _rates(spells.reset_index())
+
+
+def create_bowling_spells(cleaned_csv: str, overs_csv: str, spells_csv: str) -> pd.DataFrame:
+    print("📥 Loading cleaned data...")
+    df = read_table(cleaned_csv, usecols=lambda c: c in DELIVERY_COLS, low_memory=False)
+    print("✅ Loaded:", df.shape, "rows x columns")
+
+    overs = detect_spells(build_over_facts(df))
+    spells = build_spells(overs)
+
+    os.makedirs(os.path.dirname(overs_csv), exist_ok=True)
+    saved = write_table(overs, overs_csv)
+    print(f"💾 Over facts saved at: {saved} ({len(overs)} overs)")
+    saved = write_table(spells, spells_csv)
+    print(f"💾 Bowling spells saved at: {saved} ({len(spells)} spells)")
+    return spells
+
+
+def load_spells(path: str) -> pd.DataFrame:
+    return read_table(path, dtype={'season': str})
+
+
+def spell_leaders(spells: pd.DataFrame, min_overs: int = 2) -> pd.DataFrame:
+    """Per-bowler spell profile: spells, average spell length and the best spell (most wickets, then economy)."""
+    spells = spells[spells['overs'] >= min_overs]
+    if spells.empty:
+        return pd.DataFrame(columns=['bowler', 'spells', 'avg_overs', 'wickets', 'economy', 'dot_pct', 'best_spell'])
+    best = spells.sort_values(['wickets', 'economy'], ascending=[False, True]).drop_duplicates('bowler')
+    best = best.set_index('bowler')[['wickets', 'runs_conceded', 'overs']].astype(int).astype(str)
+    best = best['wickets'] + '-' + best['runs_conceded'] + ' (' + best['overs'] + ' ov)'
+    g = spells.groupby('bowler')
+    out = g[['runs_conceded', 'balls', 'dots', 'wickets']].sum()
+    out.insert(0, 'spells', g.size())
+    out.insert(1, 'avg_overs', g['overs'].mean().round(1))
+    out = _rates(out)
+    out['best_spell'] = best
+    return out.reset_index().sort_values(['wickets', 'economy'], ascending=[False, True])[
+        ['bowler', 'spells', 'avg_overs', 'wickets', 'economy', 'dot_pct', 'best_spell']]
+
+
+if __name__ == "__main__":
+    cleaned_csv = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/cleaned_matches.csv"
+    overs_csv = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/bowling_overs.csv"
+    spells_csv = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/bowling_spells.csv"
+    create_bowling_spells(cleaned_csv, overs_csv, spells_csv)
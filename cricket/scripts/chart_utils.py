@@ -0,0 +1,169 @@
+# scripts/chart_utils.py
+"""
+Server-side data reduction for dashboard charts.
+Everything here runs before a figure is handed to Streamlit so the JSON sent
+to the browser stays small no matter how long the underlying series are.
+The dashboard's figure builders live here too, so the static report exporter
+(export_reports.py) draws exactly the same charts.
+"""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+# Max points kept per line trace after LTTB downsampling
+LINE_MAX_POINTS = 500
+# Scatters with more points than this are drawn with WebGL (scattergl)
+SCATTERGL_MIN_POINTS = 1000
+# Default rows per page for the raw data grid
+DEFAULT_PAGE_SIZE = 50
+
+
+def lttb_indices(y: np.ndarray, threshold: int, x: np.ndarray = None) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    Returns the positional indices of the points to keep (always includes first and last).
+    - x defaults to 0..n-1 (categorical axes like match_s_id are plotted in order).
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.arange(n, dtype=float) if x is None else np.asarray(x, dtype=float)
+
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    # Bucket edges for the n-2 interior points
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point for the final bucket)
+        nxt_start, nxt_end = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[nxt_start:nxt_end].mean()
+        avg_y = y[nxt_start:nxt_end].mean()
+        # Triangle areas for every candidate in the current bucket, vectorized
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) -
+                      (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+
+def downsample_lines(df: pd.DataFrame, y: str, color: str = None,
+                     max_points: int = LINE_MAX_POINTS) -> pd.DataFrame:
+    """Apply LTTB per trace (one trace per `color` value), preserving row order."""
+    if color is None:
+        return df.iloc[lttb_indices(df[y].to_numpy(), max_points)]
+    parts = []
+    for _, g in df.groupby(color, sort=False):
+        parts.append(g.iloc[lttb_indices(g[y].to_numpy(), max_points)])
+    return pd.concat(parts) if parts else df
+
+
+def line_chart(df: pd.DataFrame, x: str, y: str, color: str = None,
+               max_points: int = LINE_MAX_POINTS, **kwargs):
+    """px.line on a downsampled frame."""
+    return px.line(downsample_lines(df, y, color, max_points), x=x, y=y, color=color, **kwargs)
+
+
+def scatter_chart(df: pd.DataFrame, **kwargs):
+    """px.scatter that switches to scattergl (WebGL) once the frame is dense."""
+    render_mode = "webgl" if len(df) > SCATTERGL_MIN_POINTS else "svg"
+    return px.scatter(df, render_mode=render_mode, **kwargs)
+
+
+def paginate_frame(df: pd.DataFrame, page: int = 1, page_size: int = DEFAULT_PAGE_SIZE,
+                   sort_by: str = None, ascending: bool = True) -> pd.DataFrame:
+    """
+    Return one page of `df`, sorted server-side.
+    For numeric sort columns without missing values only the rows up to the requested
+    page are selected (nsmallest / nlargest) instead of sorting the whole frame; any
+    other column (bool, object, or with NaNs, which nsmallest would drop) is sorted
+    in full with the missing values last.
+    """
+    page = max(int(page), 1)
+    stop = page * page_size
+    start = stop - page_size
+    if sort_by is None or sort_by not in df.columns:
+        return df.iloc[start:stop]
+    key = df[sort_by]
+    if pd.api.types.is_numeric_dtype(key) and not pd.api.types.is_bool_dtype(key) and not key.hasnans:
+        head = df.nsmallest(stop, sort_by) if ascending else df.nlargest(stop, sort_by)
+    else:
+        head = df.sort_values(sort_by, ascending=ascending, kind="mergesort", na_position="last").iloc[:stop]
+    return head.iloc[start:stop]
+
+
+def page_count(n_rows: int, page_size: int = DEFAULT_PAGE_SIZE) -> int:
+    return max((n_rows + page_size - 1) // page_size, 1)
+
+
+# ------------------------
+# Dashboard figures (shared by the Streamlit app and the static report exporter)
+# ------------------------
+def top_run_scorers_fig(top_bats: pd.DataFrame):
+    return px.bar(top_bats, y="player", x="runs_total", orientation="h",
+                  text="runs_total", color="runs_total", color_continuous_scale="Reds")
+
+
+def top_wicket_takers_fig(top_bowl: pd.DataFrame):
+    return px.funnel(
+        top_bowl,
+        y="player",
+        x="wickets_total",
+        color="player",  # Use player names as categorical colors
+        title="Top Wicket Takers"
+    )
+
+
+def strike_rate_fig(sr_top: pd.DataFrame):
+    return scatter_chart(sr_top, x="innings", y="strike_rate", size="runs_total", color="runs_total",
+                         hover_name="player", title="Best Strike Rates")
+
+
+def economy_fig(econ_top: pd.DataFrame):
+    return scatter_chart(econ_top, x="innings", y="economy", size="wickets_total", color="wickets_total",
+                         hover_name="player", title="Best Economies")
+
+
+def _error_bars(df: pd.DataFrame, col: str):
+    """Symmetric error bars from an optional <col>_ci column (approximate mode)."""
+    ci = f"{col}_ci"
+    return dict(type="data", array=df[ci], visible=True) if ci in df.columns else None
+
+
+def team_performance_fig(team: pd.DataFrame):
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=team["team"], y=team["avg_runs"], name="Avg Runs",
+                         error_y=_error_bars(team, "avg_runs")))
+    fig.add_trace(go.Scatter(x=team["team"], y=team["avg_wickets"], mode="markers+lines", name="Avg Wickets",
+                             marker=dict(color="red", size=12), error_y=_error_bars(team, "avg_wickets")))
+    return fig
+
+
+def team_win_fig(team: pd.DataFrame):
+    return px.pie(team, names="team", values="win_pct", title="Team Win % Share")
+
+
+def venue_score_fig(venue: pd.DataFrame):
+    return px.bar(venue.sort_values("avg_score", ascending=False), x="venue", y="avg_score",
+                  text="avg_score", title="Avg Score by Venue",
+                  error_y="avg_score_ci" if "avg_score_ci" in venue.columns else None)
+
+
+def venue_wickets_fig(venue: pd.DataFrame):
+    return scatter_chart(venue.sort_values("avg_wickets", ascending=False), x="venue", y="avg_wickets",
+                         size="avg_wickets", color="avg_wickets", text="avg_wickets", title="Avg Wickets by Venue",
+                         error_y="avg_wickets_ci" if "avg_wickets_ci" in venue.columns else None)
+
+
+def player_trend_fig(trend_df: pd.DataFrame, y: str, title: str):
+    return line_chart(trend_df, x="match_s_id", y=y, color="player", markers=True, title=title)
+
+
+def spell_fig(spells: pd.DataFrame, title: str = "Bowling Spells: Dot % vs Economy"):
+    return scatter_chart(spells, x="dot_pct", y="economy", size="overs", color="wickets",
+                         hover_data=["bowler", "bowling_team", "first_over", "last_over", "runs_conceded"],
+                         title=title)
@@ -1,26 +1,59 @@
 import pandas as pd
 import numpy as np
 import os
-
-
-def clean_and_save(input_path: str, output_path: str) -> None:
-    """Clean cricket match dataset and export a simplified CSV."""
-
-    print("📥 Loading data...")
-    df = pd.read_csv(input_path, low_memory=False)
-    print("✅ Loaded:", df.shape, "rows x columns")
-
+from storage import read_table, write_table
+from column_store import save_column_store
+from validate_data import report_path_for, validate as validate_deliveries
+
+
+# Columns dropped from the raw feed
+DROP_COLS = [
+    'Unnamed: 0', 'review_batter', 'team_reviewed', 'review_decision',
+    'umpire', 'umpires_call', 'review_batter', 'method', 'superover_winner',
+    'result_type', 'fielders', 'new_batter', 'next_batter'
+]
+
+# Text placeholders treated as missing
+NA_PLACEHOLDERS = ['NA', 'NaN', 'Unknown', 'none', 'None', '', ' ']
+
+NUMERIC_COLS = [
+    'over', 'ball', 'ball_no', 'runs_batter', 'balls_faced',
+    'runs_extras', 'runs_total', 'runs_bowler', 'balls_per_over',
+    'team_runs', 'team_balls', 'team_wicket'
+]
+
+# Declared identity of a delivery. Extras tiebreak: a wide/no-ball re-uses the ball
+# number of the legal delivery that follows it, and consecutive extras on the same
+# ball are told apart by their position in the run (see occurrence_index).
+DELIVERY_KEY = ['match_id', 'innings', 'over', 'ball']
+KEY_TIEBREAK = ['extra_type', 'runs_extras']
+REPEATABLE_EXTRAS = ['wides', 'noballs']
+
+PREFERRED_ORDER = [
+    'match_id', 'date', 'season', 'event_name', 'match_type', 'venue', 'city',
+    'innings', 'batting_team', 'bowling_team',
+    'over', 'ball', 'ball_no',
+    'batter', 'non_striker', 'bowler',
+    'runs_batter', 'runs_extras', 'runs_total',
+    'wicket_kind', 'player_out',
+    'extra_type', 'bat_pos', 'balls_faced',
+    'team_runs', 'team_balls', 'team_wicket',
+    'player_of_match', 'match_won_by', 'win_outcome',
+    'toss_winner', 'toss_decision', 'gender', 'team_type'
+]
+
+
+def clean_deliveries(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Apply the row-level cleaning rules to a frame of raw deliveries.
+    Shared by the batch pipeline and live ingestion so both clean identically.
+    """
     # 1️⃣ Drop unwanted columns
-    drop_cols = [
-        'Unnamed: 0', 'review_batter', 'team_reviewed', 'review_decision',
-        'umpire', 'umpires_call', 'review_batter', 'method', 'superover_winner',
-        'result_type', 'fielders', 'new_batter', 'next_batter'
-    ]
-    drop_cols = [c for c in drop_cols if c in df.columns]
+    drop_cols = [c for c in DROP_COLS if c in df.columns]
     df.drop(columns=drop_cols, inplace=True)
 
     # 2️⃣ Normalize text placeholders
-    df.replace(['NA', 'NaN', 'Unknown', 'none', 'None', '', ' '], np.nan, inplace=True)
+    df.replace(NA_PLACEHOLDERS, np.nan, inplace=True)
 
     # 3️⃣ Convert date
     if 'date' in df.columns:
@@ -32,12 +65,7 @@ def clean_and_save(input_path: str, output_path: str) -> None:
         df[c] = df[c].astype(str).str.strip()
 
     # 5️⃣ Ensure numeric types
-    numeric_cols = [
-        'over', 'ball', 'ball_no', 'runs_batter', 'balls_faced',
-        'runs_extras', 'runs_total', 'runs_bowler', 'balls_per_over',
-        'team_runs', 'team_balls', 'team_wicket'
-    ]
-    for c in numeric_cols:
+    for c in NUMERIC_COLS:
         if c in df.columns:
             df[c] = pd.to_numeric(df[c], errors='coerce').fillna(0).astype(int)
 
@@ -48,41 +76,131 @@ def clean_and_save(input_path: str, output_path: str) -> None:
         df['extra_type'] = df['extra_type'].fillna('No Extra')
     if 'match_won_by' in df.columns:
         df['match_won_by'] = df['match_won_by'].replace(np.nan, 'Unknown')
+    return df
+
+
+def occurrence_index(df: pd.DataFrame, key: list) -> np.ndarray:
+    """
+    Position of each wide / no-ball within a run of consecutive rows sharing `key`
+    (0 for every other row). Two wides in a row on one ball get 0 and 1; another
+    source's copy of them, appended elsewhere in the feed, gets the same 0 and 1.
+    """
+    key_hash = pd.Series(pd.util.hash_pandas_object(df[key], index=False).to_numpy())
+    run = (key_hash != key_hash.shift()).cumsum()
+    occurrence = key_hash.groupby(run).cumcount().to_numpy()
+    return np.where(df['extra_type'].isin(REPEATABLE_EXTRAS).to_numpy(), occurrence, 0)
+
+
+def dedupe_deliveries(df: pd.DataFrame, key: list = None) -> tuple:
+    """
+    Drop repeated deliveries by their declared key using 64-bit row hashes.
+    - Rows whose key repeats an earlier row are dropped ('exact' when every other
+      column matches too, 'conflict' when the sources disagree on some columns).
+    - Rows whose key hash matches but whose key values differ are 64-bit hash
+      collisions: they are kept and reported.
+    Falls back to hashing every column when the key columns are missing.
+    Derived columns such as team_runs are not part of the key, so sources that
+    disagree on them for the same delivery are reported as conflicts.
+    Returns (deduplicated frame, report frame).
+    """
+    key = key or DELIVERY_KEY + KEY_TIEBREAK
+    if not all(c in df.columns for c in DELIVERY_KEY):
+        key = list(df.columns)
+    key = [c for c in key if c in df.columns]
+    rest = [c for c in df.columns if c not in key]
+
+    keys = df[key].reset_index(drop=True)
+    if 'extra_type' in key:
+        keys['occurrence'] = occurrence_index(df, key)
+    key_hash = pd.util.hash_pandas_object(keys, index=False).to_numpy()
+    pos = np.arange(len(df))
+    first = pd.Series(pos).groupby(key_hash).transform('min').to_numpy()
+    repeat = np.flatnonzero(first != pos)
+    kept = first[repeat]
+
+    # Confirm repeats on the actual key values (NaN == NaN), only for the flagged rows
+    a, b = keys.iloc[repeat].reset_index(drop=True), keys.iloc[kept].reset_index(drop=True)
+    same_key = ((a == b) | (a.isna() & b.isna())).all(axis=1).to_numpy()
+
+    kind = np.where(same_key, 'exact', 'hash_collision').astype(object)
+    differing = [''] * len(repeat)
+    if rest:
+        rest_hash = pd.util.hash_pandas_object(df[rest], index=False).to_numpy()
+        conflict = same_key & (rest_hash[repeat] != rest_hash[kept])
+        kind[conflict] = 'conflict'
+        for i in np.flatnonzero(conflict):
+            r, k = df[rest].iloc[repeat[i]], df[rest].iloc[kept[i]]
+            differing[i] = ';'.join(c for c in rest if not (r[c] == k[c] or (pd.isna(r[c]) and pd.isna(k[c]))))
+
+    report = keys.iloc[repeat].reset_index(drop=True)
+    report.insert(0, 'row', repeat)
+    report.insert(1, 'kept_row', kept)
+    report.insert(2, 'kind', kind)
+    report['differing_columns'] = differing
+
+    drop = repeat[same_key]
+    deduped = df.drop(index=df.index[drop])
+    return deduped, report
+
+
+def reorder_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Keep the known delivery columns in their logical order."""
+    return df[[c for c in PREFERRED_ORDER if c in df.columns]]
+
+
+def clean_and_save(input_path: str, output_path: str, report_path: str = None, store_dir: str = None,
+                   validate: bool = True) -> None:
+    """
+    Clean cricket match dataset and export a simplified CSV.
+    Duplicate deliveries found on the way are listed in `report_path`
+    (default: <output>_duplicates.csv next to the cleaned file).
+    With `store_dir`, the cleaned deliveries are also written as a memory-mapped
+    column store (column_store) for readers that slice matches without loading everything.
+    With `validate`, the saved deliveries are checked by validate_data (report: <output>_validation.json).
+    """
 
-    # 7️⃣ Optional: remove duplicate rows if any
+    print("📥 Loading data...")
+    df = read_table(input_path, low_memory=False)
+    print("✅ Loaded:", df.shape, "rows x columns")
+
+    df = clean_deliveries(df)
+
+    # 7️⃣ Remove duplicate deliveries (hashed delivery key) and report them
     before = len(df)
-    df.drop_duplicates(inplace=True)
-    print(f"🧹 Removed {before - len(df)} duplicate rows.")
+    df, report = dedupe_deliveries(df)
+    counts = report['kind'].value_counts()
+    print(f"🧹 Removed {before - len(df)} duplicate rows "
+          f"({counts.get('exact', 0)} exact, {counts.get('conflict', 0)} conflicting).")
+    if counts.get('hash_collision', 0):
+        print(f"⚠️ {counts['hash_collision']} key hash collisions kept (distinct deliveries).")
 
     # 8️⃣ Reorder columns logically
-    preferred_order = [
-        'match_id', 'date', 'season', 'event_name', 'match_type', 'venue', 'city',
-        'innings', 'batting_team', 'bowling_team',
-        'over', 'ball', 'ball_no',
-        'batter', 'non_striker', 'bowler',
-        'runs_batter', 'runs_extras', 'runs_total',
-        'wicket_kind', 'player_out',
-        'extra_type', 'bat_pos', 'balls_faced',
-        'team_runs', 'team_balls', 'team_wicket',
-        'player_of_match', 'match_won_by', 'win_outcome',
-        'toss_winner', 'toss_decision', 'gender', 'team_type'
-    ]
-    df = df[[c for c in preferred_order if c in df.columns]]
-
-    # 9️⃣ Save cleaned CSV
+    df = reorder_columns(df)
+
+    # 9️⃣ Save cleaned table (Parquet unless CRICKET_STORAGE_FORMAT=csv)
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    df.to_csv(output_path, index=False)
-    print(f"💾 Cleaned dataset saved at: {output_path}")
+    saved = write_table(df, output_path)
+    print(f"💾 Cleaned dataset saved at: {saved}")
+    report_path = report_path or os.path.splitext(output_path)[0] + '_duplicates.csv'
+    report.to_csv(report_path, index=False)
+    print(f"💾 Duplicate report saved at: {report_path}")
+    if store_dir:
+        save_column_store(df, store_dir)
     print("✅ Final shape:", df.shape)
 
-    # 10️⃣ Show a small preview
+    # 🔟 Show a small preview
     print("\n--- SAMPLE ROWS ---")
     print(df.head(5))
 
+    # Consistency checks on what was saved (validate_data)
+    if validate:
+        validate_deliveries(store_dir or saved, None, report_path_for(output_path))
+
 
 if __name__ == "__main__":
     # 🔹 Absolute paths
     input_file = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/matches.csv"
     output_file = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/cleaned_matches.csv"
+    store_dir = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/deliveries_store"
 
-    clean_and_save(input_file, output_file)
+    clean_and_save(input_file, output_file, store_dir=store_dir)
@@ -0,0 +1,166 @@
+# scripts/column_store.py
+"""
+On-disk column store for the cleaned ball-by-ball deliveries.
+
+Layout of a store directory:
+- <column>.npy          one array per column (strings are stored as int32 codes)
+- dictionaries.json     code -> value lists for the dictionary-encoded columns
+- match_ids.npy         sorted unique match ids
+- match_offsets.npy     row offsets: match i spans rows [off[i], off[i+1])
+- innings_*.npy         the same offsets one level down (match, innings)
+- meta.json             row count, column kinds and dtypes
+
+Columns are opened with np.load(mmap_mode='r'), so every process reading the
+store shares the OS page cache and slicing a match or innings copies nothing.
+clean_and_save writes the store next to the cleaned table (store_dir=...), and
+validate_data's workers each map it and read only their own matches' rows.
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from storage import NA_STRINGS, read_table
+
+STORE_VERSION = 1
+
+
+def is_column_store(path: str) -> bool:
+    return os.path.isfile(os.path.join(path, "meta.json"))
+
+
+def write_column_store(cleaned_csv: str, store_dir: str) -> None:
+    """Convert the cleaned deliveries CSV into a column store (rows grouped by match, innings)."""
+    print("📥 Loading cleaned data...")
+    df = read_table(cleaned_csv, parse_dates=['date'], low_memory=False)
+    print("✅ Loaded:", df.shape, "rows x columns")
+    save_column_store(df, store_dir)
+
+
+def save_column_store(df: pd.DataFrame, store_dir: str) -> None:
+    """Write a frame of cleaned deliveries as a column store."""
+    # Group rows by match then innings; stable sort keeps ball order inside an innings
+    df = df.sort_values(['match_id', 'innings'], kind='mergesort').reset_index(drop=True)
+
+    os.makedirs(store_dir, exist_ok=True)
+    columns, dictionaries = {}, {}
+    for c in df.columns:
+        s = df[c]
+        if pd.api.types.is_datetime64_any_dtype(s):
+            arr = s.to_numpy(dtype='datetime64[ns]').view('int64')
+            columns[c] = {'kind': 'datetime', 'dtype': 'int64'}
+        elif pd.api.types.is_numeric_dtype(s):
+            arr = s.to_numpy()
+            columns[c] = {'kind': 'numeric', 'dtype': str(arr.dtype)}
+        else:
+            # Missing text (including "nan" left by astype(str)) gets code -1, as write_table stores it as null
+            text = s.astype('string')
+            codes, uniques = pd.factorize(text.mask(text.isin(NA_STRINGS)), sort=True)
+            arr = codes.astype(np.int32)
+            dictionaries[c] = [str(u) for u in uniques]
+            columns[c] = {'kind': 'dict', 'dtype': 'int32'}
+        np.save(os.path.join(store_dir, f"{c}.npy"), arr)
+
+    # Match-level and innings-level offsets
+    match_key = df['match_id'].to_numpy()
+    if match_key.dtype == object:
+        match_key = match_key.astype(str)  # fixed-width unicode, loadable without pickle
+    starts = np.flatnonzero(np.r_[True, match_key[1:] != match_key[:-1]])
+    np.save(os.path.join(store_dir, "match_ids.npy"), match_key[starts])
+    np.save(os.path.join(store_dir, "match_offsets.npy"), np.r_[starts, len(df)].astype(np.int64))
+
+    innings = df['innings'].to_numpy()
+    inn_starts = np.flatnonzero(np.r_[True, (match_key[1:] != match_key[:-1]) | (innings[1:] != innings[:-1])])
+    np.save(os.path.join(store_dir, "innings_match_ids.npy"), match_key[inn_starts])
+    np.save(os.path.join(store_dir, "innings_numbers.npy"), innings[inn_starts])
+    np.save(os.path.join(store_dir, "innings_offsets.npy"), np.r_[inn_starts, len(df)].astype(np.int64))
+
+    with open(os.path.join(store_dir, "dictionaries.json"), 'w', encoding='utf-8') as f:
+        json.dump(dictionaries, f)
+    with open(os.path.join(store_dir, "meta.json"), 'w', encoding='utf-8') as f:
+        json.dump({'version': STORE_VERSION, 'n_rows': len(df), 'n_matches': len(starts),
+                   'columns': columns}, f, indent=2)
+    print(f"💾 Column store saved at: {store_dir} ({len(columns)} columns, {len(starts)} matches)")
+
+
+class ColumnStore:
+    """Read-only, memory-mapped view over a store written by write_column_store."""
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        with open(os.path.join(store_dir, "meta.json"), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        with open(os.path.join(store_dir, "dictionaries.json"), encoding='utf-8') as f:
+            self.dictionaries = {c: np.array(v, dtype=object) for c, v in json.load(f).items()}
+        self.n_rows = self.meta['n_rows']
+        self.match_ids = self._load("match_ids")
+        self.match_offsets = self._load("match_offsets")
+        self.innings_match_ids = self._load("innings_match_ids")
+        self.innings_numbers = self._load("innings_numbers")
+        self.innings_offsets = self._load("innings_offsets")
+        self._columns = {}
+
+    def _load(self, name: str) -> np.ndarray:
+        return np.load(os.path.join(self.store_dir, f"{name}.npy"), mmap_mode='r', allow_pickle=False)
+
+    @property
+    def columns(self) -> list:
+        return list(self.meta['columns'])
+
+    def column(self, name: str) -> np.ndarray:
+        """Raw memory-mapped array (codes for dictionary-encoded columns)."""
+        if name not in self._columns:
+            if name not in self.meta['columns']:
+                raise KeyError(f"Column '{name}' not in store {self.store_dir}")
+            self._columns[name] = self._load(name)
+        return self._columns[name]
+
+    def match_rows(self, match_id) -> slice:
+        """Row slice of one match (zero-copy when used on column())."""
+        i = int(np.searchsorted(self.match_ids, match_id))
+        if i >= len(self.match_ids) or self.match_ids[i] != match_id:
+            raise KeyError(f"Match {match_id} not in store")
+        return slice(int(self.match_offsets[i]), int(self.match_offsets[i + 1]))
+
+    def innings_rows(self, match_id, innings: int) -> slice:
+        """Row slice of one innings of one match."""
+        m = self.match_rows(match_id)
+        lo = int(np.searchsorted(self.innings_offsets, m.start))
+        hi = int(np.searchsorted(self.innings_offsets, m.stop))
+        hits = np.flatnonzero(np.asarray(self.innings_numbers[lo:hi]) == innings)
+        if len(hits) == 0:
+            raise KeyError(f"Innings {innings} of match {match_id} not in store")
+        j = lo + int(hits[0])
+        return slice(int(self.innings_offsets[j]), int(self.innings_offsets[j + 1]))
+
+    def values(self, name: str, rows: slice = slice(None)) -> np.ndarray:
+        """Decoded values of a column for a row slice (strings / datetimes materialized)."""
+        arr = self.column(name)[rows]
+        kind = self.meta['columns'][name]['kind']
+        if kind == 'dict':
+            out = np.full(len(arr), np.nan, dtype=object)
+            valid = arr >= 0
+            out[valid] = self.dictionaries[name][arr[valid]]
+            return out
+        if kind == 'datetime':
+            return np.asarray(arr).view('datetime64[ns]')
+        return arr
+
+    def frame(self, rows: slice = slice(None), columns: list = None) -> pd.DataFrame:
+        """Materialize a DataFrame for a row slice (only the requested columns are read)."""
+        columns = columns or self.columns
+        return pd.DataFrame({c: self.values(c, rows) for c in columns})
+
+    def match_frame(self, match_id, columns: list = None) -> pd.DataFrame:
+        return self.frame(self.match_rows(match_id), columns)
+
+    def partition_rows(self, n_parts: int) -> list:
+        """Split the store into up to n_parts contiguous row slices, never splitting a match."""
+        bounds = np.array_split(np.arange(len(self.match_ids)), max(n_parts, 1))
+        return [slice(int(self.match_offsets[b[0]]), int(self.match_offsets[b[-1] + 1])) for b in bounds if len(b)]
+
+
+if __name__ == "__main__":
+    cleaned_csv = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/cleaned_matches.csv"
+    store_dir = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/deliveries_store"
+    write_column_store(cleaned_csv, store_dir)
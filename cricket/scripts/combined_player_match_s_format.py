@@ -1,22 +1,15 @@
 import pandas as pd
 import os
+from concurrent.futures import ProcessPoolExecutor
+from storage import read_table, write_table
 
-def create_combined_player_match_summary(cleaned_csv: str, match_csv: str, output_csv: str):
-    print("📥 Loading cleaned data...")
-    df = pd.read_csv(cleaned_csv, parse_dates=['date'], low_memory=False)
-    match_info = pd.read_csv(match_csv)
-    print(f"✅ Loaded cleaned matches: {df.shape}, match info: {match_info.shape}")
 
-    # --- Create season-wise match number ---
-    match_info['season_number'] = match_info['season'].rank(method='dense').astype(int)
-    match_info['match_number_in_season'] = match_info.groupby('season')['match_id'].rank(method='first').astype(int)
-    match_info['match_s_id'] = match_info.apply(
-        lambda x: f"S{x['season_number']}_M{x['match_number_in_season']}", axis=1
-    )
-
-    # Merge S#_M# into main data
-    df = pd.merge(df, match_info[['match_id','match_s_id']], on='match_id', how='left')
-    df.drop(columns=['match_id'], inplace=True)  # remove original match_id
+def player_match_aggregates(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Batting, bowling and wicket aggregates per player per match.
+    Rows never span matches, so this can run on any partition of whole matches.
+    """
+    df = df.copy()
 
     # --- Batting summary per player per match ---
     df['balls_faced'] = 1
@@ -42,6 +35,46 @@ def create_combined_player_match_summary(cleaned_csv: str, match_csv: str, outpu
     # Merge batting & bowling stats
     player_summary = pd.merge(batting_summary, bowling_summary, on=['match_s_id','player','team'], how='outer')
     player_summary.fillna(0, inplace=True)
+    return player_summary
+
+
+def partition_deliveries(df: pd.DataFrame, partition_by: str = 'match', n_parts: int = 2) -> list:
+    """Split deliveries into n_parts frames of whole matches ('match') or whole seasons ('season')."""
+    key = {'match': 'match_s_id', 'season': 'season'}[partition_by]
+    codes, _ = pd.factorize(df[key])
+    labels = codes % n_parts
+    return [df[labels == p] for p in range(n_parts) if (labels == p).any()]
+
+
+def create_combined_player_match_summary(cleaned_csv: str, match_csv: str, output_csv: str,
+                                         workers: int = 1, partition_by: str = 'match'):
+    print("📥 Loading cleaned data...")
+    df = read_table(cleaned_csv, parse_dates=['date'], low_memory=False)
+    match_info = read_table(match_csv)
+    print(f"✅ Loaded cleaned matches: {df.shape}, match info: {match_info.shape}")
+
+    # --- Create season-wise match number ---
+    match_info['season_number'] = match_info['season'].rank(method='dense').astype(int)
+    match_info['match_number_in_season'] = match_info.groupby('season')['match_id'].rank(method='first').astype(int)
+    match_info['match_s_id'] = match_info.apply(
+        lambda x: f"S{x['season_number']}_M{x['match_number_in_season']}", axis=1
+    )
+
+    # Merge S#_M# into main data
+    df = pd.merge(df, match_info[['match_id','match_s_id']], on='match_id', how='left')
+    df.drop(columns=['match_id'], inplace=True)  # remove original match_id
+
+    # --- Player-match aggregates (optionally map-reduced over partitions) ---
+    if workers and workers > 1:
+        parts = partition_deliveries(df, partition_by, workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = list(pool.map(player_match_aggregates, parts))
+        # Outer merges return rows sorted by key, so sorting the union reproduces the single-pass order
+        player_summary = pd.concat(partials, ignore_index=True)
+        player_summary = player_summary.sort_values(['match_s_id','player','team']).reset_index(drop=True)
+        print(f"⚙️ Aggregated {len(parts)} partitions by {partition_by} on {workers} workers")
+    else:
+        player_summary = player_match_aggregates(df)
 
     # --- Derived metrics ---
     player_summary['strike_rate'] = player_summary.apply(
@@ -61,10 +94,10 @@ def create_combined_player_match_summary(cleaned_csv: str, match_csv: str, outpu
     combined_df = pd.merge(player_summary, match_info.drop(columns=['season_number','match_number_in_season','match_id']),
                            on='match_s_id', how='left')
 
-    # Save final CSV
+    # Save final table
     os.makedirs(os.path.dirname(output_csv), exist_ok=True)
-    combined_df.to_csv(output_csv, index=False)
-    print(f"💾 Combined player-match dataset saved at: {output_csv}")
+    saved = write_table(combined_df, output_csv)
+    print(f"💾 Combined player-match dataset saved at: {saved}")
     print("✅ Sample preview:")
     print(combined_df.head(15))
 
@@ -74,4 +107,4 @@ if __name__ == "__main__":
     match_csv = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/match_summary.csv"
     output_csv = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/combined_player_match_s_format.csv"
 
-    create_combined_player_match_summary(cleaned_csv, match_csv, output_csv)
+    create_combined_player_match_summary(cleaned_csv, match_csv, output_csv, workers=os.cpu_count())
@@ -1,9 +1,11 @@
 import pandas as pd
 import os
+from storage import read_table, write_table
+from validate_data import report_path_for, validate as validate_summary
 
-def create_match_summary(cleaned_csv: str, output_csv: str):
+def create_match_summary(cleaned_csv: str, output_csv: str, validate: bool = True):
     print("📥 Loading cleaned data...")
-    df = pd.read_csv(cleaned_csv, parse_dates=['date'], low_memory=False)
+    df = read_table(cleaned_csv, parse_dates=['date'], low_memory=False)
     print("✅ Loaded:", df.shape, "rows x columns")
 
     # Clean and normalize season
@@ -29,6 +31,8 @@ def create_match_summary(cleaned_csv: str, output_csv: str):
         player_of_match = row['player_of_match']
         match_won_by = row['match_won_by']
         win_outcome = row.get('win_outcome', 'Unknown')
+        toss_winner = row.get('toss_winner', 'Unknown')
+        toss_decision = row.get('toss_decision', 'Unknown')
 
         # Teams
         teams = group['batting_team'].unique()
@@ -62,6 +66,7 @@ def create_match_summary(cleaned_csv: str, output_csv: str):
                 wickets_team2 = r['player_out']
 
         match_summaries.append({
+            'match_id': match_id,  # kept for joins: dates repeat on double-headers
             'date': date,
             'season': season,
             'venue': venue,
@@ -79,6 +84,8 @@ def create_match_summary(cleaned_csv: str, output_csv: str):
             'player_of_match': player_of_match,
             'match_won_by': match_won_by,
             'win_outcome': win_outcome,
+            'toss_winner': toss_winner,
+            'toss_decision': toss_decision,
             'season_start_year': row['season_start_year']
         })
 
@@ -98,20 +105,20 @@ def create_match_summary(cleaned_csv: str, output_csv: str):
         lambda x: f"S{x['season_no']}_{x['season_match_no']:02d}", axis=1
     )
 
-    # Remove match_id column
-    if 'match_id' in summary_df.columns:
-        summary_df = summary_df.drop(columns=['match_id'])
-
     # Reorder columns
     cols = ['match_code'] + [c for c in summary_df.columns if c != 'match_code']
     summary_df = summary_df[cols]
 
-    # Save CSV
+    # Save table
     os.makedirs(os.path.dirname(output_csv), exist_ok=True)
-    summary_df.to_csv(output_csv, index=False)
-    print(f"💾 Match summary saved at: {output_csv}")
+    saved = write_table(summary_df, output_csv)
+    print(f"💾 Match summary saved at: {saved}")
     print("✅ Total matches summarized:", len(summary_df))
 
+    # Summary totals vs. the deliveries they came from (validate_data)
+    if validate:
+        validate_summary(cleaned_csv, saved, report_path_for(output_csv))
+
     # Sample preview
     print("\n--- SAMPLE ---")
     print(summary_df[['season','season_no','season_match_no','match_code',
@@ -4,86 +4,119 @@ Run: streamlit run app_streamlit.py
 """
 
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
+import json
 import os
+from render_timing import RenderTimer, read_log, summarize
+from storage import resolve_path
 
 st.set_page_config(layout="wide", page_title="Cricket Analytics Dashboard", initial_sidebar_state="expanded")
 
-# ------------------------
-# Helper Functions
-# ------------------------
-def infer_and_rename_cols(df):
-    aliases = {
-        "player": ["player", "batter", "batsman", "player_name"],
-        "team": ["team", "team_name", "batting_team", "bat_team"],
-        "match_s_id": ["match_s_id", "match_s", "s_match_id"],
-        "match_id": ["match_id", "match"],
-        "season": ["season", "Season", "year", "season_year"],
-        "runs": ["runs", "runs_batter", "batter_runs", "player_runs"],
-        "balls": ["balls", "balls_faced", "batter_balls"],
-        "wickets": ["wickets", "bowler_wicket", "bowler_wickets"],
-        "balls_bowled": ["balls_bowled", "balls_bowled_by", "bowler_balls"],
-        "runs_conceded": ["runs_conceded", "runs_bowler", "conceded"],
-        "match_won_by": ["match_won_by", "winner", "match_winner"],
-        "venue": ["venue", "ground", "stadium"],
-        "city": ["city"],
-    }
-    rename_map = {}
-    cols_lower = {c.lower(): c for c in df.columns}
-    for target, possibles in aliases.items():
-        for name in possibles:
-            if name.lower() in cols_lower:
-                rename_map[cols_lower[name.lower()]] = target
-                break
-    df = df.rename(columns=rename_map)
-    return df
+# Per-rerun section timings (see render_timing.py); every chart goes through plotly_chart
+timer = RenderTimer()
+plotly_chart = timer.wrap(st.plotly_chart)
+timer.mark("shell")
 
-@st.cache_data
-def load_csv(path):
-    return pd.read_csv(path, low_memory=False)
-
-def load_data_prefer_path(default_path="data/combined_player_match_s_format.csv"):
-    if os.path.exists(default_path):
-        try:
-            return load_csv(default_path)
-        except Exception:
-            return None
-    return None
+# .csv or .parquet, whichever the pipeline wrote last
+DATA_PATH = resolve_path("data/combined_player_match_s_format.csv")
+SEASON_INDEX = "data/season_index.json"
+LIVE_SNAPSHOT = "data/live_snapshot.json"
+LIVE_POLL_SECONDS = 5
+VENUE_CONDITIONS = resolve_path("data/venue_conditions.csv")
+HEAD_TO_HEAD = "data/head_to_head.npz"
+BOWLING_SPELLS = resolve_path("data/bowling_spells.csv")
 
 # ------------------------
-# Title & Data Load
+# Light shell: title + sidebar from the precomputed season index
+# (pandas / plotly are only imported once the shell is on screen)
 # ------------------------
+def read_season_index(index_path=SEASON_INDEX, source_path=DATA_PATH):
+    """Season list written by dashboard_data.warm_up, if it still matches the data file."""
+    try:
+        with open(index_path, encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("source_mtime") == os.path.getmtime(source_path):
+            return index["seasons"]
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
 st.title("🏏 IPL Advanced Analytics Dashboard")
 
-df_raw = load_data_prefer_path()
-if df_raw is None:
+if not os.path.exists(DATA_PATH):
     st.error("❌ Data file missing. Place it in /data/ and name it correctly.")
     st.stop()
 
-df = infer_and_rename_cols(df_raw.copy())
+seasons = read_season_index()
+
+@st.cache_resource(show_spinner="Loading match data...")
+def get_data(path=DATA_PATH):
+    # Imported here so the fallback below is the only path that loads pandas before the sidebar
+    from dashboard_data import load_prepared, build_season_index
+    df = load_prepared(path)
+    if df is not None and read_season_index(source_path=path) is None:
+        build_season_index(df, path, SEASON_INDEX)
+    return df
 
-# Basic cleaning
-for c in df.select_dtypes("object").columns:
-    df[c] = df[c].astype(str)
-for c in ["runs", "balls", "balls_bowled", "wickets", "runs_conceded"]:
-    if c in df.columns:
-        df[c] = pd.to_numeric(df[c], errors="coerce").fillna(0)
-if "season" not in df.columns and "match_s_id" in df.columns:
-    df["season"] = df["match_s_id"].astype(str).str[:4]
+if seasons is None:
+    # No (fresh) season index yet: fall back to loading the data (and pandas) before the sidebar
+    df = get_data()
+    if df is None:
+        st.error("❌ Data file missing. Place it in /data/ and name it correctly.")
+        st.stop()
+    seasons = read_season_index() or sorted(df["season"].dropna().unique().astype(str))
 
 # ------------------------
 # Sidebar Filters
 # ------------------------
-seasons = sorted(df["season"].dropna().unique().astype(str))
 selected_season = st.sidebar.selectbox("Select Season", seasons, index=len(seasons)-1)
 min_balls = st.sidebar.number_input("Min balls faced / bowled", 0, 200, 100, 10)
 min_innings = st.sidebar.number_input("Min innings", 1, 20, 7, 1)
 top_n = st.sidebar.slider("Top N", 3, 30, 10)
 show_raw = st.sidebar.checkbox("Show raw data")
+show_live = st.sidebar.checkbox("Live match feed")
+show_timings = st.sidebar.checkbox("Render timings (debug)")
+approx_mode = st.sidebar.checkbox("Approximate mode (sampled)")
+approx_pct = st.sidebar.slider("Sample %", 1, 50, 10, disabled=not approx_mode)
+
+# ------------------------
+# Heavy modules & data (shared across sessions once loaded)
+# ------------------------
+timer.mark("imports")
+import pandas as pd
+import plotly.express as px
+from chart_utils import (paginate_frame, page_count, DEFAULT_PAGE_SIZE, top_run_scorers_fig,
+                         top_wicket_takers_fig, strike_rate_fig, economy_fig, team_performance_fig,
+                         team_win_fig, venue_score_fig, venue_wickets_fig, player_trend_fig, spell_fig)
+from dashboard_data import team_stats, venue_stats, player_trends
+from live_ingest import load_snapshot
+from leaderboard import LeaderboardEngine
+from venue_conditions import load_venue_conditions, ALL_SEASONS
+from head_to_head import HeadToHead
+from player_similarity import SimilarityIndex
+from approximate import ApproximateView
+from bowling_spells import load_spells, spell_leaders
+
+timer.mark("data load")
+df = get_data()
+if df is None:
+    st.error("❌ Data file missing. Place it in /data/ and name it correctly.")
+    st.stop()
+
+timer.mark("leaderboard index")
+@st.cache_resource(show_spinner="Indexing leaderboards...")
+def get_leaderboards(path=DATA_PATH):
+    return LeaderboardEngine(get_data(path))
+
+leaderboards = get_leaderboards()
 
+# Optional leaderboard filters (the rest of the page stays season-wide)
+st.sidebar.markdown("**Leaderboard filters**")
+board_team = st.sidebar.selectbox("Team", ["All"] + list(leaderboards.teams))
+board_venue = st.sidebar.selectbox("Venue", ["All"] + list(leaderboards.venues))
+board_team = None if board_team == "All" else board_team
+board_venue = None if board_venue == "All" else board_venue
+
+timer.mark("season filter")
 season_df = df[df["season"].astype(str) == str(selected_season)].copy()
 if season_df.empty:
     st.warning("No data for this season")
@@ -92,133 +125,269 @@ if season_df.empty:
 # ------------------------
 # Player Aggregations
 # ------------------------
-bats = season_df.groupby("player").agg(
-    runs_total=("runs", "sum"),
-    balls_total=("balls", "sum"),
-    innings=("match_s_id", "nunique")
-).reset_index()
-bats["avg_score"] = (bats["runs_total"]/bats["innings"]).round(2)
-bats["strike_rate"] = (bats["runs_total"]/bats["balls_total"]*100).round(2)
-bats_eligible = bats[(bats["balls_total"] >= min_balls) & (bats["innings"] >= min_innings)]
-
-bowl = season_df.groupby("player").agg(
-    wickets_total=("wickets", "sum"),
-    balls_bowled_total=("balls_bowled", "sum"),
-    runs_conceded_total=("runs_conceded", "sum"),
-    innings=("match_s_id","nunique")
-).reset_index()
-bowl["economy"] = (bowl["runs_conceded_total"]/(bowl["balls_bowled_total"]/6)).round(2)
-bowl_eligible = bowl[(bowl["balls_bowled_total"] >= min_balls) & (bowl["innings"] >= min_innings)]
-
-top_bats = bats_eligible.sort_values("runs_total", ascending=False).head(top_n)
-top_bowl = bowl_eligible.sort_values("wickets_total", ascending=False).head(top_n)
+timer.mark("player aggregations")
+# Leaderboards come from the top-k engine (pre-aggregated arrays + partial selection)
+board = dict(seasons=[selected_season], team=board_team, venue=board_venue,
+             min_balls=min_balls, min_innings=min_innings)
+top_bats = leaderboards.top("runs", top_n, **board)
+top_bowl = leaderboards.top("wickets", top_n, **board)
 
 # ------------------------
-# Team Stats
+# Team & Venue Stats
 # ------------------------
-team = season_df.groupby("team").agg(
-    runs_total=("runs", "sum"),
-    wickets_total=("wickets", "sum"),
-    matches=("match_id", "nunique")
-).reset_index()
-team["avg_runs"] = (team["runs_total"]/team["matches"]).round(1)
-team["avg_wickets"] = (team["wickets_total"]/team["matches"]).round(1)
-if "match_won_by" in season_df.columns:
-    wins = season_df[["match_id", "team", "match_won_by"]].drop_duplicates()
-    win_count = wins.groupby("team").apply(lambda g: (g["match_won_by"] == g["team"]).sum()).reset_index(name="wins")
-    team = team.merge(win_count, on="team", how="left")
-    team["win_pct"] = (team["wins"]/team["matches"]*100).round(1)
-else:
-    team["win_pct"] = np.nan
+# Approximate mode: estimates (with 95% CIs) from a cached stratified sample by season & team,
+# upgraded to the exact aggregates when the analyst asks for them
+@st.cache_resource(show_spinner="Drawing stratified sample...")
+def get_approximate(fraction, path=DATA_PATH):
+    return ApproximateView(get_data(path), fraction)
 
-# ------------------------
-# Venue Stats
-# ------------------------
-venue = season_df.groupby("venue").agg(
-    total_runs=("runs", "sum"),
-    total_wickets=("wickets", "sum"),
-    matches=("match_id","nunique")
-).reset_index()
-venue["avg_score"] = (venue["total_runs"]/venue["matches"]/2).round(1)
-venue["avg_wickets"] = (venue["total_wickets"]/venue["matches"]/2).round(1)
+# The exact upgrade sticks across reruns for this season and sample %; changing either
+# (or leaving approximate mode) goes back to the estimates
+approx_view = (str(selected_season), approx_pct)
+if not approx_mode:
+    st.session_state.pop("exact_view", None)
+elif st.session_state.get("exact_view") != approx_view and st.button("Compute exact results"):
+    st.session_state["exact_view"] = approx_view
+use_sample = approx_mode and st.session_state.get("exact_view") != approx_view
+if use_sample:
+    approx = get_approximate(approx_pct / 100)
+timer.mark("team stats")
+team = approx.team_stats(selected_season) if use_sample else team_stats(season_df)
+timer.mark("venue stats")
+venue = approx.venue_stats(selected_season) if use_sample else venue_stats(season_df)
 
 # ------------------------
 # Charts Section
 # ------------------------
+timer.mark("player charts")
 st.markdown(f"### 📅 Season {selected_season} Overview")
+if use_sample:
+    st.caption(f"≈ Team and venue views are estimates from a {approx_pct}% stratified sample (season × team); "
+               "error bars are 95% confidence intervals. Use **Compute exact results** for exact figures.")
+elif approx_mode:
+    st.caption("✅ Exact results for this view.")
 
 # Player Stats
 c1, c2 = st.columns(2)
 with c1:
     st.markdown("#### 🏆 Top Run Scorers (Horizontal Bar)")
-    fig = px.bar(top_bats, y="player", x="runs_total", orientation="h",
-                 text="runs_total", color="runs_total", color_continuous_scale="Reds")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = top_run_scorers_fig(top_bats)
+    plotly_chart(fig, use_container_width=True)
 
 
     st.markdown("#### 🎯 Top Wicket Takers (Funnel Chart)")
-fig = px.funnel(
-    top_bowl,
-    y="player",
-    x="wickets_total",
-    color="player",  # Use player names as categorical colors
-    title="Top Wicket Takers"
-)
-st.plotly_chart(fig, use_container_width=True)
+fig = top_wicket_takers_fig(top_bowl)
+plotly_chart(fig, use_container_width=True)
 
 # Strike Rate & Economy (Independent)
 st.markdown("#### ⚡ Strike Rate & Economy (Min 100 balls, Min 7 innings)")
-sr_top = bats_eligible.sort_values("strike_rate", ascending=False).head(top_n)
-econ_top = bowl_eligible.sort_values("economy").head(top_n)
+sr_top = leaderboards.top("strike_rate", top_n, **board)
+econ_top = leaderboards.top("economy", top_n, **board)
 
 col_sr, col_econ = st.columns(2)
 with col_sr:
-    fig = px.scatter(sr_top, x="innings", y="strike_rate", size="runs_total", color="runs_total",
-                     hover_name="player", title="Best Strike Rates")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = strike_rate_fig(sr_top)
+    plotly_chart(fig, use_container_width=True)
 with col_econ:
-    fig = px.scatter(econ_top, x="innings", y="economy", size="wickets_total", color="wickets_total",
-                     hover_name="player", title="Best Economies")
-    st.plotly_chart(fig, use_container_width=True)
+    fig = economy_fig(econ_top)
+    plotly_chart(fig, use_container_width=True)
 
 # Team Performance
+timer.mark("team charts")
 st.markdown("#### 🏟️ Team Performance Overview")
-team_fig = go.Figure()
-team_fig.add_trace(go.Bar(x=team["team"], y=team["avg_runs"], name="Avg Runs"))
-team_fig.add_trace(go.Scatter(x=team["team"], y=team["avg_wickets"], mode="markers+lines", name="Avg Wickets", marker=dict(color="red", size=12)))
-st.plotly_chart(team_fig, use_container_width=True)
+team_fig = team_performance_fig(team)
+plotly_chart(team_fig, use_container_width=True)
 
 # Team Win %
 st.markdown("#### 🏆 Team Win % (Pie Chart)")
-win_fig = px.pie(team, names="team", values="win_pct", title="Team Win % Share")
-st.plotly_chart(win_fig, use_container_width=True)
+win_fig = team_win_fig(team)
+plotly_chart(win_fig, use_container_width=True)
 
 # Venue Performance
+timer.mark("venue charts")
 st.markdown("#### 🏠 Venue Performance")
-venue_fig = px.bar(venue.sort_values("avg_score", ascending=False), x="venue", y="avg_score",
-                   text="avg_score", title="Avg Score by Venue")
-st.plotly_chart(venue_fig, use_container_width=True)
+venue_fig = venue_score_fig(venue)
+plotly_chart(venue_fig, use_container_width=True)
+
+venue_fig2 = venue_wickets_fig(venue)
+plotly_chart(venue_fig2, use_container_width=True)
 
-venue_fig2 = px.scatter(venue.sort_values("avg_wickets", ascending=False), x="venue", y="avg_wickets",
-                        size="avg_wickets", color="avg_wickets", text="avg_wickets", title="Avg Wickets by Venue")
-st.plotly_chart(venue_fig2, use_container_width=True)
+# Venue Conditions (precomputed by venue_conditions.py, one lookup per venue/season)
+@st.cache_data
+def get_venue_conditions(path=VENUE_CONDITIONS):
+    return load_venue_conditions(path) if os.path.exists(path) else None
+
+timer.mark("venue conditions")
+st.markdown("#### 🪙 Venue Conditions")
+conditions = get_venue_conditions()
+season_key = str(selected_season)
+if conditions is None or season_key not in conditions.index.get_level_values("season"):
+    st.info("No venue conditions for this season. Run `python venue_conditions.py` after the match summary.")
+else:
+    cond_venues = conditions.xs(season_key, level="season").index.tolist()
+    cond_venue = st.selectbox("Conditions at venue", cond_venues, key="conditions_venue")
+    cond = conditions.loc[(cond_venue, season_key)]
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Par 1st innings", f"{cond['par_first_innings']:.0f}",
+              f"{cond['first_innings_trend']:+.1f} vs last season" if pd.notna(cond["first_innings_trend"]) else None)
+    m1.caption(f"Band {cond['first_innings_p25']:.0f}–{cond['first_innings_p75']:.0f}")
+    # A venue with no bat-first / chase / toss decisions of a kind has NaN for that %
+    pct = lambda v: "–" if pd.isna(v) else f"{v:.1f}"
+    m2.metric("Bat first win %", pct(cond['bat_first_win_pct']))
+    m3.metric("Chasing win %", pct(cond['chase_win_pct']))
+    m4.metric("Toss winner win %", pct(cond['toss_winner_win_pct']))
+    st.caption(f"Chose to bat: {pct(cond['toss_bat_win_pct'])} % won · chose to field: {pct(cond['toss_field_win_pct'])} % won "
+               f"· {int(cond['matches'])} matches")
+    venue_trend = conditions.loc[cond_venue].drop(index=ALL_SEASONS, errors="ignore").reset_index()
+    trend_fig = px.line(venue_trend, x="season", y=["par_first_innings", "first_innings_p25", "first_innings_p75"],
+                        markers=True, title=f"Par First-Innings Score by Season – {cond_venue}")
+    plotly_chart(trend_fig, use_container_width=True)
+
+# Head to Head (precomputed team x team matrices, one array lookup per selection)
+@st.cache_resource
+def get_head_to_head(path=HEAD_TO_HEAD):
+    return HeadToHead.load(path) if os.path.exists(path) else None
+
+timer.mark("head to head")
+st.markdown("#### 🤝 Head to Head")
+h2h = get_head_to_head()
+if h2h is None or len(h2h.teams) < 2:
+    st.info("No head-to-head matrix yet. Run `python head_to_head.py` after the match summary.")
+else:
+    h1, h2, h3, h4 = st.columns(4)
+    team_a = h1.selectbox("Team", h2h.teams, key="h2h_team_a")
+    team_b = h2.selectbox("Opponent", [t for t in h2h.teams if t != team_a], key="h2h_team_b")
+    h2h_season = h3.selectbox("Season", ["All", str(selected_season)], key="h2h_season")
+    h2h_venue = h4.selectbox("Venue", ["All"] + h2h.venues, key="h2h_venue")
+    scope = dict(season=None if h2h_season == "All" else h2h_season,
+                 venue=None if h2h_venue == "All" else h2h_venue)
+    rec = h2h.record(team_a, team_b, **scope)
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Matches", rec["matches"])
+    m2.metric(f"{team_a} wins", rec["wins_a"])
+    m3.metric(f"{team_b} wins", rec["wins_b"])
+    m4.metric("No result / tie", rec["no_result"])
+    fmt = lambda v, unit: f"{v} {unit}" if v is not None else "–"
+    st.caption(f"Avg winning margin – {team_a}: {fmt(rec['avg_run_margin_a'], 'runs')} / "
+               f"{fmt(rec['avg_wicket_margin_a'], 'wkts')} · {team_b}: {fmt(rec['avg_run_margin_b'], 'runs')} / "
+               f"{fmt(rec['avg_wicket_margin_b'], 'wkts')}")
+    win_matrix = h2h.matrix("wins", **scope)
+    played = h2h.matrix("matches", **scope)
+    active = played.index[played.sum(axis=1) > 0]
+    h2h_fig = px.imshow(win_matrix.loc[active, active], text_auto=True, color_continuous_scale="Blues",
+                        labels=dict(x="Opponent", y="Team", color="Wins"), title="Wins (row team vs column team)")
+    plotly_chart(h2h_fig, use_container_width=True)
+
+# Bowling Spells (precomputed by bowling_spells.py from the deliveries)
+@st.cache_data
+def get_spells(path=BOWLING_SPELLS):
+    return load_spells(path) if os.path.exists(path) else None
+
+timer.mark("bowling spells")
+st.markdown("#### 🎯 Bowling Spells")
+spells = get_spells()
+season_spells = None if spells is None else spells[spells["season"] == str(selected_season)]
+if season_spells is None or season_spells.empty:
+    st.info("No bowling spells for this season. Run `python bowling_spells.py` after clean_and_save.")
+else:
+    b1, b2 = st.columns([3, 1])
+    spell_team = b1.selectbox("Bowling team", ["All"] + sorted(season_spells["bowling_team"].dropna().unique()),
+                              key="spell_team")
+    spell_min_overs = b2.number_input("Min overs per spell", 1, 10, 2, 1, key="spell_min_overs")
+    if spell_team != "All":
+        season_spells = season_spells[season_spells["bowling_team"] == spell_team]
+    long_spells = season_spells[season_spells["overs"] >= spell_min_overs]
+    m1, m2, m3, m4 = st.columns(4)
+    m1.metric("Spells", len(long_spells))
+    m2.metric("Avg spell (overs)", f"{long_spells['overs'].mean():.1f}" if len(long_spells) else "–")
+    m3.metric("Maidens", int(season_spells["maidens"].sum()))
+    m4.metric("Dot ball %", f"{season_spells['dots'].sum() / max(season_spells['balls'].sum(), 1) * 100:.1f}")
+    st.dataframe(spell_leaders(season_spells, spell_min_overs), hide_index=True)
+    if len(long_spells):
+        plotly_chart(spell_fig(long_spells), use_container_width=True)
+
+# Players Like X (career feature vectors, cosine nearest neighbours)
+@st.cache_resource(show_spinner="Indexing player profiles...")
+def get_similarity(path=DATA_PATH):
+    return SimilarityIndex(get_data(path))
+
+timer.mark("similar players")
+st.markdown("#### 🔎 Similar Players")
+similarity = get_similarity()
+if not similarity.players:
+    st.info("Not enough balls faced / bowled to profile any player.")
+else:
+    s1, s2 = st.columns([3, 1])
+    default_player = top_bats["player"].iloc[0] if not top_bats.empty and top_bats["player"].iloc[0] in similarity.players else similarity.players[0]
+    like_player = s1.selectbox("Players like", similarity.players, index=similarity.players.index(default_player), key="similar_player")
+    like_k = s2.number_input("How many", 1, 50, 10, 1, key="similar_k")
+    st.dataframe(similarity.similar(like_player, like_k), hide_index=True)
 
 # Player Trends (Match-wise)
+timer.mark("player trends")
 st.markdown("#### 📈 Player Trends (Match-wise)")
 trend1, trend2 = st.columns(2)
 with trend1:
     top5_bats = top_bats["player"].head(5).tolist()
-    trend_df = season_df[season_df["player"].isin(top5_bats)].groupby(["match_s_id","player"]).runs.sum().reset_index()
-    fig = px.line(trend_df, x="match_s_id", y="runs", color="player", markers=True, title="Top 5 Batsmen Trends")
-    st.plotly_chart(fig, use_container_width=True)
+    trend_df = player_trends(season_df, top5_bats, "runs")
+    fig = player_trend_fig(trend_df, "runs", "Top 5 Batsmen Trends")
+    plotly_chart(fig, use_container_width=True)
 
 with trend2:
     top5_bowls = top_bowl["player"].head(5).tolist()
-    trend_df_b = season_df[season_df["player"].isin(top5_bowls)].groupby(["match_s_id","player"]).wickets.sum().reset_index()
-    fig = px.line(trend_df_b, x="match_s_id", y="wickets", color="player", markers=True, title="Top 5 Bowlers Trends")
-    st.plotly_chart(fig, use_container_width=True)
+    trend_df_b = player_trends(season_df, top5_bowls, "wickets")
+    fig = player_trend_fig(trend_df_b, "wickets", "Top 5 Bowlers Trends")
+    plotly_chart(fig, use_container_width=True)
+
+# Live Match Feed (polls the snapshot written by live_ingest.py)
+@st.fragment(run_every=LIVE_POLL_SECONDS)
+def live_panel():
+    snap = load_snapshot(LIVE_SNAPSHOT)
+    if snap is None:
+        st.info("No live snapshot yet. Start `python live_ingest.py` to stream a match.")
+        return
+    teams_live = pd.DataFrame(snap["teams"])
+    for m in snap["matches"]:
+        st.markdown(f"**{' vs '.join(m['teams'])}** · {m['venue']} · innings {m['innings']}, over {m['over']}.{m['ball']}")
+        st.dataframe(teams_live[teams_live["match_id"] == m["match_id"]], hide_index=True)
+    # A header-only batch leaves the snapshot's records empty (no columns to sort on)
+    lc1, lc2 = st.columns(2)
+    with lc1:
+        bat_live = pd.DataFrame(snap["batting"])
+        if not bat_live.empty:
+            st.dataframe(bat_live.sort_values("runs", ascending=False).head(top_n), hide_index=True)
+    with lc2:
+        bowl_live = pd.DataFrame(snap["bowling"])
+        if not bowl_live.empty:
+            st.dataframe(bowl_live.sort_values(["wickets", "runs_conceded"], ascending=[False, True]).head(top_n), hide_index=True)
+    st.caption(f"{snap['deliveries']} deliveries · refreshed every {LIVE_POLL_SECONDS}s")
+
+if show_live:
+    timer.mark("live feed")
+    st.markdown("#### 📡 Live Match Feed")
+    live_panel()
 
 # Optional Raw Data
 if show_raw:
+    timer.mark("raw data")
     st.subheader("Raw Data (Filtered)")
-    st.dataframe(season_df)
+    # Sorted and paginated server-side so only one page is sent to the browser
+    rc1, rc2, rc3, rc4 = st.columns(4)
+    sort_col = rc1.selectbox("Sort by", ["(none)"] + season_df.columns.tolist())
+    ascending = rc2.checkbox("Ascending", value=False)
+    page_size = rc3.selectbox("Rows per page", [25, DEFAULT_PAGE_SIZE, 100, 200], index=1)
+    n_pages = page_count(len(season_df), page_size)
+    page = rc4.number_input("Page", 1, n_pages, 1, 1)
+    st.dataframe(paginate_frame(season_df, page, page_size,
+                                None if sort_col == "(none)" else sort_col, ascending))
+    st.caption(f"Page {page} of {n_pages} · {len(season_df)} rows")
+
+# Render Timings (debug): this rerun's sections and the rolling p50/p95 from the log
+run_timings = timer.finish()
+if show_timings:
+    with st.expander("⏱️ Render timings", expanded=True):
+        t1, t2 = st.columns(2)
+        t1.markdown("**This rerun**")
+        t1.dataframe(pd.DataFrame(run_timings, columns=["section", "seconds"]).round(4), hide_index=True)
+        t2.markdown("**Rolling log (p50 / p95)**")
+        t2.dataframe(pd.DataFrame(summarize(read_log(timer.log_path))), hide_index=True)
@@ -0,0 +1,133 @@
+# scripts/dashboard_data.py
+"""
+Data loading for the Streamlit dashboard, kept out of the page script so the
+dashboard can render its sidebar before pandas is even imported.
+
+Run this module from the project root after a deploy/restart (or after the
+pipeline refreshes the data) to warm the caches ahead of the first analyst:
+    python scripts/dashboard_data.py
+It writes the season index used by the sidebar and a pickled, already-cleaned
+copy of the player-match data that loads much faster than re-parsing the CSV.
+"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from schema_registry import ALIASES, resolve_aliases, read_source
+from storage import resolve_path
+
+DEFAULT_DATA_PATH = "data/combined_player_match_s_format.csv"
+SEASON_INDEX_PATH = "data/season_index.json"
+PREPARED_CACHE_PATH = "data/combined_player_match_s_format.pkl"
+
+
+def infer_and_rename_cols(df):
+    return df.rename(columns=resolve_aliases(df.columns, ALIASES))
+
+
+def prepare_frame(df_raw: pd.DataFrame) -> pd.DataFrame:
+    """Rename aliased columns and apply the dashboard's basic cleaning."""
+    df = infer_and_rename_cols(df_raw.copy())
+    for c in df.select_dtypes("object").columns:
+        df[c] = df[c].astype(str)
+    for c in ["runs", "balls", "balls_bowled", "wickets", "runs_conceded"]:
+        if c in df.columns:
+            df[c] = pd.to_numeric(df[c], errors="coerce").fillna(0)
+    if "season" not in df.columns and "match_s_id" in df.columns:
+        df["season"] = df["match_s_id"].astype(str).str[:4]
+    if "match_id" not in df.columns and "match_s_id" in df.columns:
+        # The pipeline's combined table identifies matches by match_s_id only
+        df["match_id"] = df["match_s_id"]
+    return df
+
+
+def load_prepared(path: str = DEFAULT_DATA_PATH, cache_path: str = PREPARED_CACHE_PATH) -> pd.DataFrame:
+    """
+    Load the prepared dashboard frame.
+    Uses the pickled copy when it is newer than the data file (CSV or Parquet), otherwise
+    parses the data file and refreshes the pickle for next time.
+    """
+    path = resolve_path(path)
+    if not os.path.exists(path):
+        return None
+    if cache_path and os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+        return pd.read_pickle(cache_path)
+    # Column aliases / dtypes come from the schema registry (inferred once per source header)
+    df = prepare_frame(read_source(path, "dashboard"))
+    if cache_path:
+        try:
+            df.to_pickle(cache_path)
+        except OSError:
+            pass  # read-only data dir: still serve the parsed frame
+    return df
+
+
+def team_stats(season_df: pd.DataFrame) -> pd.DataFrame:
+    """Per-team runs, wickets, averages and win % for a slice of the data."""
+    team = season_df.groupby("team").agg(
+        runs_total=("runs", "sum"),
+        wickets_total=("wickets", "sum"),
+        matches=("match_id", "nunique")
+    ).reset_index()
+    team["avg_runs"] = (team["runs_total"]/team["matches"]).round(1)
+    team["avg_wickets"] = (team["wickets_total"]/team["matches"]).round(1)
+    if "match_won_by" in season_df.columns:
+        wins = season_df[["match_id", "team", "match_won_by"]].drop_duplicates()
+        win_count = (wins["match_won_by"] == wins["team"]).groupby(wins["team"]).sum().reset_index(name="wins")
+        team = team.merge(win_count, on="team", how="left")
+        team["win_pct"] = (team["wins"]/team["matches"]*100).round(1)
+    else:
+        team["win_pct"] = np.nan
+    return team
+
+
+def venue_stats(season_df: pd.DataFrame) -> pd.DataFrame:
+    """Per-venue average score and wickets per innings for a slice of the data."""
+    venue = season_df.groupby("venue").agg(
+        total_runs=("runs", "sum"),
+        total_wickets=("wickets", "sum"),
+        matches=("match_id", "nunique")
+    ).reset_index()
+    venue["avg_score"] = (venue["total_runs"]/venue["matches"]/2).round(1)
+    venue["avg_wickets"] = (venue["total_wickets"]/venue["matches"]/2).round(1)
+    return venue
+
+
+def player_trends(season_df: pd.DataFrame, players: list, value: str) -> pd.DataFrame:
+    """Match-by-match totals of `value` for the given players."""
+    return season_df[season_df["player"].isin(players)].groupby(["match_s_id", "player"])[value].sum().reset_index()
+
+
+def season_list(df: pd.DataFrame) -> list:
+    return sorted(df["season"].dropna().unique().astype(str))
+
+
+def build_season_index(df: pd.DataFrame, source_path: str = DEFAULT_DATA_PATH,
+                       index_path: str = SEASON_INDEX_PATH) -> list:
+    """Write the season list the dashboard sidebar renders from (tagged with the source mtime)."""
+    seasons = season_list(df)
+    source_path = resolve_path(source_path)
+    os.makedirs(os.path.dirname(index_path) or ".", exist_ok=True)
+    with open(index_path, "w", encoding="utf-8") as f:
+        json.dump({"source": source_path, "source_mtime": os.path.getmtime(source_path),
+                   "seasons": seasons}, f)
+    return seasons
+
+
+def warm_up(path: str = DEFAULT_DATA_PATH, index_path: str = SEASON_INDEX_PATH,
+            cache_path: str = PREPARED_CACHE_PATH) -> pd.DataFrame:
+    """Fill the on-disk caches (prepared pickle + season index) before any user connects."""
+    if cache_path and os.path.exists(cache_path):
+        os.remove(cache_path)  # force a fresh parse of the current CSV
+    df = load_prepared(path, cache_path)
+    if df is None:
+        raise FileNotFoundError(f"❌ Data file not found: {path}")
+    seasons = build_season_index(df, path, index_path)
+    print(f"🔥 Warm-up done: {len(df)} rows, {len(seasons)} seasons → {index_path}, {cache_path}")
+    return df
+
+
+if __name__ == "__main__":
+    warm_up()
@@ -0,0 +1,234 @@
+# scripts/export_reports.py
+"""
+Static HTML reports (one per season, team and venue) built from the same
+Plotly figures as the dashboard (chart_utils), for sharing without a running app.
+
+- All aggregation happens once in the parent process: leaderboards come from a
+  single LeaderboardEngine and each report job carries only its own small frames.
+- Figure building + HTML serialisation (the slow part) runs in a process pool.
+- plotly.js is written once to <output_dir>/assets and every page links to it
+  instead of inlining ~3.5 MB of JavaScript per file.
+"""
+import os
+import re
+import html
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+import chart_utils
+from dashboard_data import load_prepared, team_stats, venue_stats, player_trends, DEFAULT_DATA_PATH
+from leaderboard import LeaderboardEngine
+
+ASSET_DIR = "assets"
+PLOTLY_JS = "plotly.min.js"
+TOP_N = 10
+MIN_BALLS = 100
+MIN_INNINGS = 7
+
+
+# ------------------------
+# Shared assets
+# ------------------------
+def write_plotly_js(output_dir: str) -> str:
+    """Write plotly.min.js once under output_dir/assets (skipped when already present)."""
+    from plotly.offline import get_plotlyjs
+
+    path = os.path.join(output_dir, ASSET_DIR, PLOTLY_JS)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(get_plotlyjs())
+    return path
+
+
+def slugify(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "_", str(name)).strip("_").lower() or "report"
+
+
+def unique_slugs(names: list) -> list:
+    """slugify each name, numbering repeats (_2, _3, ...) so names differing only in punctuation keep their own file."""
+    used, slugs = set(), []
+    for name in names:
+        base = slug = slugify(name)
+        n = 1
+        while slug in used:
+            n += 1
+            slug = f"{base}_{n}"
+        used.add(slug)
+        slugs.append(slug)
+    return slugs
+
+
+# ------------------------
+# Report jobs (built in the parent)
+# ------------------------
+def _leaderboard_sections(engine: LeaderboardEngine, k: int, min_balls: int, min_innings: int, **filters) -> list:
+    board = dict(min_balls=min_balls, min_innings=min_innings, **filters)
+    return [
+        ("🏏 Top Run Scorers", "top_run_scorers_fig", engine.top("runs", k, **board), {}),
+        ("🎯 Top Wicket Takers", "top_wicket_takers_fig", engine.top("wickets", k, **board), {}),
+        ("⚡ Strike Rate Leaders", "strike_rate_fig", engine.top("strike_rate", k, **board), {}),
+        ("💰 Economy Leaders", "economy_fig", engine.top("economy", k, **board), {}),
+    ]
+
+
+def _per_season(df: pd.DataFrame, stats_fn, key: str) -> pd.DataFrame:
+    """stats_fn applied to every season, stacked with a season column."""
+    frames = [stats_fn(g).assign(season=season) for season, g in df.groupby("season")]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=[key, "season"])
+
+
+def build_report_jobs(df: pd.DataFrame, output_dir: str, k: int = TOP_N,
+                      min_balls: int = MIN_BALLS, min_innings: int = MIN_INNINGS, kinds: list = None) -> list:
+    """
+    One job per season, team and venue (only the given kinds are aggregated).
+    A job is a plain dict of small frames
+    (title, file name, [(heading, chart_utils builder, frame, kwargs)]) so it
+    pickles cheaply to a worker.
+    """
+    kinds = set(kinds or ["season", "team", "venue"])
+    engine = LeaderboardEngine(df)
+    jobs = []
+
+    # Season reports: the dashboard's season overview
+    for season, season_df in (df.groupby("season") if "season" in kinds else []):
+        sections = _leaderboard_sections(engine, k, min_balls, min_innings, seasons=[season])
+        team, venue = team_stats(season_df), venue_stats(season_df)
+        sections += [
+            ("🏆 Team Performance", "team_performance_fig", team, {}),
+            ("🥇 Team Win %", "team_win_fig", team, {}),
+            ("🏟️ Venue Avg Score", "venue_score_fig", venue, {}),
+            ("🎯 Venue Avg Wickets", "venue_wickets_fig", venue, {}),
+        ]
+        top5_bats = sections[0][2]["player"].head(5).tolist()
+        top5_bowls = sections[1][2]["player"].head(5).tolist()
+        sections += [
+            ("📈 Batsmen Trends", "player_trend_fig", player_trends(season_df, top5_bats, "runs"),
+             dict(y="runs", title="Top 5 Batsmen Trends")),
+            ("📈 Bowlers Trends", "player_trend_fig", player_trends(season_df, top5_bowls, "wickets"),
+             dict(y="wickets", title="Top 5 Bowlers Trends")),
+        ]
+        jobs.append(dict(kind="season", name=season, title=f"Season {season} Overview", sections=sections))
+
+    # Team reports: season-by-season form plus the team's all-time leaders
+    team_seasons = _per_season(df, team_stats, "team") if "team" in kinds else None
+    for team_name in (engine.teams if "team" in kinds else []):
+        rows = team_seasons[team_seasons["team"] == team_name]
+        sections = [
+            ("📊 Avg Runs by Season", "line_chart", rows,
+             dict(x="season", y="avg_runs", markers=True, title="Avg Runs per Match")),
+            ("🥇 Win % by Season", "line_chart", rows,
+             dict(x="season", y="win_pct", markers=True, title="Win %")),
+        ]
+        sections += _leaderboard_sections(engine, k, min_balls, min_innings, team=team_name)
+        jobs.append(dict(kind="team", name=team_name, title=f"{team_name} Report", sections=sections))
+
+    # Venue reports: scoring trend, team performance and leaders at the ground
+    venue_seasons = _per_season(df, venue_stats, "venue") if "venue" in kinds else None
+    for venue_name, venue_df in (df.groupby("venue") if "venue" in kinds else []):
+        rows = venue_seasons[venue_seasons["venue"] == venue_name]
+        sections = [
+            ("📊 Avg Score by Season", "line_chart", rows,
+             dict(x="season", y="avg_score", markers=True, title="Avg Score per Innings")),
+            ("🏆 Team Performance", "team_performance_fig", team_stats(venue_df), {}),
+        ]
+        sections += _leaderboard_sections(engine, k, min_balls, min_innings, venue=venue_name)
+        jobs.append(dict(kind="venue", name=venue_name, title=f"{venue_name} Report", sections=sections))
+
+    for kind in kinds:
+        kind_jobs = [job for job in jobs if job["kind"] == kind]
+        for job, slug in zip(kind_jobs, unique_slugs([job["name"] for job in kind_jobs])):
+            job["path"] = os.path.join(output_dir, f"{kind}s", f"{slug}.html")
+    return jobs
+
+
+# ------------------------
+# Rendering (runs in the workers)
+# ------------------------
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="{plotly_js}"></script>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+section {{ margin-bottom: 2em; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+{body}
+</body>
+</html>
+"""
+
+
+def render_report(job: dict) -> str:
+    """Build the job's figures and write its HTML page; returns the output path."""
+    parts = []
+    for heading, builder, frame, kwargs in job["sections"]:
+        parts.append(f"<section>\n<h3>{html.escape(heading)}</h3>")
+        if frame.empty:
+            parts.append("<p>No data.</p>\n</section>")
+            continue
+        fig = getattr(chart_utils, builder)(frame, **kwargs)
+        parts.append(fig.to_html(full_html=False, include_plotlyjs=False))
+        parts.append("</section>")
+
+    out_dir = os.path.dirname(job["path"])
+    os.makedirs(out_dir, exist_ok=True)
+    plotly_js = os.path.relpath(job["plotly_js"], out_dir).replace(os.sep, "/")
+    with open(job["path"], "w", encoding="utf-8") as f:
+        f.write(PAGE_TEMPLATE.format(title=html.escape(job["title"]), plotly_js=plotly_js,
+                                     body="\n".join(parts)))
+    return job["path"]
+
+
+def write_index(jobs: list, output_dir: str) -> str:
+    links = {}
+    for job in jobs:
+        rel = os.path.relpath(job["path"], output_dir).replace(os.sep, "/")
+        links.setdefault(job["kind"], []).append(f'<li><a href="{rel}">{html.escape(str(job["name"]))}</a></li>')
+    body = "\n".join(f"<h2>{kind.title()}s</h2>\n<ul>\n" + "\n".join(items) + "\n</ul>"
+                     for kind, items in links.items())
+    path = os.path.join(output_dir, "index.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(PAGE_TEMPLATE.format(title="Cricket Reports", plotly_js=f"{ASSET_DIR}/{PLOTLY_JS}", body=body))
+    return path
+
+
+def export_reports(data_path: str, output_dir: str, workers: int = None, kinds: list = None) -> list:
+    """
+    Export every season/team/venue report under output_dir.
+    - workers: process count for rendering (1 renders in-process)
+    - kinds: subset of ['season', 'team', 'venue']
+    """
+    print("📥 Loading player-match data...")
+    df = load_prepared(data_path, cache_path=None)
+    if df is None:
+        raise FileNotFoundError(f"❌ Data file not found: {data_path}")
+    df["season"] = df["season"].astype(str)
+    print("✅ Loaded:", df.shape, "rows x columns")
+
+    plotly_js = write_plotly_js(output_dir)
+    jobs = build_report_jobs(df, output_dir, kinds=kinds)
+    for job in jobs:
+        job["plotly_js"] = plotly_js
+
+    if workers == 1:
+        paths = [render_report(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            paths = list(pool.map(render_report, jobs))
+
+    index = write_index(jobs, output_dir)
+    print(f"💾 {len(paths)} reports written to {output_dir} (index: {index})")
+    return paths
+
+
+if __name__ == "__main__":
+    data_path = "C:/Users/Dharun Kumar/PycharmProjects/cricket/" + DEFAULT_DATA_PATH
+    output_dir = "C:/Users/Dharun Kumar/PycharmProjects/cricket/reports"
+    export_reports(data_path, output_dir, workers=os.cpu_count())
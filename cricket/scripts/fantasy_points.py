@@ -0,0 +1,272 @@
+# scripts/fantasy_points.py
+"""
+Fantasy points per player per match, scored in bulk from the cleaned deliveries.
+
+Scoring rules are a plain dict (DEFAULT_RULES), optionally overridden per
+season. Every rule is applied as a grouped / vectorized operation over the whole
+delivery table, one pass per rule scope, never per match or per player.
+
+Incremental runs: each match is fingerprinted by its effective rules and by its
+deliveries. When the output already exists, only matches whose fingerprint
+changed are re-scored and the rest are reused from the previous output.
+"""
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+from storage import read_header, read_table, resolve_path, write_table
+
+INF = float('inf')
+
+DEFAULT_RULES = {
+    'playing': 4,
+    # Batting
+    'run': 1,
+    'four': 1,
+    'six': 2,
+    'duck': -2,
+    'run_milestones': {30: 4, 50: 8, 100: 16},
+    'strike_rate_min_balls': 10,
+    # (lower, upper, points): lower <= value < upper
+    'strike_rate_brackets': [(0, 50, -6), (50, 60, -4), (60, 70, -2), (130, 150, 2), (150, 170, 4), (170, INF, 6)],
+    # Bowling
+    'wicket': 25,
+    'lbw_bowled_bonus': 8,
+    'wicket_milestones': {3: 4, 4: 8, 5: 16},
+    'maiden': 12,
+    'economy_min_balls': 12,
+    'economy_brackets': [(0, 5, 6), (5, 6, 4), (6, 7, 2), (10, 11, -2), (11, 12, -4), (12, INF, -6)],
+    # Fielding
+    'catch': 8,
+    'three_catch_bonus': 4,
+    'stumping': 12,
+    'run_out': 6,
+    # Only the highest milestone reached scores (False: every milestone passed adds up)
+    'milestones_cumulative': False,
+}
+
+# Dismissals not credited to the bowler
+NON_BOWLER_WICKETS = ['run out', 'retired hurt', 'retired out', 'obstructing the field']
+ILLEGAL_BALLS = ['wides', 'noballs']
+BYE_EXTRAS = ['byes', 'legbyes']
+
+DELIVERY_COLS = ['match_id', 'season', 'innings', 'over', 'ball', 'batting_team', 'bowling_team',
+                 'batter', 'bowler', 'runs_batter', 'runs_extras', 'runs_total',
+                 'extra_type', 'wicket_kind', 'player_out']
+OUTPUT_COLS = ['match_id', 'season', 'player', 'team',
+               'batting_points', 'bowling_points', 'fielding_points', 'total_points']
+
+
+# ------------------------
+# Rules
+# ------------------------
+def effective_rules(rules: dict, season: str) -> dict:
+    """Rules for one season: DEFAULT_RULES <- rules['default'] <- rules['seasons'][season]."""
+    rules = rules or {}
+    out = dict(DEFAULT_RULES)
+    out.update(rules.get('default', {}))
+    out.update(rules.get('seasons', {}).get(str(season), {}))
+    return out
+
+
+def rules_fingerprint(rules: dict) -> str:
+    return hashlib.sha1(json.dumps(rules, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def _bracket_points(values: pd.Series, brackets: list, eligible: pd.Series) -> pd.Series:
+    pts = np.zeros(len(values))
+    v = values.to_numpy(dtype=float)
+    for lo, hi, p in brackets:
+        pts += np.where((v >= lo) & (v < hi), p, 0)
+    return pd.Series(np.where(eligible.to_numpy(), pts, 0), index=values.index)
+
+
+def _milestone_points(values: pd.Series, milestones: dict, cumulative: bool) -> pd.Series:
+    v = values.to_numpy(dtype=float)
+    pts = np.zeros(len(v))
+    for threshold, p in sorted(((float(k), v_) for k, v_ in milestones.items())):
+        reached = v >= threshold
+        pts = pts + np.where(reached, p, 0) if cumulative else np.where(reached, p, pts)
+    return pd.Series(pts, index=values.index)
+
+
+# ------------------------
+# Scoring
+# ------------------------
+def score_deliveries(df: pd.DataFrame, rules: dict, fielding: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    Points per (match_id, player, team) for deliveries that all share one rule set.
+    - fielding: optional (match_id, player, team, catches, stumpings, run_outs) from the raw feed
+    """
+    keys = ['match_id', 'player', 'team']
+    legal = ~df['extra_type'].isin(ILLEGAL_BALLS)
+    byes = df['extra_type'].isin(BYE_EXTRAS)
+
+    # --- Batting ---
+    bat = df.assign(
+        player=df['batter'], team=df['batting_team'],
+        ball_faced=(df['extra_type'] != 'wides').astype(int),
+        four=(df['runs_batter'] == 4).astype(int),
+        six=(df['runs_batter'] == 6).astype(int),
+    ).groupby(keys).agg(runs=('runs_batter', 'sum'), balls=('ball_faced', 'sum'),
+                        fours=('four', 'sum'), sixes=('six', 'sum')).reset_index()
+    outs = df[df['player_out'].notna()].groupby(['match_id', 'player_out']).size().rename('outs')
+    bat = bat.join(outs, on=['match_id', 'player']).fillna({'outs': 0})
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sr = bat['runs'] / bat['balls'] * 100
+    bat['batting_points'] = (
+        bat['runs'] * rules['run'] + bat['fours'] * rules['four'] + bat['sixes'] * rules['six']
+        + np.where((bat['runs'] == 0) & (bat['outs'] > 0), rules['duck'], 0)
+        + _milestone_points(bat['runs'], rules['run_milestones'], rules['milestones_cumulative'])
+        + _bracket_points(sr, rules['strike_rate_brackets'], bat['balls'] >= rules['strike_rate_min_balls'])
+    )
+
+    # --- Bowling ---
+    wicket = df['player_out'].notna() & ~df['wicket_kind'].isin(NON_BOWLER_WICKETS)
+    b = df.assign(
+        player=df['bowler'], team=df['bowling_team'],
+        legal_ball=legal.astype(int),
+        conceded=np.where(byes, df['runs_total'] - df['runs_extras'], df['runs_total']),
+        wicket=wicket.astype(int),
+        lbw_bowled=(wicket & df['wicket_kind'].isin(['lbw', 'bowled'])).astype(int),
+    )
+    overs = b.groupby(keys + ['innings', 'over']).agg(balls=('legal_ball', 'sum'), conceded=('conceded', 'sum'))
+    maidens = ((overs['balls'] >= 6) & (overs['conceded'] == 0)).groupby(keys).sum().rename('maidens')
+    bowl = b.groupby(keys).agg(balls_bowled=('legal_ball', 'sum'), runs_conceded=('conceded', 'sum'),
+                               wickets=('wicket', 'sum'), lbw_bowled=('lbw_bowled', 'sum')).join(maidens).reset_index()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        econ = bowl['runs_conceded'] / (bowl['balls_bowled'] / 6)
+    bowl['bowling_points'] = (
+        bowl['wickets'] * rules['wicket'] + bowl['lbw_bowled'] * rules['lbw_bowled_bonus']
+        + bowl['maidens'] * rules['maiden']
+        + _milestone_points(bowl['wickets'], rules['wicket_milestones'], rules['milestones_cumulative'])
+        + _bracket_points(econ, rules['economy_brackets'], bowl['balls_bowled'] >= rules['economy_min_balls'])
+    )
+
+    # --- Fielding (caught and bowled is credited from the deliveries themselves) ---
+    cab = df[df['wicket_kind'] == 'caught and bowled'].groupby(
+        ['match_id', 'bowler', 'bowling_team']).size().rename('catches').reset_index()
+    cab = cab.rename(columns={'bowler': 'player', 'bowling_team': 'team'})
+    field = pd.concat([cab] + ([fielding] if fielding is not None and not fielding.empty else []), ignore_index=True)
+    field = field.groupby(keys).sum().reindex(columns=['catches', 'stumpings', 'run_outs']).fillna(0).reset_index()
+    field['fielding_points'] = (
+        field['catches'] * rules['catch'] + np.where(field['catches'] >= 3, rules['three_catch_bonus'], 0)
+        + field['stumpings'] * rules['stumping'] + field['run_outs'] * rules['run_out']
+    )
+
+    points = bat[keys + ['batting_points']].merge(bowl[keys + ['bowling_points']], on=keys, how='outer')
+    points = points.merge(field[keys + ['fielding_points']], on=keys, how='left')
+    for c in ['batting_points', 'bowling_points', 'fielding_points']:
+        points[c] = points[c].fillna(0)
+    points['total_points'] = rules['playing'] + points[['batting_points', 'bowling_points', 'fielding_points']].sum(axis=1)
+    return points
+
+
+def fielding_from_raw(raw_csv: str) -> pd.DataFrame:
+    """Catches / stumpings / run-outs per fielder per match from the raw feed's `fielders` column."""
+    header = read_header(raw_csv)
+    if 'fielders' not in header:
+        return None
+    cols = ['match_id', 'innings', 'over', 'ball', 'bowling_team', 'wicket_kind', 'player_out', 'fielders']
+    raw = read_table(raw_csv, usecols=[c for c in cols if c in header], low_memory=False)
+    raw = raw[raw['fielders'].notna() & raw['wicket_kind'].isin(['caught', 'stumped', 'run out'])]
+    raw = raw.drop_duplicates([c for c in ['match_id', 'innings', 'over', 'ball', 'player_out'] if c in raw.columns])
+    raw = raw.assign(player=raw['fielders'].astype(str).str.split(',')).explode('player')
+    raw['player'] = raw['player'].str.strip()
+    raw = raw[raw['player'] != '']
+    kinds = {'caught': 'catches', 'stumped': 'stumpings', 'run out': 'run_outs'}
+    field = pd.crosstab([raw['match_id'], raw['player'], raw['bowling_team']], raw['wicket_kind'].map(kinds))
+    field = field.reindex(columns=list(kinds.values()), fill_value=0).reset_index()
+    return field.rename(columns={'bowling_team': 'team'})
+
+
+def match_fingerprints(df: pd.DataFrame, rules: dict, fielding: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    Per match: fingerprint of its effective rules, of its deliveries and of its fielding rows.
+    field_fp is 'none' without a fielding source and '0' for a match with no fielding rows,
+    so adding, removing or changing the fielding data rescores the affected matches.
+    """
+    row_hash = pd.util.hash_pandas_object(df[[c for c in DELIVERY_COLS if c in df.columns]], index=False)
+    data_fp = row_hash.groupby(df['match_id'].to_numpy()).sum().astype(str)
+    seasons = df.groupby('match_id')['season'].first().astype(str)
+    rules_fp = seasons.map({s: rules_fingerprint(effective_rules(rules, s)) for s in seasons.unique()})
+    if fielding is None:
+        field_fp = pd.Series('none', index=seasons.index)
+    else:
+        rows = fielding.sort_values(['match_id', 'player', 'team'])
+        field_fp = pd.util.hash_pandas_object(rows, index=False).groupby(rows['match_id'].to_numpy()).sum()
+        field_fp = field_fp.astype(str).reindex(seasons.index, fill_value='0')
+    return pd.DataFrame({'season': seasons, 'rules_fp': rules_fp, 'data_fp': data_fp.reindex(seasons.index),
+                         'field_fp': field_fp})
+
+
+def compute_fantasy_points(deliveries: pd.DataFrame, rules: dict = None, fielding: pd.DataFrame = None,
+                           previous: pd.DataFrame = None, previous_fp: pd.DataFrame = None) -> tuple:
+    """
+    Score every match, reusing `previous` rows for matches whose fingerprints in
+    `previous_fp` still match. Returns (points, fingerprints, rescored match ids).
+    """
+    df = deliveries[[c for c in DELIVERY_COLS if c in deliveries.columns]].copy()
+    df['season'] = df['season'].astype(str)
+    for c in ['runs_batter', 'runs_extras', 'runs_total']:
+        df[c] = pd.to_numeric(df[c], errors='coerce').fillna(0)
+    fps = match_fingerprints(df, rules, fielding)
+
+    todo = fps.index
+    if previous is not None and previous_fp is not None:
+        old = previous_fp.reindex(fps.index)
+        unchanged = (old['rules_fp'] == fps['rules_fp']) & (old['data_fp'] == fps['data_fp'])
+        if 'field_fp' in old.columns:
+            unchanged &= old['field_fp'] == fps['field_fp']
+        else:
+            unchanged &= False  # sidecar from before field_fp: rescore once
+        todo = fps.index[~unchanged]
+    df = df[df['match_id'].isin(todo)]
+
+    parts = []
+    for rules_fp, matches in fps.loc[todo].groupby('rules_fp'):
+        sub = df[df['match_id'].isin(matches.index)]
+        sub_field = fielding[fielding['match_id'].isin(matches.index)] if fielding is not None else None
+        scored = score_deliveries(sub, effective_rules(rules, matches['season'].iloc[0]), sub_field)
+        parts.append(scored.merge(matches[['season']], left_on='match_id', right_index=True))
+    if previous is not None:
+        parts.append(previous[previous['match_id'].isin(fps.index.difference(todo))])
+
+    points = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=OUTPUT_COLS)
+    points = points[OUTPUT_COLS].sort_values(['match_id', 'total_points'], ascending=[True, False])
+    for c in ['batting_points', 'bowling_points', 'fielding_points', 'total_points']:
+        points[c] = points[c].astype('float32')
+    return points.reset_index(drop=True), fps, list(todo)
+
+
+def create_fantasy_points(cleaned_csv: str, output_csv: str, rules: dict = None, raw_csv: str = None):
+    """Score the cleaned deliveries into output_csv (+ a .fingerprints.csv sidecar for incremental reruns)."""
+    print("📥 Loading cleaned data...")
+    df = read_table(cleaned_csv, usecols=lambda c: c in DELIVERY_COLS, low_memory=False)
+    print("✅ Loaded:", df.shape, "rows x columns")
+    fielding = fielding_from_raw(raw_csv) if raw_csv else None
+    if fielding is None:
+        reason = "No fielders column in the raw feed" if raw_csv else "No raw feed given (raw_csv)"
+        print(f"⚠️ {reason}: only caught-and-bowled catches are scored.")
+
+    fp_csv = os.path.splitext(output_csv)[0] + '.fingerprints.csv'
+    previous = previous_fp = None
+    if os.path.exists(resolve_path(output_csv)) and os.path.exists(fp_csv):
+        previous = read_table(output_csv, dtype={'season': str})
+        previous_fp = pd.read_csv(fp_csv, dtype={'season': str, 'data_fp': str, 'field_fp': str}).set_index('match_id')
+
+    points, fps, rescored = compute_fantasy_points(df, rules, fielding, previous, previous_fp)
+
+    os.makedirs(os.path.dirname(output_csv), exist_ok=True)
+    saved = write_table(points, output_csv)
+    fps.rename_axis('match_id').reset_index().to_csv(fp_csv, index=False)
+    print(f"💾 Fantasy points saved at: {saved} ({len(rescored)} of {len(fps)} matches scored)")
+    return points
+
+
+if __name__ == "__main__":
+    cleaned_csv = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/cleaned_matches.csv"
+    raw_csv = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/matches.csv"
+    output_csv = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/fantasy_points.csv"
+    create_fantasy_points(cleaned_csv, output_csv, raw_csv=raw_csv)
@@ -1,51 +1,177 @@
+import os
 import pandas as pd
-
-# Load the combined player-match CSV
-player_file = r"C:\Users\Dharun Kumar\PycharmProjects\cricket\data\combined_player_match_s_format.csv"
-data = pd.read_csv(player_file)
+from storage import read_table, write_table
 
 # --------------------------
-# 1️⃣ Team summary
+# Summary registry
 # --------------------------
-team_summary = data.groupby(['season', 'team']).agg(
-    matches=('match_s_id', 'nunique'),
-    runs_scored=('runs', 'sum'),
-    wickets_taken=('wickets', 'sum'),
-    balls_faced=('balls', 'sum'),
-    balls_bowled=('balls_bowled', 'sum'),
-    wins=('win_outcome', lambda x: (x=='win').sum())
-).reset_index()
-
-team_summary['avg_runs'] = team_summary['runs_scored'] / team_summary['matches']
-team_summary['avg_rpo'] = (team_summary['runs_scored'] / team_summary['balls_faced']) * 6
-team_summary['win_pct'] = (team_summary['wins'] / team_summary['matches']) * 100
-
-team_summary.to_csv(r"C:\Users\Dharun Kumar\PycharmProjects\cricket\data\team_summary.csv", index=False)
-print("✅ team_summary.csv created!")
+# Each summary declares its group keys, its measures as (column, reducer) with a
+# built-in reducer only, and derived ratios as (numerator, denominator, scale).
+# Adding a summary here adds no extra scan: every summary is rolled up from one
+# shared intermediate grouping of the data.
+SUMMARY_SPECS = {
+    'team_summary': {
+        'keys': ['season', 'team'],
+        'measures': {
+            'matches': ('match_s_id', 'nunique'),
+            'runs_scored': ('runs', 'sum'),
+            'wickets_taken': ('wickets', 'sum'),
+            'balls_faced': ('balls', 'sum'),
+            'balls_bowled': ('balls_bowled', 'sum'),
+            'wins': ('is_win', 'sum'),
+        },
+        'derived': {
+            'avg_runs': ('runs_scored', 'matches', 1),
+            'avg_rpo': ('runs_scored', 'balls_faced', 6),
+            'win_pct': ('wins', 'matches', 100),
+        },
+        'output': 'team_summary.csv',
+    },
+    'venue_summary': {
+        'keys': ['season', 'venue'],
+        'measures': {
+            'matches': ('match_s_id', 'nunique'),
+            'total_runs': ('runs', 'sum'),
+            'total_wickets': ('wickets', 'sum'),
+            'avg_runs': ('runs', 'mean'),
+        },
+        'output': 'venue_summary.csv',
+    },
+    'season_summary': {
+        'keys': ['season'],
+        'measures': {
+            'total_matches': ('match_s_id', 'nunique'),
+            'total_runs': ('runs', 'sum'),
+            'total_wickets': ('wickets', 'sum'),
+            'avg_runs': ('runs', 'mean'),
+            'avg_wickets': ('wickets', 'mean'),
+        },
+        'output': 'season_summary.csv',
+    },
+    'team_season_summary': {
+        'keys': ['season', 'team'],
+        'measures': {
+            'runs': ('runs', 'sum'),
+            'wickets': ('wickets', 'sum'),
+            'matches': ('match_s_id', 'nunique'),
+        },
+        'output': 'team_season_summary.csv',
+    },
+    'season_advanced_stats': {
+        'keys': ['season'],
+        'measures': {
+            'runs': ('runs', 'sum'),
+            'wickets': ('wickets', 'sum'),
+            'matches': ('match_s_id', 'nunique'),
+        },
+        'derived': {
+            'runs_per_match': ('runs', 'matches', 1),
+            'wickets_per_match': ('wickets', 'matches', 1),
+        },
+        'output': 'season_advanced_stats.csv',
+    },
+}
 
-# --------------------------
-# 2️⃣ Venue summary
-# --------------------------
-venue_summary = data.groupby(['season', 'venue']).agg(
-    matches=('match_s_id', 'nunique'),
-    total_runs=('runs', 'sum'),
-    total_wickets=('wickets', 'sum'),
-    avg_runs=('runs', 'mean')
-).reset_index()
+# Partial aggregates kept in the shared grouping for each reducer
+# (nunique is rolled up from the distinct match_s_id values instead)
+PARTIALS = {
+    'sum': ['sum'],
+    'mean': ['sum', 'count'],
+    'count': ['count'],
+    'min': ['min'],
+    'max': ['max'],
+}
+ROLLUP_REDUCERS = set(PARTIALS) | {'nunique'}
 
-venue_summary.to_csv(r"C:\Users\Dharun Kumar\PycharmProjects\cricket\data\venue_summary.csv", index=False)
-print("✅ venue_summary.csv created!")
+# Helper columns computed once, vectorized, before grouping
+HELPER_COLUMNS = {
+    'is_win': ('win_outcome', lambda s: (s == 'win').astype(int)),
+}
 
-# --------------------------
-# 3️⃣ Season summary
-# --------------------------
-season_summary = data.groupby(['season']).agg(
-    total_matches=('match_s_id', 'nunique'),
-    total_runs=('runs', 'sum'),
-    total_wickets=('wickets', 'sum'),
-    avg_runs=('runs', 'mean'),
-    avg_wickets=('wickets', 'mean')
-).reset_index()
-
-season_summary.to_csv(r"C:\Users\Dharun Kumar\PycharmProjects\cricket\data\season_summary.csv", index=False)
-print("✅ season_summary.csv created!")
+
+def _selected_specs(names, specs):
+    names = list(specs) if names is None else names
+    unknown = [n for n in names if n not in specs]
+    if unknown:
+        raise KeyError(f"❌ Unknown summaries: {unknown}. Available: {list(specs)}")
+    return {n: specs[n] for n in names}
+
+
+def _source_columns(specs) -> set:
+    """Columns of the input file needed by the selected summaries."""
+    cols = set()
+    for spec in specs.values():
+        cols.update(spec['keys'])
+        for col, _ in spec['measures'].values():
+            cols.add(HELPER_COLUMNS[col][0] if col in HELPER_COLUMNS else col)
+    return cols
+
+
+def run_summaries(data, names: list = None, specs: dict = SUMMARY_SPECS,
+                  output_dir: str = None) -> dict:
+    """
+    Compute the requested summaries in one pass over `data` (a DataFrame or CSV path).
+    - All summaries are rolled up from a single grouping on the union of their keys
+      (plus match_s_id, so distinct-match counts stay exact).
+    - Returns {name: DataFrame}; also writes each to `output_dir` when given.
+    """
+    specs = _selected_specs(names, specs)
+    for name, spec in specs.items():
+        bad = {r for _, r in spec['measures'].values()} - ROLLUP_REDUCERS
+        if bad:
+            raise ValueError(f"❌ Summary '{name}' uses unsupported reducers: {bad}")
+
+    if isinstance(data, str):
+        needed = _source_columns(specs)
+        data = read_table(data, usecols=lambda c: c in needed)
+    else:
+        data = data.copy()
+    for col, (src, fn) in HELPER_COLUMNS.items():
+        if src in data.columns:
+            data[col] = fn(data[src])
+
+    # 1) Shared intermediate: one grouping on all keys + match_s_id
+    cube_keys = list(dict.fromkeys(k for spec in specs.values() for k in spec['keys']))
+    if 'match_s_id' not in cube_keys:
+        cube_keys.append('match_s_id')
+    parts = {}
+    for spec in specs.values():
+        for col, reducer in spec['measures'].values():
+            if reducer != 'nunique':
+                parts.setdefault(col, set()).update(PARTIALS[reducer])
+    cube = data.groupby(cube_keys, dropna=False).agg(
+        **{f"{col}__{p}": (col, p) for col, ps in sorted(parts.items()) for p in sorted(ps)}
+    ).reset_index()
+
+    # 2) Roll each summary up from the cube
+    results = {}
+    for name, spec in specs.items():
+        g = cube.groupby(spec['keys'])
+        out = pd.DataFrame(index=g.size().index)
+        for measure, (col, reducer) in spec['measures'].items():
+            if reducer == 'nunique':
+                out[measure] = g[col].nunique()
+            elif reducer == 'mean':
+                out[measure] = g[f"{col}__sum"].sum() / g[f"{col}__count"].sum()
+            elif reducer == 'min':
+                out[measure] = g[f"{col}__min"].min()
+            elif reducer == 'max':
+                out[measure] = g[f"{col}__max"].max()
+            else:
+                out[measure] = g[f"{col}__{reducer}"].sum()
+        for measure, (num, den, scale) in spec.get('derived', {}).items():
+            out[measure] = out[num] / out[den] * scale
+        results[name] = out.reset_index()
+
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            saved = write_table(results[name], os.path.join(output_dir, spec['output']))
+            print(f"✅ {os.path.basename(saved)} created!")
+    return results
+
+
+if __name__ == "__main__":
+    # Load the combined player-match CSV once and write every registered summary
+    player_file = r"C:\Users\Dharun Kumar\PycharmProjects\cricket\data\combined_player_match_s_format.csv"
+    run_summaries(player_file,
+                  output_dir=r"C:\Users\Dharun Kumar\PycharmProjects\cricket\data")
@@ -0,0 +1,338 @@
+# scripts/golden_check.py
+"""
+Golden-output regression check for the pipeline.
+
+Runs clean_and_save -> create_match_summary -> create_combined_player_match_summary
+-> generate_summaries.run_summaries -> season_summary_stats.compute_all
+-> export_reports on a fixed synthetic delivery feed, times every stage, and compares each output against the
+canonical copy stored in cricket/golden/:
+- outputs are canonicalised first (numbers as float64, text as str, rows sorted),
+  so row order and int-vs-float changes alone are not differences
+- per-column checksums (numbers rounded to CHECKSUM_DECIMALS) give a quick match;
+  columns whose checksum differs are diffed value by value with rtol / atol
+- stage timings are printed next to the ones recorded with the golden outputs
+
+A faster engine is safe to adopt when this passes and its timings are lower.
+
+The stored outputs are a snapshot of the pipeline as it stood when this check was
+added, i.e. after the map-reduce player-match aggregation, the single-scan summary
+engine, the importable season analytics and the venue/toss columns had landed.
+They were not recorded from the original scripts, so they pin the outputs of those
+changes rather than prove them equal to what came before.
+
+    python golden_check.py                       # compare (exit code 1 on differences)
+    python golden_check.py --update              # rewrite cricket/golden/ after an intended change
+    python golden_check.py --rtol 1e-6 --workers 4 --repeat 3
+"""
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+from clean_and_save import clean_and_save
+from create_match_summary import create_match_summary
+from combined_player_match_s_format import create_combined_player_match_summary
+from generate_summaries import run_summaries
+from season_summary_stats import load_player_matches, compute_all
+from export_reports import export_reports
+from storage import read_table
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "golden")
+MANIFEST = "manifest.json"
+CHECKSUM_DECIMALS = 6
+DEFAULT_RTOL = 1e-9
+DEFAULT_ATOL = 1e-9
+# Per-output overrides {output name: (rtol, atol)} for outputs with looser numerics
+TOLERANCES = {}
+
+SEASONS = ['2007/08', '2009', '2010']
+TEAMS = ['Mumbai Indians', 'Chennai Super Kings', 'Delhi Daredevils', 'Kings XI Punjab',
+         'Royal Challengers Bangalore', 'Kolkata Knight Riders']
+VENUES = ['Wankhede Stadium', 'MA Chidambaram Stadium', 'Feroz Shah Kotla', 'Eden Gardens']
+
+
+# ------------------------
+# Synthetic feed
+# ------------------------
+def synthetic_deliveries(matches_per_season: int = 6, seed: int = 0) -> pd.DataFrame:
+    """
+    Raw-feed style deliveries for len(SEASONS) x matches_per_season T20 matches.
+    Deterministic for a given seed; every match gets its own date (no double-headers,
+    so validate_data's date + team fallback stays unambiguous),
+    and a few rows are repeated so the duplicate handling is exercised too.
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    match_id = 1000
+    for season in SEASONS:
+        for m in range(matches_per_season):
+            match_id += 1
+            team1, team2 = rng.choice(TEAMS, 2, replace=False)
+            toss_winner = [team1, team2][rng.integers(2)]
+            match = dict(match_id=match_id, date=f"{season[:4]}-04-{m + 1:02d}", season=season,
+                         event_name='Indian Premier League', match_type='T20',
+                         venue=VENUES[m % len(VENUES)], city='Unknown', player_of_match=f"{team1[:3]}_bat0",
+                         toss_winner=toss_winner, toss_decision=['bat', 'field'][rng.integers(2)],
+                         gender='male', team_type='club', umpire='Umpire')
+            totals, match_rows = {}, []
+            for innings, (bat, bowl) in enumerate([(team1, team2), (team2, team1)], start=1):
+                team_runs = team_balls = wickets = 0
+                for over in range(20):
+                    legal = ball = 0
+                    while legal < 6 and wickets < 10:
+                        ball += 1
+                        r = rng.random()
+                        extra = 'wides' if r < 0.04 else 'legbyes' if r < 0.06 else 'noballs' if r < 0.07 else None
+                        runs_batter = 0 if extra in ('wides', 'legbyes') else int(rng.choice([0, 0, 1, 1, 2, 4, 6]))
+                        runs_extras = 1 if extra else 0
+                        out = kind = None
+                        if extra is None and rng.random() < 0.05:
+                            out, kind = f"{bat[:3]}_bat{wickets}", rng.choice(['caught', 'bowled', 'lbw', 'run out'])
+                        team_runs += runs_batter + runs_extras
+                        if extra not in ('wides', 'noballs'):
+                            legal += 1
+                            team_balls += 1
+                        match_rows.append(dict(match, innings=innings, batting_team=bat, bowling_team=bowl,
+                                               over=over, ball=ball, ball_no=float(f"{over}.{ball}"),
+                                               batter=f"{bat[:3]}_bat{wickets}", non_striker=f"{bat[:3]}_bat{wickets + 1}",
+                                               bowler=f"{bowl[:3]}_bowler{(over % 2) * 3 + (over // 2) % 3}",
+                                               runs_batter=runs_batter, runs_extras=runs_extras,
+                                               runs_total=runs_batter + runs_extras, wicket_kind=kind, player_out=out,
+                                               extra_type=extra, bat_pos=wickets + 1, balls_faced=int(extra != 'wides'),
+                                               team_runs=team_runs, team_balls=team_balls,
+                                               team_wicket=wickets + (out is not None),
+                                               fielders=f"{bowl[:3]}_bowler1" if kind == 'caught' else None))
+                        wickets += out is not None
+                    if wickets >= 10:
+                        break
+                totals[bat] = team_runs
+            winner = team1 if totals[team1] > totals[team2] else team2
+            margin = f"{totals[team1] - totals[team2]} runs" if winner == team1 else f"{10 - wickets} wickets"
+            rows += [dict(row, match_won_by=winner, win_outcome=margin) for row in match_rows]
+    df = pd.DataFrame(rows)
+    return pd.concat([df, df.iloc[::997]], ignore_index=True)
+
+
+# ------------------------
+# Pipeline
+# ------------------------
+def run_pipeline(raw: pd.DataFrame, workers: int = 1, verbose: bool = False) -> tuple:
+    """Run every stage in a scratch directory; returns ({output name: DataFrame}, {stage: seconds})."""
+    outputs, timings = {}, {}
+    with tempfile.TemporaryDirectory() as work:
+        path = lambda name: os.path.join(work, name)
+        raw.to_csv(path('matches.csv'), index=False)
+
+        @contextlib.contextmanager
+        def stage(name):
+            quiet = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+            start = time.perf_counter()
+            with quiet:
+                yield
+            timings[name] = time.perf_counter() - start
+
+        with stage('clean_and_save'):
+            clean_and_save(path('matches.csv'), path('cleaned.csv'))
+
+        with stage('create_match_summary'):
+            create_match_summary(path('cleaned.csv'), path('match_summary.csv'))
+        outputs['match_summary'] = read_table(path('match_summary.csv'))
+
+        with stage('create_combined_player_match_summary'):
+            create_combined_player_match_summary(path('cleaned.csv'), path('match_summary.csv'),
+                                                 path('combined.csv'), workers=workers)
+        outputs['combined'] = read_table(path('combined.csv'), low_memory=False)
+
+        with stage('run_summaries'):
+            summaries = run_summaries(path('combined.csv'))
+        outputs.update({f"summary.{name}": df for name, df in summaries.items()})
+
+        with stage('season_summary_stats'):
+            stats = compute_all(load_player_matches(path('combined.csv')))
+        for name, result in stats.items():
+            parts = result.items() if isinstance(result, dict) else [(None, result)]
+            for part, df in parts:
+                if df is not None:
+                    outputs[".".join(filter(None, ['season', name, part]))] = df
+
+        # End-to-end run of the static exporter on the combined table; the golden pins which pages it writes
+        with stage('export_reports'):
+            reports = export_reports(path('combined.csv'), path('reports'), workers=workers)
+        outputs['reports'] = pd.DataFrame({'report': [os.path.relpath(p, path('reports')).replace(os.sep, '/')
+                                                      for p in reports]})
+    return outputs, timings
+
+
+# ------------------------
+# Canonical form & checksums
+# ------------------------
+def _is_number(s: pd.Series) -> bool:
+    return pd.api.types.is_numeric_dtype(s) or pd.api.types.is_bool_dtype(s)
+
+
+def canonical(df: pd.DataFrame) -> pd.DataFrame:
+    """Numbers as float64, dates / text as str (NaN kept), rows sorted on every column."""
+    out = pd.DataFrame(index=df.index)
+    for c in df.columns:
+        s = df[c]
+        if _is_number(s):
+            out[str(c)] = s.astype('float64')
+        elif pd.api.types.is_datetime64_any_dtype(s):
+            out[str(c)] = s.dt.strftime('%Y-%m-%d %H:%M:%S').str.replace(' 00:00:00', '', regex=False)
+        else:
+            out[str(c)] = s.astype(str).where(s.notna())
+    if out.columns.empty:
+        return out.reset_index(drop=True)
+    order = out.assign(**{c: out[c].round(CHECKSUM_DECIMALS) for c in out.columns if _is_number(out[c])})
+    order = order.sort_values(list(order.columns), na_position='last', kind='mergesort').index
+    return out.loc[order].reset_index(drop=True)
+
+
+def column_checksum(s: pd.Series) -> str:
+    if _is_number(s):
+        s = s.round(CHECKSUM_DECIMALS)
+    else:
+        s = s.fillna('\x00<NA>')
+    return hashlib.sha1(pd.util.hash_pandas_object(s, index=False).to_numpy().tobytes()).hexdigest()[:16]
+
+
+def describe(df: pd.DataFrame) -> dict:
+    return {
+        'rows': len(df),
+        'columns': list(df.columns),
+        'kinds': {c: 'number' if _is_number(df[c]) else 'text' for c in df.columns},
+        'checksums': {c: column_checksum(df[c]) for c in df.columns},
+    }
+
+
+def _file_name(name: str) -> str:
+    return name.replace('/', '_') + '.csv'
+
+
+def write_golden(outputs: dict, timings: dict, golden_dir: str = GOLDEN_DIR) -> None:
+    """Store canonical CSVs plus a manifest of shapes, checksums and the stage timings."""
+    os.makedirs(golden_dir, exist_ok=True)
+    manifest = {'outputs': {}, 'timings': {k: round(v, 4) for k, v in timings.items()}}
+    for name, df in sorted(outputs.items()):
+        df = canonical(df)
+        df.to_csv(os.path.join(golden_dir, _file_name(name)), index=False)
+        manifest['outputs'][name] = describe(df)
+    with open(os.path.join(golden_dir, MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+    print(f"💾 Golden outputs written: {len(outputs)} tables → {golden_dir}")
+
+
+def load_golden(name: str, spec: dict, golden_dir: str = GOLDEN_DIR) -> pd.DataFrame:
+    text = [c for c, k in spec['kinds'].items() if k == 'text']
+    df = pd.read_csv(os.path.join(golden_dir, _file_name(name)), dtype={c: str for c in text})
+    for c, k in spec['kinds'].items():
+        if k == 'number':
+            df[c] = df[c].astype('float64')
+    return df[spec['columns']]
+
+
+# ------------------------
+# Comparison
+# ------------------------
+def diff_frames(new: pd.DataFrame, old: pd.DataFrame, rtol: float = DEFAULT_RTOL, atol: float = DEFAULT_ATOL,
+                columns: list = None) -> list:
+    """Value differences between two canonical frames of the same shape: one entry per differing column."""
+    diffs = []
+    for c in columns if columns is not None else old.columns:
+        a, b = new[c], old[c]
+        if _is_number(a) and _is_number(b):
+            same = np.isclose(a.to_numpy(), b.to_numpy(), rtol=rtol, atol=atol, equal_nan=True)
+        else:
+            a, b = a.astype(object), b.astype(object)
+            same = ((a == b) | (a.isna() & b.isna())).to_numpy()
+        if not same.all():
+            row = int(np.argmin(same))
+            value = lambda v: v.item() if isinstance(v, np.generic) else v
+            diffs.append({'column': c, 'mismatched_rows': int((~same).sum()),
+                          'first_row': row, 'new': value(a.iloc[row]), 'golden': value(b.iloc[row])})
+    return diffs
+
+
+def compare(outputs: dict, golden_dir: str = GOLDEN_DIR, rtol: float = DEFAULT_RTOL,
+            atol: float = DEFAULT_ATOL) -> dict:
+    """{output name: list of problems}; an empty dict means every output matches the golden copy."""
+    with open(os.path.join(golden_dir, MANIFEST), encoding='utf-8') as f:
+        manifest = json.load(f)
+    problems = {}
+    for name in sorted(set(manifest['outputs']) | set(outputs)):
+        spec = manifest['outputs'].get(name)
+        if spec is None:
+            problems[name] = ['new output (not in the golden set)']
+            continue
+        if name not in outputs:
+            problems[name] = ['missing output']
+            continue
+        new = canonical(outputs[name])
+        if list(new.columns) != spec['columns']:
+            problems[name] = [f"columns changed: {list(new.columns)} != {spec['columns']}"]
+            continue
+        if len(new) != spec['rows']:
+            problems[name] = [f"row count changed: {len(new)} != {spec['rows']}"]
+            continue
+        changed = [c for c in new.columns if column_checksum(new[c]) != spec['checksums'][c]]
+        if changed:
+            r, a = TOLERANCES.get(name, (rtol, atol))
+            diffs = diff_frames(new, load_golden(name, spec, golden_dir), r, a, columns=changed)
+            if diffs:
+                problems[name] = [f"{d['column']}: {d['mismatched_rows']} rows differ "
+                                  f"(row {d['first_row']}: {d['new']!r} vs golden {d['golden']!r})" for d in diffs]
+    return problems
+
+
+def print_timings(timings: dict, golden_timings: dict) -> None:
+    print("\n⏱️ Stage timings (s)")
+    for name, seconds in timings.items():
+        before = golden_timings.get(name)
+        ratio = f"  {before / seconds:5.2f}x vs golden ({before:.4f})" if before and seconds else ""
+        print(f"   {name:<40} {seconds:8.4f}{ratio}")
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the pipeline on synthetic data and compare with golden outputs.")
+    parser.add_argument("--update", action="store_true", help="rewrite the golden outputs")
+    parser.add_argument("--golden-dir", default=GOLDEN_DIR)
+    parser.add_argument("--rtol", type=float, default=DEFAULT_RTOL)
+    parser.add_argument("--atol", type=float, default=DEFAULT_ATOL)
+    parser.add_argument("--workers", type=int, default=1, help="workers for the combined player-match step and the report export")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per stage timing (best is kept)")
+    parser.add_argument("--verbose", action="store_true", help="show the pipeline's own output")
+    args = parser.parse_args(argv)
+
+    raw = synthetic_deliveries()
+    print(f"🧪 Synthetic feed: {len(raw)} deliveries, {raw['match_id'].nunique()} matches")
+    outputs, timings = run_pipeline(raw, args.workers, args.verbose)
+    for _ in range(args.repeat - 1):
+        timings = {k: min(v, t) for (k, v), t in zip(timings.items(), run_pipeline(raw, args.workers)[1].values())}
+
+    if args.update:
+        write_golden(outputs, timings, args.golden_dir)
+        print_timings(timings, {})
+        return 0
+
+    problems = compare(outputs, args.golden_dir, args.rtol, args.atol)
+    with open(os.path.join(args.golden_dir, MANIFEST), encoding='utf-8') as f:
+        print_timings(timings, json.load(f).get('timings', {}))
+    if problems:
+        print(f"\n❌ {len(problems)} of {len(outputs)} outputs differ from the golden set:")
+        for name, issues in problems.items():
+            for issue in issues:
+                print(f"   {name}: {issue}")
+        return 1
+    print(f"\n✅ All {len(outputs)} outputs match the golden set (rtol={args.rtol}, atol={args.atol}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
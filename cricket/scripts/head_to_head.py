@@ -0,0 +1,157 @@
+# scripts/head_to_head.py
+"""
+Team head-to-head records built from the match summary (create_match_summary).
+
+Teams, seasons and venues are mapped to integer codes and every match is added
+into a (season, venue, team, team) cube of counts; the overall, per-season and
+per-venue matrices are summed from it once at build time and saved together in
+one .npz. Answering "A vs B" (optionally in a season and/or at a venue) is then
+a single array index, never a filter over the matches.
+
+Cell [i, j] of every matrix reads from team i's side against team j:
+matches played, wins by i, and the win margins behind those wins.
+"""
+import os
+import re
+import numpy as np
+import pandas as pd
+from storage import read_table
+
+# Counts kept per (season, venue, team, opponent) cell
+MEASURES = ['matches', 'wins', 'run_wins', 'run_margin', 'wicket_wins', 'wicket_margin']
+MARGIN_PATTERN = re.compile(r"(\d+)\s*(run|wicket)", re.IGNORECASE)
+
+
+def parse_margin(win_outcome) -> tuple:
+    """'23 runs' -> (23, 'run'), '5 wickets' -> (5, 'wicket'), anything else -> (0, None)."""
+    m = MARGIN_PATTERN.search(str(win_outcome))
+    return (int(m.group(1)), m.group(2).lower()) if m else (0, None)
+
+
+def build_head_to_head(match_summary: pd.DataFrame) -> dict:
+    """Integer-indexed head-to-head arrays keyed '<scope>_<measure>' (scope: all, season, venue, season_venue)."""
+    ms = match_summary.copy()
+    ms['season'] = ms['season'].astype(str)
+    ms = ms[ms['team1'].notna() & ms['team2'].notna() & (ms['team1'] != ms['team2'])]
+
+    teams = np.array(sorted(set(ms['team1'].astype(str)) | set(ms['team2'].astype(str))))
+    season_codes, seasons = pd.factorize(ms['season'], sort=True)
+    venue_codes, venues = pd.factorize(ms['venue'].astype(str), sort=True)
+    a = np.searchsorted(teams, ms['team1'].astype(str))
+    b = np.searchsorted(teams, ms['team2'].astype(str))
+
+    # Winner / loser codes (-1 for no result, ties or an unknown winner)
+    won_by = ms['match_won_by'].astype(str).to_numpy()
+    winner = np.where(won_by == ms['team1'].astype(str).to_numpy(), a,
+                      np.where(won_by == ms['team2'].astype(str).to_numpy(), b, -1))
+    loser = np.where(winner == a, b, a)
+    margins = ms['win_outcome'].map(parse_margin) if 'win_outcome' in ms.columns else pd.Series([(0, None)] * len(ms))
+    margin = np.array([m for m, _ in margins], dtype=np.int64)
+    kind = np.array([k for _, k in margins], dtype=object)
+
+    shape = (len(seasons), len(venues), len(teams), len(teams))
+    cube = {m: np.zeros(shape, dtype=np.int64) for m in MEASURES}
+    np.add.at(cube['matches'], (season_codes, venue_codes, a, b), 1)
+    np.add.at(cube['matches'], (season_codes, venue_codes, b, a), 1)
+
+    decided = winner >= 0
+    idx = (season_codes[decided], venue_codes[decided], winner[decided], loser[decided])
+    np.add.at(cube['wins'], idx, 1)
+    for k in ['run', 'wicket']:
+        sel = kind[decided] == k
+        sub = tuple(i[sel] for i in idx)
+        np.add.at(cube[f'{k}_wins'], sub, 1)
+        np.add.at(cube[f'{k}_margin'], sub, margin[decided][sel])
+
+    arrays = {'teams': teams, 'seasons': np.asarray(seasons, dtype=str), 'venues': np.asarray(venues, dtype=str)}
+    for m, c in cube.items():
+        arrays[f'season_venue_{m}'] = c
+        arrays[f'season_{m}'] = c.sum(axis=1)
+        arrays[f'venue_{m}'] = c.sum(axis=0)
+        arrays[f'all_{m}'] = c.sum(axis=(0, 1))
+    return arrays
+
+
+def create_head_to_head(match_csv: str, output_path: str) -> dict:
+    print("📥 Loading match summary...")
+    ms = read_table(match_csv, dtype={'season': str})
+    print("✅ Loaded:", ms.shape, "rows x columns")
+
+    arrays = build_head_to_head(ms)
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    np.savez_compressed(output_path, **arrays)
+    print(f"💾 Head-to-head matrix saved at: {output_path} "
+          f"({len(arrays['teams'])} teams, {len(arrays['seasons'])} seasons, {len(arrays['venues'])} venues)")
+    return arrays
+
+
+class HeadToHead:
+    """Lookups on the arrays written by create_head_to_head."""
+
+    def __init__(self, arrays: dict):
+        self.arrays = arrays
+        self.teams = arrays['teams'].tolist()
+        self.seasons = arrays['seasons'].tolist()
+        self.venues = arrays['venues'].tolist()
+        self._team = {t: i for i, t in enumerate(self.teams)}
+        self._season = {s: i for i, s in enumerate(self.seasons)}
+        self._venue = {v: i for i, v in enumerate(self.venues)}
+
+    @classmethod
+    def load(cls, path: str) -> "HeadToHead":
+        with np.load(path) as npz:
+            return cls({k: npz[k] for k in npz.files})
+
+    def _cell(self, measure: str, season=None, venue=None) -> np.ndarray:
+        """The team x team matrix of `measure` for the requested scope (None for unknown season/venue)."""
+        if season is not None and str(season) not in self._season:
+            return None
+        if venue is not None and venue not in self._venue:
+            return None
+        if season is not None and venue is not None:
+            return self.arrays[f'season_venue_{measure}'][self._season[str(season)], self._venue[venue]]
+        if season is not None:
+            return self.arrays[f'season_{measure}'][self._season[str(season)]]
+        if venue is not None:
+            return self.arrays[f'venue_{measure}'][self._venue[venue]]
+        return self.arrays[f'all_{measure}']
+
+    def record(self, team_a: str, team_b: str, season=None, venue=None) -> dict:
+        """Head-to-head record of team_a vs team_b (overall, or within a season and/or at a venue)."""
+        if team_a not in self._team or team_b not in self._team:
+            raise KeyError(f"❌ Unknown team: {team_a if team_a not in self._team else team_b}")
+        i, j = self._team[team_a], self._team[team_b]
+        cell = {}
+        for m in MEASURES:
+            mat = self._cell(m, season, venue)
+            cell[m] = (int(mat[i, j]), int(mat[j, i])) if mat is not None else (0, 0)
+
+        def avg(total, n):
+            return round(total / n, 1) if n else None
+
+        matches = cell['matches'][0]
+        wins_a, wins_b = cell['wins']
+        return {
+            'team_a': team_a, 'team_b': team_b, 'matches': matches,
+            'wins_a': wins_a, 'wins_b': wins_b, 'no_result': matches - wins_a - wins_b,
+            'avg_run_margin_a': avg(cell['run_margin'][0], cell['run_wins'][0]),
+            'avg_run_margin_b': avg(cell['run_margin'][1], cell['run_wins'][1]),
+            'avg_wicket_margin_a': avg(cell['wicket_margin'][0], cell['wicket_wins'][0]),
+            'avg_wicket_margin_b': avg(cell['wicket_margin'][1], cell['wicket_wins'][1]),
+        }
+
+    def matrix(self, measure: str = 'wins', season=None, venue=None) -> pd.DataFrame:
+        """Full team x team matrix (rows: team, columns: opponent) for one measure and scope."""
+        if measure not in MEASURES:
+            raise KeyError(f"❌ Unknown measure '{measure}'. Available: {MEASURES}")
+        mat = self._cell(measure, season, venue)
+        if mat is None:
+            mat = np.zeros((len(self.teams), len(self.teams)), dtype=np.int64)
+        return pd.DataFrame(mat, index=self.teams, columns=self.teams)
+
+
+if __name__ == "__main__":
+    match_csv = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/match_summary_final.csv"
+    output_path = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/head_to_head.npz"
+    create_head_to_head(match_csv, output_path)
@@ -0,0 +1,161 @@
+# scripts/leaderboard.py
+"""
+Top-k leaderboards over the player-match data.
+
+The engine pre-aggregates the data once into (player, season, team, venue) cells
+held as NumPy arrays. A query masks the cells by its filters, sums them per
+player with np.bincount and picks the top k with np.argpartition, so no query
+sorts the full player list. Recent queries are kept in a small LRU cache, guarded
+by a lock because one engine is shared by every dashboard session's script thread.
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# metric -> (side, ascending)
+METRICS = {
+    'runs': ('bat', False),
+    'avg_score': ('bat', False),
+    'strike_rate': ('bat', False),
+    'wickets': ('bowl', False),
+    'economy': ('bowl', True),
+}
+CACHE_SIZE = 256
+
+
+class LeaderboardEngine:
+    """Answer leaderboard queries on a prepared dashboard frame (see dashboard_data.prepare_frame)."""
+
+    def __init__(self, df: pd.DataFrame, cache_size: int = CACHE_SIZE):
+        df = df.copy()
+        for c in ['team', 'venue']:
+            if c not in df.columns:
+                df[c] = 'Unknown'
+        for c in ['runs', 'balls', 'wickets', 'balls_bowled', 'runs_conceded']:
+            if c not in df.columns:
+                df[c] = 0
+        df['season'] = df['season'].astype(str)
+
+        cells = df.groupby(['player', 'season', 'team', 'venue'], observed=True).agg(
+            runs=('runs', 'sum'),
+            balls=('balls', 'sum'),
+            wickets=('wickets', 'sum'),
+            balls_bowled=('balls_bowled', 'sum'),
+            runs_conceded=('runs_conceded', 'sum'),
+            innings=('match_s_id', 'nunique'),
+        ).reset_index()
+
+        self.player_codes, self.players = pd.factorize(cells['player'])
+        self.season_codes, self.seasons = pd.factorize(cells['season'], sort=True)
+        self.team_codes, self.teams = pd.factorize(cells['team'], sort=True)
+        self.venue_codes, self.venues = pd.factorize(cells['venue'], sort=True)
+        self.values = {c: cells[c].to_numpy(dtype=float) for c in
+                       ['runs', 'balls', 'wickets', 'balls_bowled', 'runs_conceded', 'innings']}
+        self.n_players = len(self.players)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ------------------------
+    # Filters
+    # ------------------------
+    def _code(self, index: pd.Index, value) -> int:
+        """Position of value in index (-1 when unknown, which matches no cell)."""
+        return index.get_indexer([value])[0]
+
+    def _mask(self, seasons, team, venue) -> np.ndarray:
+        mask = np.ones(len(self.player_codes), dtype=bool)
+        if seasons is not None:
+            if isinstance(seasons, tuple) and len(seasons) == 2:
+                # (first, last) season range, inclusive, in sorted season order
+                lo, hi = (self._code(self.seasons, str(s)) for s in seasons)
+                if lo < 0 or hi < 0:
+                    raise KeyError(f"❌ Unknown season in range {seasons}")
+                mask &= (self.season_codes >= lo) & (self.season_codes <= hi)
+            else:
+                codes = self.seasons.get_indexer([str(s) for s in seasons])
+                mask &= np.isin(self.season_codes, codes[codes >= 0])
+        if team is not None:
+            mask &= self.team_codes == self._code(self.teams, team)
+        if venue is not None:
+            mask &= self.venue_codes == self._code(self.venues, venue)
+        return mask
+
+    def _totals(self, mask: np.ndarray) -> dict:
+        codes = self.player_codes[mask]
+        return {c: np.bincount(codes, weights=v[mask], minlength=self.n_players)
+                for c, v in self.values.items()}
+
+    # ------------------------
+    # Queries
+    # ------------------------
+    def top(self, metric: str, k: int = 10, seasons=None, team: str = None, venue: str = None,
+            min_balls: int = 0, min_innings: int = 0) -> pd.DataFrame:
+        """
+        Top k players for `metric` under the given filters.
+        - seasons: list of seasons, or a (first, last) tuple for an inclusive range
+        - min_balls: balls faced (batting metrics) or bowled (bowling metrics)
+        """
+        if metric not in METRICS:
+            raise KeyError(f"❌ Unknown metric '{metric}'. Available: {list(METRICS)}")
+        if seasons is not None and not isinstance(seasons, tuple):
+            seasons = list(seasons)
+        key = (metric, int(k), tuple(seasons) if isinstance(seasons, list) else seasons,
+               team, venue, int(min_balls), int(min_innings))
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached.copy()
+
+        # The query only reads the engine's arrays, so it runs outside the lock
+        result = self._query(metric, int(k), seasons, team, venue, min_balls, min_innings)
+        with self._lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result.copy()
+
+    def _query(self, metric, k, seasons, team, venue, min_balls, min_innings) -> pd.DataFrame:
+        side, ascending = METRICS[metric]
+        t = self._totals(self._mask(seasons, team, venue))
+        balls = t['balls'] if side == 'bat' else t['balls_bowled']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            value = {
+                'runs': t['runs'],
+                'avg_score': t['runs'] / t['innings'],
+                'strike_rate': t['runs'] / t['balls'] * 100,
+                'wickets': t['wickets'],
+                'economy': t['runs_conceded'] / (t['balls_bowled'] / 6),
+            }[metric]
+
+        eligible = (t['innings'] > 0) & (balls >= min_balls) & (t['innings'] >= min_innings) & np.isfinite(value)
+        idx = np.flatnonzero(eligible)
+        score = value[idx] if ascending else -value[idx]
+        if len(idx) > k > 0:
+            part = np.argpartition(score, k - 1)[:k]
+            idx, score = idx[part], score[part]
+        idx = idx[np.argsort(score, kind='stable')][:k]
+
+        if side == 'bat':
+            out = pd.DataFrame({
+                'player': self.players[idx],
+                'runs_total': t['runs'][idx],
+                'balls_total': t['balls'][idx],
+                'innings': t['innings'][idx].astype(int),
+            })
+            out['avg_score'] = (out['runs_total'] / out['innings']).round(2)
+            out['strike_rate'] = (out['runs_total'] / out['balls_total'] * 100).round(2)
+        else:
+            out = pd.DataFrame({
+                'player': self.players[idx],
+                'wickets_total': t['wickets'][idx],
+                'balls_bowled_total': t['balls_bowled'][idx],
+                'runs_conceded_total': t['runs_conceded'][idx],
+                'innings': t['innings'][idx].astype(int),
+            })
+            out['economy'] = (out['runs_conceded_total'] / (out['balls_bowled_total'] / 6)).round(2)
+        return out.reset_index(drop=True)
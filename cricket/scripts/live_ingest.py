@@ -0,0 +1,215 @@
+# scripts/live_ingest.py
+"""
+Streaming ingestion for live matches.
+Tails an append-only deliveries CSV (or a folder of per-over CSV files),
+cleans each new batch with the same rules as clean_and_save, and keeps
+player / team / match aggregates up to date with O(1) updates per delivery.
+The latest aggregates are written to a JSON snapshot the dashboard polls.
+Each cleaned batch also goes through validate_data's per-delivery checks;
+violations are counted in the snapshot. Checks see one batch at a time, so a
+problem spanning two batches (e.g. an over split across files) can go unreported.
+"""
+import glob
+import io
+import json
+import os
+import time
+
+import pandas as pd
+
+from clean_and_save import clean_deliveries, reorder_columns
+from validate_data import DELIVERY_COLS, check_partition
+
+# Values that mean "missing" after cleaning (clean_deliveries turns NaN into 'nan')
+MISSING_VALUES = {'', 'nan', 'NaN', 'None', 'NaT'}
+ILLEGAL_EXTRAS = {'wides', 'noballs'}
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and value != value) or str(value) in MISSING_VALUES
+
+
+# ------------------------
+# Sources
+# ------------------------
+def tail_file(path: str, poll_interval: float = 1.0, stop_after_idle: float = None):
+    """
+    Yield DataFrames of complete rows appended to `path` since the last read.
+    The header is read once; a trailing partial line is held back until it is complete.
+    - stop_after_idle: stop once no new rows arrived for this many seconds (None = run forever).
+    """
+    header, offset, pending = None, 0, b''
+    idle_since = time.time()
+    while True:
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                chunk = f.read()
+                offset = f.tell()
+            data = pending + chunk
+            cut = data.rfind(b'\n') + 1
+            complete, pending = data[:cut], data[cut:]
+            if complete:
+                if header is None:
+                    header, _, complete = complete.partition(b'\n')
+                    header += b'\n'
+                if complete.strip():
+                    idle_since = time.time()
+                    yield pd.read_csv(io.BytesIO(header + complete), low_memory=False)
+        if stop_after_idle is not None and time.time() - idle_since > stop_after_idle:
+            return
+        time.sleep(poll_interval)
+
+
+def tail_directory(folder: str, pattern: str = "*.csv", poll_interval: float = 1.0,
+                   stop_after_idle: float = None):
+    """Yield one DataFrame per new file in `folder` (e.g. one CSV per over), in name order."""
+    seen = set()
+    idle_since = time.time()
+    while True:
+        new_files = sorted(f for f in glob.glob(os.path.join(folder, pattern)) if f not in seen)
+        for f in new_files:
+            seen.add(f)
+            idle_since = time.time()
+            yield pd.read_csv(f, low_memory=False)
+        if stop_after_idle is not None and time.time() - idle_since > stop_after_idle:
+            return
+        time.sleep(poll_interval)
+
+
+# ------------------------
+# Incremental aggregates
+# ------------------------
+class LiveAggregates:
+    """
+    Running totals keyed the same way as the batch summaries:
+    - batting: (match_id, player, team) -> runs, balls, outs
+    - bowling: (match_id, player, team) -> balls_bowled, runs_conceded, wickets
+    - teams:   (match_id, team) -> runs, extras, wickets, legal balls
+    - matches: match_id -> season, venue, teams, last update
+    Every delivery touches a fixed number of dict entries, so updates are O(1).
+    """
+
+    def __init__(self):
+        self.batting = {}
+        self.bowling = {}
+        self.teams = {}
+        self.matches = {}
+        self.deliveries = 0
+        self.violations = []
+
+    def update(self, d: dict) -> None:
+        match_id = d.get('match_id')
+        bat_team, bowl_team = d.get('batting_team'), d.get('bowling_team')
+        runs_batter = int(d.get('runs_batter', 0))
+        runs_extras = int(d.get('runs_extras', 0))
+        runs_total = int(d.get('runs_total', 0))
+        out = 0 if _is_missing(d.get('player_out')) else 1
+        legal = 0 if d.get('extra_type') in ILLEGAL_EXTRAS else 1
+
+        bat = self.batting.setdefault((match_id, d.get('batter'), bat_team), [0, 0, 0])
+        bat[0] += runs_batter
+        bat[1] += 1
+        bat[2] += out
+
+        bowl = self.bowling.setdefault((match_id, d.get('bowler'), bowl_team), [0, 0, 0])
+        bowl[0] += 1
+        bowl[1] += runs_total
+        bowl[2] += out
+
+        team = self.teams.setdefault((match_id, bat_team), [0, 0, 0, 0])
+        team[0] += runs_total
+        team[1] += runs_extras
+        team[2] += out
+        team[3] += legal
+
+        match = self.matches.setdefault(match_id, {
+            'match_id': match_id, 'season': d.get('season'), 'venue': d.get('venue'),
+            'teams': [], 'deliveries': 0,
+        })
+        if bat_team not in match['teams']:
+            match['teams'].append(bat_team)
+        match['deliveries'] += 1
+        match['innings'] = d.get('innings')
+        match['over'] = d.get('over')
+        match['ball'] = d.get('ball')
+        match['updated_at'] = time.time()
+        self.deliveries += 1
+
+    def update_frame(self, df: pd.DataFrame, validate: bool = False) -> int:
+        """Clean a raw batch with the batch rules and fold every delivery in (validating the batch first)."""
+        df = reorder_columns(clean_deliveries(df))
+        if validate and len(df) and all(c in df.columns for c in DELIVERY_COLS):
+            self.violations += check_partition(df)[0]
+        for d in df.to_dict('records'):
+            self.update(d)
+        return len(df)
+
+    def snapshot(self) -> dict:
+        """Aggregates as plain records (JSON serializable, dashboard friendly)."""
+        batting = [
+            {'match_id': k[0], 'player': k[1], 'team': k[2], 'runs': v[0], 'balls': v[1], 'outs': v[2],
+             'strike_rate': round(v[0] / v[1] * 100, 2) if v[1] else 0}
+            for k, v in self.batting.items()
+        ]
+        bowling = [
+            {'match_id': k[0], 'player': k[1], 'team': k[2], 'balls_bowled': v[0], 'runs_conceded': v[1],
+             'wickets': v[2], 'economy': round(v[1] / v[0] * 6, 2) if v[0] else 0}
+            for k, v in self.bowling.items()
+        ]
+        teams = [
+            {'match_id': k[0], 'team': k[1], 'runs': v[0], 'extras': v[1], 'wickets': v[2],
+             'balls': v[3], 'overs': f"{v[3] // 6}.{v[3] % 6}"}
+            for k, v in self.teams.items()
+        ]
+        return {
+            'generated_at': time.time(),
+            'deliveries': self.deliveries,
+            'violations': len(self.violations),
+            'matches': list(self.matches.values()),
+            'teams': teams,
+            'batting': batting,
+            'bowling': bowling,
+        }
+
+    def write_snapshot(self, path: str) -> None:
+        """Write the snapshot atomically so a polling reader never sees a partial file."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, default=str)
+        os.replace(tmp, path)
+
+
+def load_snapshot(path: str) -> dict:
+    """Read a snapshot written by LiveAggregates.write_snapshot (None if not there yet)."""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def run_live(source: str, snapshot_path: str, poll_interval: float = 1.0,
+             stop_after_idle: float = None, validate: bool = True) -> LiveAggregates:
+    """Tail `source` (file or folder) and refresh the snapshot after every batch."""
+    if os.path.isdir(source):
+        batches = tail_directory(source, poll_interval=poll_interval, stop_after_idle=stop_after_idle)
+    else:
+        batches = tail_file(source, poll_interval=poll_interval, stop_after_idle=stop_after_idle)
+
+    aggs = LiveAggregates()
+    print(f"📡 Watching {source} ...")
+    for batch in batches:
+        before = len(aggs.violations)
+        n = aggs.update_frame(batch, validate=validate)
+        aggs.write_snapshot(snapshot_path)
+        print(f"⚡ +{n} deliveries (total {aggs.deliveries}) → {snapshot_path}")
+        if len(aggs.violations) > before:
+            print(f"⚠️ {len(aggs.violations) - before} validation violations in this batch")
+    return aggs
+
+
+if __name__ == "__main__":
+    live_source = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/live/deliveries.csv"
+    snapshot_file = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/live_snapshot.json"
+    run_live(live_source, snapshot_file)
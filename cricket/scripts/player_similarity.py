@@ -0,0 +1,98 @@
+# scripts/player_similarity.py
+"""
+"Players like X": nearest neighbours over per-player career feature vectors
+built from the combined player-match data.
+
+Features are standardised (z-scores, clipped) into one dense float32 matrix
+with unit-length rows, so cosine similarity for a query is a single
+matrix-vector product and the top k come from np.argpartition, with no
+pairwise Python loops however many players there are.
+"""
+import numpy as np
+import pandas as pd
+from storage import read_table
+
+# Balls faced / bowled below which a player's batting / bowling rates are treated as unknown
+MIN_BALLS = 60
+# z-scores are clipped to this range so a few extreme ratios don't dominate the distance
+Z_CLIP = 3.0
+# Optional phase splits: used when the data carries e.g. runs_powerplay / balls_powerplay
+PHASES = ['powerplay', 'middle', 'death']
+
+
+def player_features(df: pd.DataFrame, min_balls: int = MIN_BALLS) -> pd.DataFrame:
+    """One row per player of career rates (NaN where the player hasn't batted/bowled enough)."""
+    df = df.copy()
+    for c in ['runs', 'balls', 'outs', 'wickets', 'balls_bowled', 'runs_conceded']:
+        df[c] = pd.to_numeric(df[c], errors='coerce').fillna(0) if c in df.columns else 0
+    sums = ['runs', 'balls', 'outs', 'wickets', 'balls_bowled', 'runs_conceded']
+    phase_cols = [c for p in PHASES for c in
+                  (f'runs_{p}', f'balls_{p}', f'runs_conceded_{p}', f'balls_bowled_{p}') if c in df.columns]
+    g = df.groupby('player')
+    t = g[sums + phase_cols].sum()
+    t['innings'] = g['match_s_id'].nunique()
+
+    bats = t['balls'] >= min_balls
+    bowls = t['balls_bowled'] >= min_balls
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f = pd.DataFrame(index=t.index)
+        f['strike_rate'] = (t['runs'] / t['balls'] * 100).where(bats)
+        f['batting_average'] = (t['runs'] / t['outs'].where(t['outs'] > 0)).where(bats)
+        f['balls_per_innings'] = t['balls'] / t['innings']
+        f['economy'] = (t['runs_conceded'] / (t['balls_bowled'] / 6)).where(bowls)
+        f['bowling_average'] = (t['runs_conceded'] / t['wickets'].where(t['wickets'] > 0)).where(bowls)
+        f['bowling_strike_rate'] = (t['balls_bowled'] / t['wickets'].where(t['wickets'] > 0)).where(bowls)
+        f['balls_bowled_per_innings'] = t['balls_bowled'] / t['innings']
+        for p in PHASES:
+            if f'runs_{p}' in t.columns and f'balls_{p}' in t.columns:
+                f[f'strike_rate_{p}'] = (t[f'runs_{p}'] / t[f'balls_{p}'] * 100).where(t[f'balls_{p}'] > 0)
+            if f'runs_conceded_{p}' in t.columns and f'balls_bowled_{p}' in t.columns:
+                f[f'economy_{p}'] = (t[f'runs_conceded_{p}'] / (t[f'balls_bowled_{p}'] / 6)).where(t[f'balls_bowled_{p}'] > 0)
+    f['innings'] = t['innings']
+    return f[bats | bowls]
+
+
+def normalize(features: pd.DataFrame) -> np.ndarray:
+    """Clipped z-scores (missing -> 0, the feature mean) as a float32 matrix with unit-length rows."""
+    x = features.to_numpy(dtype=np.float64)
+    x[~np.isfinite(x)] = np.nan
+    mean = np.nanmean(x, axis=0)
+    std = np.nanstd(x, axis=0)
+    std[~(std > 0)] = 1.0
+    z = np.clip((x - mean) / std, -Z_CLIP, Z_CLIP)
+    z = np.nan_to_num(z, nan=0.0).astype(np.float32)
+    norms = np.linalg.norm(z, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return z / norms
+
+
+class SimilarityIndex:
+    """k-nearest-neighbour player search by cosine similarity of normalised features."""
+
+    def __init__(self, df: pd.DataFrame, min_balls: int = MIN_BALLS):
+        self.features = player_features(df, min_balls)
+        # innings is shown with the results but not used as a similarity feature
+        self.matrix = normalize(self.features.drop(columns='innings'))
+        self.players = self.features.index.tolist()
+        self._pos = {p: i for i, p in enumerate(self.players)}
+
+    def similar(self, player: str, k: int = 10) -> pd.DataFrame:
+        """The k players most similar to `player` (excluding itself), best first."""
+        if player not in self._pos:
+            raise KeyError(f"❌ Unknown or ineligible player: {player}")
+        i = self._pos[player]
+        sim = self.matrix @ self.matrix[i]
+        sim[i] = -np.inf
+        k = max(min(k, len(sim) - 1), 0)
+        top = np.argpartition(-sim, k - 1)[:k] if k else np.array([], dtype=np.int64)
+        top = top[np.argsort(-sim[top], kind='stable')]
+        out = self.features.iloc[top].round(2)
+        out.insert(0, 'similarity', sim[top].round(3))
+        return out.reset_index()
+
+
+if __name__ == "__main__":
+    player_file = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/combined_player_match_s_format.csv"
+    index = SimilarityIndex(read_table(player_file, low_memory=False))
+    print(f"✅ Indexed {len(index.players)} players x {index.matrix.shape[1]} features")
+    print(index.similar(index.players[0]))
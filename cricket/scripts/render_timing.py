@@ -0,0 +1,136 @@
+# scripts/render_timing.py
+"""
+Hot-path timing for dashboard reruns.
+
+The dashboard marks the start of each section (data load, aggregations, each
+chart block, ...) and routes st.plotly_chart through RenderTimer.wrap, so every
+rerun records how long each section and each chart took. Records go to a
+rolling JSON-lines log; summarize() turns it into p50/p95 per section for the
+debug panel (and for deciding what to precompute next).
+Standard library only, so it can be imported before pandas.
+"""
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+
+RENDER_LOG = "data/render_timings.jsonl"
+# The log is trimmed back to the newest MAX_RECORDS lines once it grows past MAX_LOG_BYTES
+MAX_RECORDS = 20000
+MAX_LOG_BYTES = 4 * 1024 * 1024
+
+
+class RenderTimer:
+    """Collect (section, seconds) timings for one script run."""
+
+    def __init__(self, log_path: str = RENDER_LOG, max_records: int = MAX_RECORDS):
+        self.log_path = log_path
+        self.max_records = max_records
+        self.run_id = uuid.uuid4().hex[:8]
+        self.timings = []
+        self._current = None
+        self._started = None
+        self._charts = {}
+
+    # ------------------------
+    # Sections
+    # ------------------------
+    def mark(self, name: str):
+        """End the running section (if any) and start timing `name`."""
+        now = time.perf_counter()
+        if self._current is not None:
+            self.timings.append((self._current, now - self._started))
+        self._current, self._started = name, now
+
+    @contextmanager
+    def section(self, name: str):
+        """Time a block on its own (may sit inside a marked section)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings.append((name, time.perf_counter() - start))
+
+    def wrap(self, fn, prefix: str = "chart"):
+        """
+        Timed version of a render call such as st.plotly_chart.
+        Calls are labelled by section and position ("chart: team charts #2"), not by
+        figure title, so titles that embed the selection still aggregate in the log.
+        """
+        def timed(*args, **kwargs):
+            n = self._charts[self._current] = self._charts.get(self._current, 0) + 1
+            with self.section(f"{prefix}: {self._current} #{n}"):
+                return fn(*args, **kwargs)
+        return timed
+
+    # ------------------------
+    # Log
+    # ------------------------
+    def finish(self) -> list:
+        """Close the running section, append this run to the rolling log and return its timings."""
+        self.mark(None)
+        total = sum(s for name, s in self.timings if not name.startswith("chart: "))
+        self.timings.append(("total", total))
+        ts = time.time()
+        try:
+            os.makedirs(os.path.dirname(self.log_path) or ".", exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                for name, seconds in self.timings:
+                    f.write(json.dumps({"ts": ts, "run": self.run_id, "section": name,
+                                        "seconds": round(seconds, 6)}) + "\n")
+            if os.path.getsize(self.log_path) > MAX_LOG_BYTES:
+                trim_log(self.log_path, self.max_records)
+        except OSError:
+            pass  # read-only data dir: timings still shown in the panel
+        return self.timings
+
+
+def read_log(log_path: str = RENDER_LOG, max_records: int = MAX_RECORDS) -> list:
+    """Newest max_records timing records from the log."""
+    try:
+        with open(log_path, encoding="utf-8") as f:
+            lines = f.readlines()[-max_records:]
+    except OSError:
+        return []
+    records = []
+    for line in lines:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue  # partially written line
+    return records
+
+
+def trim_log(log_path: str, max_records: int = MAX_RECORDS):
+    records = read_log(log_path, max_records)
+    tmp = log_path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        for r in records:
+            f.write(json.dumps(r) + "\n")
+    os.replace(tmp, log_path)
+
+
+def percentile(values: list, q: float) -> float:
+    """Linear-interpolated percentile (q in 0..100) of a non-empty list."""
+    values = sorted(values)
+    pos = (len(values) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+
+def summarize(records: list) -> list:
+    """Per-section runs, last, p50 and p95 seconds, slowest p95 first."""
+    by_section = {}
+    for r in records:
+        by_section.setdefault(r["section"], []).append(r["seconds"])
+    rows = [{"section": name, "runs": len(v), "last_s": round(v[-1], 4),
+             "p50_s": round(percentile(v, 50), 4), "p95_s": round(percentile(v, 95), 4)}
+            for name, v in by_section.items()]
+    return sorted(rows, key=lambda r: r["p95_s"], reverse=True)
+
+
+if __name__ == "__main__":
+    for row in summarize(read_log("C:/Users/Dharun Kumar/PycharmProjects/cricket/" + RENDER_LOG)):
+        print(f"{row['section']:<45} runs={row['runs']:<6} p50={row['p50_s']:.4f}s p95={row['p95_s']:.4f}s")
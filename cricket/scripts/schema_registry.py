@@ -0,0 +1,185 @@
+# scripts/schema_registry.py
+"""
+Source-schema registry: resolve a feed's column aliases once per header.
+
+The first time a file with a given header is loaded for a profile (dashboard,
+season summary, team-season summary), its header is fingerprinted, aliases are
+resolved to canonical names, derivations (e.g. season from match_s_id) are
+chosen, and the column dtypes are sampled. The result is stored as a compiled
+read plan in schema_registry.json in the cache directory (CRICKET_CACHE_DIR,
+default ~/.cache/cricket), never next to the data. Later loads with the same header and
+profile skip all of that and read just the planned columns with fixed dtypes.
+"""
+import hashlib
+import json
+import os
+import pandas as pd
+from storage import read_header, read_table, resolve_path
+
+REGISTRY_FILE = "schema_registry.json"
+CACHE_DIR = os.environ.get("CRICKET_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "cricket"))
+# Rows read to pick the dtypes when a plan is first compiled
+SAMPLE_ROWS = 5000
+
+# Canonical column -> accepted source names (first match wins)
+ALIASES = {
+    "player": ["player", "batter", "batsman", "player_name"],
+    "team": ["team", "team_name", "batting_team", "bat_team"],
+    "match_s_id": ["match_s_id", "match_s", "s_match_id"],
+    "match_id": ["match_id", "match"],
+    "season": ["season", "Season", "year", "season_year"],
+    "runs": ["runs", "runs_batter", "batter_runs", "player_runs"],
+    "balls": ["balls", "balls_faced", "batter_balls"],
+    "wickets": ["wickets", "bowler_wicket", "bowler_wickets"],
+    "balls_bowled": ["balls_bowled", "balls_bowled_by", "bowler_balls"],
+    "runs_conceded": ["runs_conceded", "runs_bowler", "conceded"],
+    "match_won_by": ["match_won_by", "winner", "match_winner"],
+    "venue": ["venue", "ground", "stadium"],
+    "city": ["city"],
+}
+
+# Per consumer: which aliases apply, which canonical columns to read (None = all),
+# which are required, and how to derive missing ones from others
+PROFILES = {
+    "dashboard": {
+        "aliases": ALIASES,
+        "columns": None,
+        "required": [],
+        "derive": {"season": ("match_s_id", 4)},
+    },
+    "season_summary": {
+        "aliases": {"team": ["team", "bat_team", "batting_team"]},
+        "columns": None,
+        "required": ["team"],
+        "derive": {},
+        "parse_dates": ["date"],
+    },
+    "team_season": {
+        "aliases": {c: ALIASES[c] for c in ["team", "season", "match_s_id", "runs", "wickets"]},
+        "columns": ["season", "team", "match_s_id", "runs", "wickets"],
+        "required": ["team", "match_s_id"],
+        "derive": {"season": ("match_s_id", 4)},
+    },
+}
+
+_loaded = {}
+
+
+def header_fingerprint(columns) -> str:
+    return hashlib.sha1("\x1f".join(map(str, columns)).encode("utf-8")).hexdigest()[:16]
+
+
+def _profile_fingerprint(profile: dict) -> str:
+    return hashlib.sha1(json.dumps(profile, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def resolve_aliases(columns, aliases: dict = ALIASES) -> dict:
+    """{source column: canonical name} for the first accepted alias of each canonical column."""
+    cols_lower = {c.lower(): c for c in columns}
+    rename_map = {}
+    for target, possibles in aliases.items():
+        for name in possibles:
+            if name.lower() in cols_lower:
+                rename_map[cols_lower[name.lower()]] = target
+                break
+    return rename_map
+
+
+def compile_plan(path: str, profile: str) -> dict:
+    """Infer the read plan for `path` under `profile` (header, aliases, derivations, dtypes)."""
+    spec = PROFILES[profile]
+    sample = read_table(path, nrows=SAMPLE_ROWS, low_memory=False)
+    rename = resolve_aliases(sample.columns, spec["aliases"])
+    canonical = {rename.get(c, c): c for c in sample.columns}
+
+    derive = {}
+    for target, (source, width) in spec["derive"].items():
+        if target not in canonical and source in canonical:
+            derive[target] = {"from": source, "slice": width}
+    missing = [c for c in spec["required"] if c not in canonical and c not in derive]
+    if missing:
+        raise KeyError(f"❌ {path}: no column for {missing} (accepted names: "
+                       f"{ {c: spec['aliases'].get(c, [c]) for c in missing} })")
+
+    wanted = spec["columns"]
+    if wanted is None:
+        usecols = list(sample.columns)
+    else:
+        needed = set(wanted) | {d["from"] for d in derive.values()}
+        usecols = [canonical[c] for c in canonical if c in needed]
+
+    parse_dates = [c for c in spec.get("parse_dates", []) if c in usecols]
+    dtypes = {}
+    for c in usecols:
+        if c in parse_dates:
+            continue
+        if pd.api.types.is_integer_dtype(sample[c]) or pd.api.types.is_float_dtype(sample[c]):
+            dtypes[c] = str(sample[c].dtype)
+        else:
+            dtypes[c] = "object"
+
+    return {
+        "profile": profile,
+        "profile_fingerprint": _profile_fingerprint(spec),
+        "header_fingerprint": header_fingerprint(sample.columns),
+        "usecols": usecols,
+        "dtypes": dtypes,
+        "parse_dates": parse_dates,
+        "rename": {k: v for k, v in rename.items() if k in usecols and k != v},
+        "derive": derive,
+    }
+
+
+def _read_registry(registry_path: str) -> dict:
+    if registry_path not in _loaded:
+        try:
+            with open(registry_path, encoding="utf-8") as f:
+                _loaded[registry_path] = json.load(f)
+        except (OSError, ValueError):
+            _loaded[registry_path] = {}
+    return _loaded[registry_path]
+
+
+def _write_registry(registry_path: str, registry: dict):
+    try:
+        os.makedirs(os.path.dirname(registry_path) or ".", exist_ok=True)
+        tmp = registry_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(registry, f, indent=1, sort_keys=True)
+        os.replace(tmp, registry_path)
+    except OSError:
+        pass  # read-only data dir: the plan still lives in memory for this process
+
+
+def get_plan(path: str, profile: str, registry_path: str = None) -> dict:
+    """The compiled plan for this file's header + profile, compiling and registering it on first sight."""
+    path = resolve_path(path)
+    registry_path = registry_path or os.path.join(CACHE_DIR, REGISTRY_FILE)
+    header = read_header(path)
+    key = f"{header_fingerprint(header)}:{profile}"
+    registry = _read_registry(registry_path)
+    plan = registry.get(key)
+    if plan is None or plan.get("profile_fingerprint") != _profile_fingerprint(PROFILES[profile]):
+        plan = compile_plan(path, profile)
+        registry[key] = plan
+        _write_registry(registry_path, registry)
+        print(f"🧭 Registered schema {key} for {os.path.basename(path)}")
+    return plan
+
+
+def read_source(path: str, profile: str, registry_path: str = None) -> pd.DataFrame:
+    """Read `path` with its compiled plan: planned columns, fixed dtypes, canonical names, derivations."""
+    path = resolve_path(path)
+    plan = get_plan(path, profile, registry_path)
+    read = dict(usecols=plan["usecols"], parse_dates=plan["parse_dates"] or False)
+    try:
+        df = read_table(path, dtype=plan["dtypes"], **read)
+    except (ValueError, TypeError):
+        # Rows past the sample don't fit the planned dtypes (e.g. gaps in an int column)
+        print(f"⚠️ {os.path.basename(path)} does not match its planned dtypes; reading with inference.")
+        df = read_table(path, low_memory=False, **read)
+    df = df[plan["usecols"]].rename(columns=plan["rename"])
+    for target, d in plan["derive"].items():
+        df[target] = df[d["from"]].astype(str).str[:d["slice"]]
+    wanted = PROFILES[profile]["columns"]
+    return df[[c for c in wanted if c in df.columns]] if wanted else df
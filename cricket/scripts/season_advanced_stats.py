@@ -1,15 +1,17 @@
 import os
-import pandas as pd
+from generate_summaries import run_summaries
+from storage import read_table, resolve_path, write_table
 
 # Paths
 data_folder = os.path.join(os.path.dirname(__file__), "../data")
-latest_csv = os.path.join(data_folder, "season_summary.csv")
+latest_csv = resolve_path(os.path.join(data_folder, "combined_player_match_s_format.csv"))
 
 # Load CSV
 if not os.path.exists(latest_csv):
     raise FileNotFoundError(f"❌ CSV not found: {latest_csv}")
 
-data = pd.read_csv(latest_csv)
+# Only the columns the summary needs are read
+data = read_table(latest_csv, usecols=lambda c: c in {'season', 'match_s_id', 'runs', 'wickets'})
 print(f"📁 Using latest CSV file: {latest_csv}")
 print(f"✅ Data loaded: {data.shape}")
 
@@ -18,19 +20,18 @@ if data.empty:
     raise ValueError(f"❌ CSV is empty: {latest_csv}. Cannot compute advanced stats.")
 
 # Check required columns
-required_cols = ['runs', 'wickets']
+required_cols = ['season', 'match_s_id', 'runs', 'wickets']
 for col in required_cols:
     if col not in data.columns:
         raise KeyError(f"❌ Column '{col}' is required in your dataset!")
 
 # Compute advanced stats
-# Example: runs per match, wickets per match
-data['runs_per_match'] = data['runs'] / data['match_s_id']
-data['wickets_per_match'] = data['wickets'] / data['match_s_id']
+# Runs per match, wickets per match (declared in generate_summaries.SUMMARY_SPECS)
+data = run_summaries(data, names=['season_advanced_stats'])['season_advanced_stats']
 
 # Save
 output_folder = os.path.join(data_folder, "plots")
 os.makedirs(output_folder, exist_ok=True)
 output_file = os.path.join(output_folder, "season_advanced_stats.csv")
-data.to_csv(output_file, index=False)
+output_file = write_table(data, output_file)
 print(f"🎯 Advanced season stats saved successfully at: {output_file}")
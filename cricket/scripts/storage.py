@@ -0,0 +1,135 @@
+# scripts/storage.py
+"""
+Data-at-rest for the pipeline's tables.
+
+Outputs are written as Parquet with dictionary-encoded string columns (player,
+team and venue names are stored once per column chunk) and a configurable
+codec (zstd by default, lz4/snappy/gzip also work). Paths keep their familiar
+.csv names in the scripts: write_table swaps the extension for the configured
+format, and read_table / resolve_path find whichever version of a table is on
+disk (the newer one when both exist), so CSV inputs keep working unchanged.
+
+Configuration (environment variables or write_table arguments):
+    CRICKET_STORAGE_FORMAT = parquet | csv   (default parquet)
+    CRICKET_STORAGE_CODEC  = zstd | lz4 | snappy | gzip | none   (default zstd)
+
+pandas / pyarrow are only imported on first read or write, so the dashboard
+shell can resolve its data path before loading either.
+"""
+import os
+
+DEFAULT_FORMAT = os.environ.get("CRICKET_STORAGE_FORMAT", "parquet")
+DEFAULT_CODEC = os.environ.get("CRICKET_STORAGE_CODEC", "zstd")
+EXTENSIONS = {"parquet": ".parquet", "csv": ".csv"}
+# Text that read_csv would turn back into NaN (e.g. "nan" left by astype(str)) is stored as null
+NA_STRINGS = ["", "nan", "NaN", "NA", "N/A", "<NA>", "None", "null", "NULL"]
+
+
+def _with_ext(path: str, fmt: str) -> str:
+    return os.path.splitext(path)[0] + EXTENSIONS[fmt]
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def resolve_path(path: str) -> str:
+    """The on-disk version of a table: `path` itself or its .parquet/.csv twin, newest first."""
+    candidates = [p for p in {path, *(_with_ext(path, f) for f in EXTENSIONS)} if os.path.exists(p)]
+    if not candidates:
+        return path
+    return max(candidates, key=os.path.getmtime)
+
+
+def is_parquet(path: str) -> bool:
+    return path.endswith(EXTENSIONS["parquet"])
+
+
+def write_table(df, path: str, fmt: str = None, codec: str = None) -> str:
+    """Write df in the configured format next to `path` (extension adjusted); returns the path written."""
+    fmt = fmt or DEFAULT_FORMAT
+    codec = codec or DEFAULT_CODEC
+    if fmt == "parquet" and not _has_pyarrow():
+        print("⚠️ pyarrow not installed: writing CSV instead of Parquet.")
+        fmt = "csv"
+    out = _with_ext(path, fmt)
+    os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+    if fmt == "csv":
+        df.to_csv(out, index=False)
+        return out
+
+    # Text columns go in as strings (mixed object columns would not convert) and get dictionary pages
+    df = df.copy()
+    text_cols = [c for c in df.columns if df[c].dtype == object]
+    for c in text_cols:
+        text = df[c].where(df[c].isna(), df[c].astype(str))
+        df[c] = text.where(~text.isin(NA_STRINGS))
+    df.columns = [str(c) for c in df.columns]
+    df.to_parquet(out, index=False, engine="pyarrow",
+                  compression=None if codec == "none" else codec,
+                  use_dictionary=[str(c) for c in text_cols] or False)
+    return out
+
+
+def read_header(path: str) -> list:
+    """Column names without reading any rows."""
+    path = resolve_path(path)
+    if os.path.isdir(path):
+        from warehouse import partition_header
+        return partition_header(path)
+    if is_parquet(path):
+        import pyarrow.parquet as pq
+        return list(pq.read_schema(path).names)
+    import pandas as pd
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+def read_table(path: str, usecols=None, dtype=None, parse_dates=None, nrows: int = None, **csv_kwargs):
+    """
+    Read a table written by write_table (or any CSV) with read_csv-style options.
+    - usecols: list of names or a callable on the name, as in pd.read_csv
+    - dtype / parse_dates are applied after a Parquet read so callers see the same frame
+    - a directory is read as a partitioned warehouse table (warehouse.read_partitions);
+      pass leagues= / formats= / seasons= to prune partitions
+    """
+    import pandas as pd
+
+    path = resolve_path(path)
+    if os.path.isdir(path):
+        from warehouse import read_partitions
+        return read_partitions(path, usecols=usecols, dtype=dtype, parse_dates=parse_dates, nrows=nrows, **csv_kwargs)
+    if not is_parquet(path):
+        return pd.read_csv(path, usecols=usecols, dtype=dtype, parse_dates=parse_dates or False,
+                           nrows=nrows, **csv_kwargs)
+
+    columns = None
+    if usecols is not None:
+        names = read_header(path)
+        columns = [c for c in names if usecols(c)] if callable(usecols) else [c for c in names if c in set(usecols)]
+        missing = [] if callable(usecols) else [c for c in usecols if c not in names]
+        if missing:
+            raise ValueError(f"Usecols do not match columns, columns expected but not found: {missing}")
+    if nrows is not None:
+        import pyarrow.parquet as pq
+        batch = next(pq.ParquetFile(path).iter_batches(batch_size=max(nrows, 1), columns=columns), None)
+        df = batch.to_pandas() if batch is not None else pd.read_parquet(path, columns=columns).iloc[:0]
+        df = df.head(nrows)
+    else:
+        df = pd.read_parquet(path, columns=columns, engine="pyarrow")
+
+    # Missing text comes back as None; use NaN as read_csv does
+    for c in df.columns[df.dtypes == object]:
+        df[c] = df[c].where(df[c].notna(), float("nan"))
+    if dtype is not None:
+        types = dtype if isinstance(dtype, dict) else {c: dtype for c in df.columns}
+        for c, t in types.items():
+            if c in df.columns:
+                df[c] = df[c].where(df[c].isna(), df[c].astype(str)) if t in (str, "str") else df[c].astype(t)
+    for c in parse_dates or []:
+        if c in df.columns:
+            df[c] = pd.to_datetime(df[c], errors="coerce")
+    return df
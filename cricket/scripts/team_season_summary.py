@@ -1,12 +1,14 @@
 import os
 import glob
-import pandas as pd
+from generate_summaries import run_summaries
+from schema_registry import read_source
+from storage import write_table
 
 # Folder containing player-level CSVs
 data_folder = os.path.join(os.path.dirname(__file__), "data")
 
-# Find CSVs
-csv_files = glob.glob(os.path.join(data_folder, "*.csv"))
+# Find CSV / Parquet tables
+csv_files = glob.glob(os.path.join(data_folder, "*.csv")) + glob.glob(os.path.join(data_folder, "*.parquet"))
 if not csv_files:
     raise FileNotFoundError(f"❌ No CSV files found in folder: {data_folder}")
 
@@ -14,29 +16,15 @@ if not csv_files:
 latest_csv = max(csv_files, key=os.path.getctime)
 print(f"📁 Loading CSV file: {latest_csv}")
 
-data = pd.read_csv(latest_csv)
+# Only the columns the summary needs; team/season aliases and the season-from-match_s_id
+# fallback are resolved once per source header by the schema registry
+data = read_source(latest_csv, "team_season")
 print(f"✅ Data loaded: {data.shape}")
 
-# Infer season from match_s_id if not present
-if 'season' not in data.columns:
-    if 'match_s_id' in data.columns:
-        # Extract first 4 characters as season (adjust if format differs)
-        data['season'] = data['match_s_id'].astype(str).str[:4]
-        print(f"⚠️ 'season' column not found — inferred from 'match_s_id'")
-    else:
-        raise KeyError("❌ Cannot infer season: 'season' and 'match_s_id' not found!")
-
-# Aggregate per team per season
-if 'team' not in data.columns:
-    raise KeyError("❌ 'team' column not found in dataset!")
-
-team_summary = data.groupby(['season', 'team']).agg({
-    'runs': 'sum',
-    'wickets': 'sum',
-    'match_s_id': 'nunique'  # number of matches
-}).reset_index().rename(columns={'match_s_id': 'matches'})
+# runs, wickets and number of matches (declared in generate_summaries.SUMMARY_SPECS)
+team_summary = run_summaries(data, names=['team_season_summary'])['team_season_summary']
 
 # Save summary
 output_file = os.path.join(data_folder, "team_season_summary.csv")
-team_summary.to_csv(output_file, index=False)
+output_file = write_table(team_summary, output_file)
 print(f"🎯 Team season summary saved successfully at: {output_file}")
@@ -0,0 +1,188 @@
+# scripts/validate_data.py
+"""
+Consistency checks for the cleaned deliveries and the match summary.
+Runs after clean_and_save and create_match_summary (and on every warehouse /
+live ingestion) unless they are called with validate=False. Every check is a grouped,
+vectorized pandas operation; matches are split into partitions that are
+checked in parallel, and the result is written as a JSON violations report.
+The deliveries can also come from a column store (column_store): each worker
+then maps the store and reads only its own matches' rows.
+"""
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from column_store import ColumnStore, is_column_store
+from storage import read_table, resolve_path
+
+ILLEGAL_EXTRAS = ['wides', 'noballs']
+MAX_LEGAL_BALLS_PER_OVER = 6
+MAX_WICKETS_PER_INNINGS = 10
+
+DELIVERY_COLS = ['match_id', 'date', 'innings', 'batting_team', 'over', 'ball',
+                 'runs_batter', 'runs_extras', 'runs_total', 'player_out', 'extra_type', 'team_runs']
+
+
+def _records(df: pd.DataFrame, check: str) -> list:
+    """Turn violating rows into report records (numpy scalars -> plain python)."""
+    df = df.copy()
+    df.insert(0, 'check', check)
+    return json.loads(df.to_json(orient='records', date_format='iso'))
+
+
+def check_partition(df: pd.DataFrame) -> tuple:
+    """
+    Run the per-delivery checks on one partition of whole matches.
+    Returns (violations, per-team totals) – the totals are compared with the
+    match summary once all partitions are back.
+    """
+    violations = []
+    legal = ~df['extra_type'].isin(ILLEGAL_EXTRAS)
+    out = df['player_out'].notna()
+
+    # 1) Legal balls per over <= 6 (wides and no-balls excluded)
+    per_over = legal.groupby([df['match_id'], df['innings'], df['over']]).sum().rename('legal_balls').reset_index()
+    bad = per_over[per_over['legal_balls'] > MAX_LEGAL_BALLS_PER_OVER]
+    violations += _records(bad, 'legal_balls_per_over')
+
+    # 2) team_runs never decreases within an innings
+    drop = df.groupby(['match_id', 'innings'])['team_runs'].diff()
+    bad = df.loc[drop < 0, ['match_id', 'innings', 'over', 'ball', 'team_runs']].assign(decrease=-drop[drop < 0])
+    violations += _records(bad, 'team_runs_monotonic')
+
+    # 3) runs_total == runs_batter + runs_extras
+    diff = df['runs_total'] - (df['runs_batter'] + df['runs_extras'])
+    bad = df.loc[diff != 0, ['match_id', 'innings', 'over', 'ball', 'runs_batter', 'runs_extras', 'runs_total']]
+    violations += _records(bad, 'runs_total_sum')
+
+    # 4) At most 10 wickets per innings
+    wk = out.groupby([df['match_id'], df['innings']]).sum().rename('wickets').reset_index()
+    bad = wk[wk['wickets'] > MAX_WICKETS_PER_INNINGS]
+    violations += _records(bad, 'wickets_per_innings')
+
+    # Per match + batting team totals for the summary comparison
+    totals = pd.DataFrame({
+        'match_id': df['match_id'], 'date': df['date'], 'team': df['batting_team'],
+        'runs': df['runs_total'], 'extras': df['runs_extras'],
+        'wickets': out.astype(int), 'balls': legal.astype(int),
+    }).groupby(['match_id', 'date', 'team'], as_index=False, dropna=False).sum()  # keep NaT-dated matches
+    return violations, totals
+
+
+def check_summary(summary: pd.DataFrame, totals: pd.DataFrame) -> list:
+    """5) Match summary totals equal the sum of their deliveries."""
+    # Older summaries have no match_id; match those on date + team instead
+    key = ['match_id'] if 'match_id' in summary.columns else ['date']
+    summary = summary.copy()
+    totals = totals.copy()
+    violations = []
+    if key == ['date']:
+        summary['date'] = pd.to_datetime(summary['date'], errors='coerce').dt.normalize()
+        totals['date'] = pd.to_datetime(totals['date'], errors='coerce').dt.normalize()
+        # A team playing twice on one date (double-headers) can't be paired without match_id:
+        # report those keys and leave them out rather than comparing the wrong matches
+        teams = pd.concat([summary[['date', side]].rename(columns={side: 'team'}) for side in ['team1', 'team2']])
+        ambiguous = pd.concat([teams[teams.duplicated(keep=False)],
+                               totals.loc[totals.duplicated(['date', 'team'], keep=False), ['date', 'team']]])
+        ambiguous = ambiguous.drop_duplicates().sort_values(['date', 'team'])
+        violations += _records(ambiguous, 'summary_ambiguous_date_team')
+        ambiguous = pd.MultiIndex.from_frame(ambiguous)
+        totals = totals[~pd.MultiIndex.from_frame(totals[['date', 'team']]).isin(ambiguous)]
+
+    for side in ['team1', 'team2']:
+        cols = {f'runs_{side}': 'runs', f'extras_{side}': 'extras',
+                f'wickets_{side}': 'wickets', f'balls_{side}': 'balls'}
+        s = summary[key + [side] + list(cols)].rename(columns={side: 'team', **cols})
+        if key == ['date']:
+            s = s[~pd.MultiIndex.from_frame(s[['date', 'team']]).isin(ambiguous)]
+        m = s.merge(totals, on=key + ['team'], how='left', suffixes=('_summary', '_deliveries'),
+                    indicator=True)
+        missing = m[m['_merge'] == 'left_only']
+        violations += _records(missing[key + ['team']], 'summary_team_without_deliveries')
+        m = m[m['_merge'] == 'both']
+        for measure in cols.values():
+            bad = m[m[f'{measure}_summary'] != m[f'{measure}_deliveries']]
+            violations += _records(
+                bad[key + ['team', f'{measure}_summary', f'{measure}_deliveries']], f'summary_{measure}_total')
+    return violations
+
+
+def check_store_partition(task: tuple) -> tuple:
+    """check_partition on a (store_dir, row slice) of a column store, mapped in the worker."""
+    store_dir, rows = task
+    store = ColumnStore(store_dir)
+    return check_partition(store.frame(rows, [c for c in DELIVERY_COLS if c in store.columns]))
+
+
+def report_path_for(output_path: str) -> str:
+    """Default report location next to a pipeline output: <output>_validation.json."""
+    return os.path.splitext(output_path)[0] + '_validation.json'
+
+
+def partition_matches(df: pd.DataFrame, n_parts: int) -> list:
+    """Split deliveries into n_parts frames, never splitting a match."""
+    match_ids = df['match_id'].unique()
+    part_of = pd.Series(np.arange(len(match_ids)) % max(n_parts, 1), index=match_ids)
+    labels = df['match_id'].map(part_of).to_numpy()
+    return [df[labels == p] for p in range(max(n_parts, 1)) if (labels == p).any()]
+
+
+def validate(cleaned_csv: str, summary_csv: str, report_path: str, workers: int = None) -> dict:
+    """
+    Validate cleaned deliveries (and the match summary if given) and write a JSON report.
+    `cleaned_csv` may also be a column store directory (see column_store).
+    """
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    if is_column_store(cleaned_csv):
+        store = ColumnStore(cleaned_csv)
+        print("✅ Column store:", store.n_rows, "rows,", len(store.match_ids), "matches")
+        parts = [(cleaned_csv, rows) for rows in store.partition_rows(workers)]
+        check, n_rows, n_matches = check_store_partition, store.n_rows, len(store.match_ids)
+    else:
+        print("📥 Loading cleaned data...")
+        df = read_table(cleaned_csv, usecols=lambda c: c in DELIVERY_COLS, parse_dates=['date'], low_memory=False)
+        print("✅ Loaded:", df.shape, "rows x columns")
+        parts = partition_matches(df, workers)
+        check, n_rows, n_matches = check_partition, len(df), int(df['match_id'].nunique())
+
+    if workers > 1 and len(parts) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(check, parts))
+    else:
+        results = [check(p) for p in parts]
+
+    violations = [v for part_violations, _ in results for v in part_violations]
+    if summary_csv and os.path.exists(resolve_path(summary_csv)):
+        totals = pd.concat([t for _, t in results], ignore_index=True)
+        violations += check_summary(read_table(summary_csv), totals)
+
+    counts = pd.Series([v['check'] for v in violations], dtype=object).value_counts().to_dict()
+    report = {
+        'generated_at': pd.Timestamp.now().isoformat(),
+        'cleaned_csv': cleaned_csv,
+        'summary_csv': summary_csv,
+        'n_rows': n_rows,
+        'n_matches': n_matches,
+        'seconds': round(time.perf_counter() - start, 3),
+        'ok': not violations,
+        'violation_counts': {k: int(v) for k, v in counts.items()},
+        'violations': violations,
+    }
+    os.makedirs(os.path.dirname(report_path) or '.', exist_ok=True)
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    status = "✅ No violations" if report['ok'] else f"⚠️ {len(violations)} violations {report['violation_counts']}"
+    print(f"{status} – report saved at: {report_path} ({report['seconds']}s)")
+    return report
+
+
+if __name__ == "__main__":
+    cleaned_csv = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/cleaned_matches.csv"
+    summary_csv = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/match_summary_final.csv"
+    report_file = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/validation_report.json"
+    validate(cleaned_csv, summary_csv, report_file)
@@ -0,0 +1,101 @@
+# scripts/venue_conditions.py
+"""
+Venue conditions table built from the match summary (create_match_summary):
+toss-decision win rates, batting first vs chasing success, par first-innings
+scores with percentile bands, and the season-on-season trend.
+One row per (venue, season) plus an 'All' season row per venue, written next to
+the other summary CSVs so the dashboard reads it with a single lookup.
+"""
+import os
+import pandas as pd
+from storage import read_table, write_table
+
+ALL_SEASONS = "All"
+PAR_BANDS = {'first_innings_p25': 0.25, 'first_innings_p75': 0.75}
+
+
+def _conditions(ms: pd.DataFrame, keys: list) -> pd.DataFrame:
+    g = ms.groupby(keys)
+    out = g.agg(
+        matches=('team1', 'size'),
+        results=('decided', 'sum'),
+        bat_first_wins=('bat_first_win', 'sum'),
+        chase_wins=('chase_win', 'sum'),
+        toss_winner_wins=('toss_win', 'sum'),
+        toss_bat=('toss_bat', 'sum'),
+        toss_bat_wins=('toss_bat_win', 'sum'),
+        toss_field=('toss_field', 'sum'),
+        toss_field_wins=('toss_field_win', 'sum'),
+        avg_first_innings=('runs_team1', 'mean'),
+        par_first_innings=('runs_team1', 'median'),
+    )
+    bands = g['runs_team1'].quantile(list(PAR_BANDS.values())).unstack()
+    bands.columns = list(PAR_BANDS)
+    out = out.join(bands)
+
+    results = out['results'].where(out['results'] > 0)
+    out['bat_first_win_pct'] = (out['bat_first_wins'] / results * 100).round(1)
+    out['chase_win_pct'] = (out['chase_wins'] / results * 100).round(1)
+    out['toss_winner_win_pct'] = (out['toss_winner_wins'] / results * 100).round(1)
+    out['toss_bat_win_pct'] = (out['toss_bat_wins'] / out['toss_bat'].where(out['toss_bat'] > 0) * 100).round(1)
+    out['toss_field_win_pct'] = (out['toss_field_wins'] / out['toss_field'].where(out['toss_field'] > 0) * 100).round(1)
+    out['avg_first_innings'] = out['avg_first_innings'].round(1)
+    return out.reset_index()
+
+
+def build_venue_conditions(match_summary: pd.DataFrame) -> pd.DataFrame:
+    """Per venue and season conditions (plus all-season rows), computed with grouped aggregations."""
+    ms = match_summary.copy()
+    ms['season'] = ms['season'].astype(str)
+    for c in ['toss_winner', 'toss_decision']:
+        if c not in ms.columns:
+            ms[c] = 'Unknown'
+
+    # team1 batted first (create_match_summary orders teams by innings)
+    ms['bat_first_win'] = (ms['match_won_by'] == ms['team1']).astype(int)
+    ms['chase_win'] = (ms['match_won_by'] == ms['team2']).astype(int)
+    ms['decided'] = ms['bat_first_win'] + ms['chase_win']
+    ms['toss_win'] = ((ms['toss_winner'] == ms['match_won_by']) & (ms['decided'] == 1)).astype(int)
+    ms['toss_bat'] = (ms['toss_decision'] == 'bat').astype(int) * ms['decided']
+    ms['toss_field'] = (ms['toss_decision'] == 'field').astype(int) * ms['decided']
+    ms['toss_bat_win'] = ms['toss_bat'] * ms['toss_win']
+    ms['toss_field_win'] = ms['toss_field'] * ms['toss_win']
+
+    per_season = _conditions(ms, ['venue', 'season'])
+    # Trend: change in average first-innings score since the venue's previous season
+    order = ms.groupby('season')['season_start_year'].first() if 'season_start_year' in ms.columns else None
+    per_season['season_order'] = per_season['season'].map(order) if order is not None else per_season['season']
+    per_season = per_season.sort_values(['venue', 'season_order'])
+    per_season['first_innings_trend'] = per_season.groupby('venue')['avg_first_innings'].diff().round(1)
+    per_season = per_season.drop(columns='season_order')
+
+    overall = _conditions(ms, ['venue']).assign(season=ALL_SEASONS)
+    # Overall trend: average per-season change across the venue's seasons
+    overall['first_innings_trend'] = overall['venue'].map(
+        per_season.groupby('venue')['first_innings_trend'].mean().round(1))
+
+    return pd.concat([per_season, overall[per_season.columns]], ignore_index=True)
+
+
+def create_venue_conditions(match_csv: str, output_csv: str) -> pd.DataFrame:
+    print("📥 Loading match summary...")
+    ms = read_table(match_csv, dtype={'season': str})
+    print("✅ Loaded:", ms.shape, "rows x columns")
+
+    conditions = build_venue_conditions(ms)
+
+    os.makedirs(os.path.dirname(output_csv), exist_ok=True)
+    saved = write_table(conditions, output_csv)
+    print(f"💾 Venue conditions saved at: {saved} ({conditions['venue'].nunique()} venues)")
+    return conditions
+
+
+def load_venue_conditions(path: str) -> pd.DataFrame:
+    """Conditions table indexed by (venue, season) for single lookups."""
+    return read_table(path, dtype={'season': str}).set_index(['venue', 'season']).sort_index()
+
+
+if __name__ == "__main__":
+    match_csv = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/match_summary_final.csv"
+    output_csv = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/venue_conditions.csv"
+    create_venue_conditions(match_csv, output_csv)
@@ -2,17 +2,19 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+from storage import read_table, resolve_path
 
 # ------------------------
 # 1️⃣ Load Data
 # ------------------------
-data_file = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/combined_player_match_s_format.csv"
+# Parquet or CSV, whichever the pipeline wrote last
+data_file = resolve_path("C:/Users/Dharun Kumar/PycharmProjects/cricket/data/combined_player_match_s_format.csv")
 
 try:
-    df = pd.read_csv(data_file, parse_dates=['date'], low_memory=False)
+    df = read_table(data_file, parse_dates=['date'], low_memory=False)
     print(f"✅ Data loaded: {df.shape}")
 except FileNotFoundError:
-    raise FileNotFoundError(f"❌ CSV not found at: {data_file}")
+    raise FileNotFoundError(f"❌ Data file not found at: {data_file}")
 
 # ------------------------
 # 2️⃣ Check for Required Columns
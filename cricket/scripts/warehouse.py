@@ -0,0 +1,308 @@
+# scripts/warehouse.py
+"""
+Partitioned warehouse for deliveries from several leagues and formats.
+
+Layout (one directory per table, Hive-style partition directories):
+    data/warehouse/deliveries/league=<event_name>/format=<match_type>/season=<season>/part.parquet
+    data/warehouse/deliveries/_manifest.json      rows / matches / input fingerprint per partition
+
+- ingest() splits a raw feed by (league, format, season) and cleans + dedupes +
+  writes every partition in its own worker process. A feed's rows are merged into
+  the partition's existing rows (an incremental feed with today's matches keeps the
+  rest of the season), with the duplicate report next to the part file. Partitions
+  whose input did not change are skipped, and partitions missing from the feed are
+  left alone, so loading a new league's feed only writes that league's directories. Each written
+  partition is checked by validate_data (part_validation.json next to it).
+- read_partitions() only opens the partitions matching the filters (directory
+  names are matched before any file is read) and only the requested columns.
+  storage.read_table hands directory paths to it, so every pipeline reader can
+  take a warehouse table or any league / format sub-directory as its input.
+- league_summary() / player_totals() aggregate each selected partition on its
+  own and combine the partials, so cost grows with the partitions asked for, not
+  with the size of the warehouse.
+"""
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from clean_and_save import NA_PLACEHOLDERS, clean_deliveries, dedupe_deliveries, reorder_columns
+from fantasy_points import ILLEGAL_BALLS, NON_BOWLER_WICKETS
+from storage import NA_STRINGS, read_header, read_table, resolve_path, write_table
+from validate_data import report_path_for, validate as validate_deliveries
+
+WAREHOUSE_DIR = "data/warehouse"
+DELIVERIES = "deliveries"
+MANIFEST = "_manifest.json"
+PART_FILE = "part.csv"  # extension follows the storage format
+# Partition level -> raw feed column
+PARTITIONS = {'league': 'event_name', 'format': 'match_type', 'season': 'season'}
+UNKNOWN = "unknown"
+
+
+def partition_value(value) -> str:
+    """Directory-safe partition value: 'Indian Premier League' -> 'indian-premier-league', '2007/08' -> '2007-08'."""
+    if pd.isna(value) or str(value).strip() in NA_PLACEHOLDERS:
+        return UNKNOWN
+    return re.sub(r"[^a-z0-9]+", "-", str(value).strip().lower()).strip("-") or UNKNOWN
+
+
+def partition_dir(key: tuple) -> str:
+    return os.path.join(*(f"{level}={value}" for level, value in zip(PARTITIONS, key)))
+
+
+def parse_partition(path: str) -> dict:
+    """{'league': ..., 'format': ..., 'season': ...} from the level=value directories in `path`."""
+    parts = dict(p.split("=", 1) for p in os.path.normpath(path).split(os.sep) if "=" in p)
+    return {level: parts[level] for level in PARTITIONS if level in parts}
+
+
+def partition_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """Partition values per row (levels whose column is missing from the feed are 'unknown')."""
+    return pd.DataFrame({
+        level: df[col].map(partition_value) if col in df.columns else UNKNOWN
+        for level, col in PARTITIONS.items()
+    }, index=df.index)
+
+
+# ------------------------
+# Manifest
+# ------------------------
+def read_manifest(table_dir: str) -> dict:
+    try:
+        with open(os.path.join(table_dir, MANIFEST), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_manifest(table_dir: str, manifest: dict):
+    tmp = os.path.join(table_dir, MANIFEST + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, os.path.join(table_dir, MANIFEST))
+
+
+# ------------------------
+# Ingest (one worker per partition)
+# ------------------------
+def _null_text(df: pd.DataFrame) -> pd.DataFrame:
+    """Missing text as NaN ('nan' left by clean_deliveries), the way a written partition reads back."""
+    for c in df.columns[df.dtypes == object]:
+        df[c] = df[c].where(~df[c].isin(NA_STRINGS))
+    return df
+
+
+def _ingest_partition(job: tuple) -> dict:
+    """
+    Clean the feed's rows of one partition, merge them into the partition's existing rows,
+    dedupe, write and (optionally) validate; returns its manifest entry.
+    Existing rows come first, so a feed row that disagrees with a stored delivery is
+    dropped and listed as a conflict in the partition's duplicate report.
+    """
+    rel_dir, frame, out_path, fingerprint, validate = job
+    new = reorder_columns(_null_text(clean_deliveries(frame)))
+    existing_path = resolve_path(out_path)
+    existing = None
+    if os.path.exists(existing_path):
+        dates = ['date'] if 'date' in read_header(existing_path) else None
+        existing = read_table(existing_path, parse_dates=dates, low_memory=False)
+    merged = pd.concat([existing, new], ignore_index=True) if existing is not None else new
+    df, report = dedupe_deliveries(merged)
+    df = reorder_columns(df)
+    saved = write_table(df, out_path)
+    report.to_csv(os.path.splitext(out_path)[0] + '_duplicates.csv', index=False)
+    entry = {'dir': rel_dir, 'file': os.path.basename(saved), 'rows': len(df),
+             'matches': int(df['match_id'].nunique()) if 'match_id' in df.columns else None,
+             'input_fingerprint': fingerprint, 'duplicates_dropped': len(merged) - len(df),
+             'conflicts': int((report['kind'] == 'conflict').sum())}
+    if validate:
+        report = validate_deliveries(saved, None, report_path_for(out_path), workers=1)
+        entry['violations'] = len(report['violations'])
+    return entry
+
+
+def ingest(raw_path: str, warehouse_dir: str = WAREHOUSE_DIR, workers: int = None, force: bool = False,
+           validate: bool = True) -> dict:
+    """
+    Load a raw deliveries feed (any mix of leagues / formats / seasons) into the warehouse.
+    Only partitions present in the feed are (re)written, and only when their rows changed.
+    With `validate`, every written partition gets a validate_data report.
+    Returns {partition dir: manifest entry} for the partitions written.
+    """
+    print("📥 Loading raw feed...")
+    raw = read_table(raw_path, low_memory=False)
+    print("✅ Loaded:", raw.shape, "rows x columns")
+
+    table_dir = os.path.join(warehouse_dir, DELIVERIES)
+    manifest = read_manifest(table_dir)
+    keys = partition_keys(raw)
+    jobs = []
+    for key, rows in raw.groupby([keys[level] for level in PARTITIONS], sort=True).groups.items():
+        frame = raw.loc[rows].reset_index(drop=True)
+        rel_dir = partition_dir(key)
+        fingerprint = format(int(pd.util.hash_pandas_object(frame, index=False).sum()) & (2 ** 64 - 1), "016x")
+        entry = manifest.get(rel_dir)
+        out_path = os.path.join(table_dir, rel_dir, PART_FILE)
+        if not force and entry and entry.get('input_fingerprint') == fingerprint and \
+                os.path.exists(os.path.join(table_dir, rel_dir, entry['file'])):
+            continue
+        jobs.append((rel_dir, frame, out_path, fingerprint, validate))
+    print(f"🧭 {keys.drop_duplicates().shape[0]} partitions in feed, {len(jobs)} to write")
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            written = list(pool.map(_ingest_partition, jobs))
+    else:
+        written = [_ingest_partition(job) for job in jobs]
+
+    if written:
+        os.makedirs(table_dir, exist_ok=True)
+        manifest.update({entry['dir']: entry for entry in written})
+        _write_manifest(table_dir, manifest)
+    for entry in written:
+        print(f"💾 {entry['dir']}: {entry['rows']} deliveries, {entry['matches']} matches "
+              f"({entry['duplicates_dropped']} duplicates dropped, {entry['conflicts']} conflicting"
+              + (f", {entry['violations']} validation violations)" if 'violations' in entry else ")"))
+    return {entry['dir']: entry for entry in written}
+
+
+# ------------------------
+# Readers (partition + column pruning)
+# ------------------------
+def _as_filter(values) -> set:
+    if values is None:
+        return None
+    values = [values] if isinstance(values, str) or np.isscalar(values) else values
+    return {partition_value(v) for v in values}
+
+
+def list_partitions(path: str, leagues=None, formats=None, seasons=None) -> list:
+    """
+    Part files under `path` (a table directory or any partition sub-directory) that match the filters.
+    Filters take raw values or partition values ('Indian Premier League' or 'indian-premier-league').
+    Directories that fail a filter are not descended into.
+    """
+    wanted = {'league': _as_filter(leagues), 'format': _as_filter(formats), 'season': _as_filter(seasons)}
+
+    def keep(d: str) -> bool:
+        level, _, value = d.partition("=")
+        return wanted.get(level) is None or value in wanted[level]
+
+    found = []
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if keep(d))
+        part = resolve_path(os.path.join(root, PART_FILE))
+        if os.path.exists(part):
+            found.append(part)
+    return found
+
+
+def read_partitions(path: str, leagues=None, formats=None, seasons=None, usecols=None, dtype=None,
+                    parse_dates=None, nrows: int = None, with_keys: bool = False, **csv_kwargs) -> pd.DataFrame:
+    """
+    Rows of the matching partitions under `path`, read with read_table's column options.
+    - with_keys: add league / format / season columns from the partition directories
+    - nrows: stop opening partitions once this many rows are read
+    """
+    frames, total = [], 0
+    for part in list_partitions(path, leagues, formats, seasons):
+        df = read_table(part, usecols=usecols, dtype=dtype, parse_dates=parse_dates, nrows=nrows, **csv_kwargs)
+        if with_keys:
+            df = df.assign(**parse_partition(os.path.dirname(part)))
+        frames.append(df)
+        total += len(df)
+        if nrows is not None and total >= nrows:
+            break
+    if not frames:
+        raise FileNotFoundError(f"❌ No warehouse partitions under {path} match the filters.")
+    out = pd.concat(frames, ignore_index=True)
+    return out.head(nrows) if nrows is not None else out
+
+
+def partition_header(path: str) -> list:
+    parts = list_partitions(path)
+    if not parts:
+        raise FileNotFoundError(f"❌ No warehouse partitions under {path}.")
+    return read_header(parts[0])
+
+
+# ------------------------
+# Cross-league aggregates (map per partition, reduce the partials)
+# ------------------------
+SUMMARY_COLS = ['match_id', 'runs_batter', 'runs_total', 'extra_type', 'player_out']
+PLAYER_COLS = ['match_id', 'batter', 'bowler', 'runs_batter', 'runs_total', 'extra_type', 'player_out', 'wicket_kind']
+LEVELS = list(PARTITIONS)
+
+
+def _summary_partial(part: str) -> pd.DataFrame:
+    df = read_table(part, usecols=SUMMARY_COLS)
+    legal = ~df['extra_type'].isin(ILLEGAL_BALLS)
+    row = dict(parse_partition(os.path.dirname(part)),
+               matches=df['match_id'].nunique(), balls=int(legal.sum()), runs=int(df['runs_total'].sum()),
+               wickets=int(df['player_out'].notna().sum()),
+               boundaries=int(df['runs_batter'].isin([4, 6]).sum()))
+    return pd.DataFrame([row])
+
+
+def _player_partial(part: str) -> pd.DataFrame:
+    df = read_table(part, usecols=PLAYER_COLS)
+    key = parse_partition(os.path.dirname(part))
+    bat = df.assign(ball=(df['extra_type'] != 'wides').astype(int)).groupby('batter').agg(
+        runs=('runs_batter', 'sum'), balls=('ball', 'sum'), innings=('match_id', 'nunique'))
+    wicket = df['player_out'].notna() & ~df['wicket_kind'].isin(NON_BOWLER_WICKETS)
+    bowl = df.assign(wicket=wicket.astype(int), legal=(~df['extra_type'].isin(ILLEGAL_BALLS)).astype(int)
+                     ).groupby('bowler').agg(wickets=('wicket', 'sum'), balls_bowled=('legal', 'sum'),
+                                             runs_conceded=('runs_total', 'sum'))
+    out = bat.join(bowl, how='outer').fillna(0).rename_axis('player').reset_index()
+    return out.assign(**key)
+
+
+def _map_partitions(fn, parts: list, workers: int) -> list:
+    if workers and workers > 1 and len(parts) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(parts))) as pool:
+            return list(pool.map(fn, parts))
+    return [fn(p) for p in parts]
+
+
+def league_summary(warehouse_dir: str = WAREHOUSE_DIR, leagues=None, formats=None, seasons=None,
+                   by: list = None, workers: int = 1) -> pd.DataFrame:
+    """Matches, runs, wickets, run rate and boundaries per (league, format, season) or any subset of `by`."""
+    by = by or LEVELS
+    parts = list_partitions(os.path.join(warehouse_dir, DELIVERIES), leagues, formats, seasons)
+    if not parts:
+        return pd.DataFrame(columns=by + ['matches', 'balls', 'runs', 'wickets', 'boundaries', 'run_rate'])
+    out = pd.concat(_map_partitions(_summary_partial, parts, workers), ignore_index=True)
+    out = out.groupby(by)[['matches', 'balls', 'runs', 'wickets', 'boundaries']].sum().reset_index()
+    out['run_rate'] = (out['runs'] / (out['balls'] / 6)).round(2)
+    out['runs_per_match'] = (out['runs'] / out['matches']).round(1)
+    return out
+
+
+def player_totals(warehouse_dir: str = WAREHOUSE_DIR, leagues=None, formats=None, seasons=None,
+                  by: list = None, workers: int = 1) -> pd.DataFrame:
+    """
+    Batting and bowling totals per player across the selected partitions.
+    `by` adds partition levels to the grouping (e.g. ['league'] for a per-league split).
+    """
+    by = by or []
+    parts = list_partitions(os.path.join(warehouse_dir, DELIVERIES), leagues, formats, seasons)
+    cols = ['runs', 'balls', 'innings', 'wickets', 'balls_bowled', 'runs_conceded']
+    if not parts:
+        return pd.DataFrame(columns=['player'] + by + cols + ['strike_rate', 'economy'])
+    out = pd.concat(_map_partitions(_player_partial, parts, workers), ignore_index=True)
+    out = out.groupby(['player'] + by)[cols].sum().astype(int).reset_index()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out['strike_rate'] = (out['runs'] / out['balls'] * 100).round(2)
+        out['economy'] = (out['runs_conceded'] / (out['balls_bowled'] / 6)).round(2)
+    out[['strike_rate', 'economy']] = out[['strike_rate', 'economy']].replace([np.inf, -np.inf], np.nan)
+    return out.sort_values('runs', ascending=False).reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    raw_csv = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/matches.csv"
+    warehouse_dir = "C:/Users/Dharun Kumar/PycharmProjects/cricket/data/warehouse"
+    ingest(raw_csv, warehouse_dir)
+    print(league_summary(warehouse_dir).to_string(index=False))